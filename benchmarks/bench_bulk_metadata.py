@@ -0,0 +1,72 @@
+"""Measure time for retrieving many manifests one by one versus in bulk.
+
+Starts a local stand-in for dserver that answers every manifest request after
+an artificial latency, then requests the manifests of many datasets once
+sequentially and once with get_manifests_by_uris for several concurrency limits.
+
+Usage::
+
+    python benchmarks/bench_bulk_metadata.py [--uris N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiohttp import web
+
+from dtool_lookup_api.core.LookupClient import UnauthenticatedLookupClient
+
+CONCURRENCIES = [8, 32, 100]
+
+
+async def start_server(latency):
+    async def get_manifest(request):
+        await asyncio.sleep(latency)
+        return web.json_response({"hash_function": "md5sum_hexdigest", "items": {}})
+
+    app = web.Application()
+    app.add_routes([web.get('/manifests/{uri:.+}', get_manifest)])
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def sequential(url, uris):
+    async with UnauthenticatedLookupClient(url, verify_ssl=False) as lookup_client:
+        start = time.perf_counter()
+        for uri in uris:
+            await lookup_client.get_manifest(uri)
+        return time.perf_counter() - start
+
+
+async def bulk(url, uris, concurrency):
+    async with UnauthenticatedLookupClient(url, verify_ssl=False) as lookup_client:
+        start = time.perf_counter()
+        manifests = await lookup_client.get_manifests_by_uris(uris, concurrency=concurrency)
+        assert len(manifests) == len(uris)
+        return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--uris', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    uris = [f"s3://bucket/{i:08d}" for i in range(args.uris)]
+    runner, url = await start_server(args.latency)
+    print(f"{'mode':>20} {'seconds':>10}")
+    seconds = await sequential(url, uris)
+    print(f"{'sequential':>20} {seconds:>10.2f}")
+    for concurrency in CONCURRENCIES:
+        seconds = await bulk(url, uris, concurrency)
+        print(f"{f'bulk ({concurrency})':>20} {seconds:>10.2f}")
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+"""Measure request throughput as a function of connection pool size.
+
+Starts a local stand-in for dserver that answers every request after an
+artificial latency, then fires many concurrent dataset requests through
+one UnauthenticatedLookupClient per pool size.
+
+Usage::
+
+    python benchmarks/bench_connection_pool.py [--requests N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiohttp import web
+
+from dtool_lookup_api.core.LookupClient import UnauthenticatedLookupClient
+
+POOL_SIZES = [1, 2, 4, 8, 16, 32, 64, 128]
+
+
+async def start_server(latency):
+    async def get_dataset(request):
+        await asyncio.sleep(latency)
+        return web.json_response({"uri": request.match_info['uri']})
+
+    app = web.Application()
+    app.add_routes([web.get('/uris/{uri:.+}', get_dataset)])
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def throughput(url, requests, **kwargs):
+    """Return requests per second."""
+    async with UnauthenticatedLookupClient(url, verify_ssl=False, **kwargs) as lookup_client:
+        await lookup_client.get_dataset('s3://warm-up/0')
+        start = time.perf_counter()
+        await asyncio.gather(*[lookup_client.get_dataset(f's3://bucket/{i}') for i in range(requests)])
+        return requests/(time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    runner, url = await start_server(args.latency)
+    print(f"{'pool size':>10} {'force_close':>12} {'requests/s':>12}")
+    for force_close in (False, True):
+        for pool_size in POOL_SIZES:
+            rate = await throughput(url, args.requests, connection_limit=pool_size, force_close=force_close)
+            print(f"{pool_size:>10} {str(force_close):>12} {rate:>12.0f}")
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
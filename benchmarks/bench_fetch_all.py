@@ -0,0 +1,68 @@
+"""Measure time for retrieving a full listing page by page versus with fetch_all.
+
+Starts the stand-in server of bench_iterators.py that answers every page
+request after an artificial latency, then retrieves the whole catalogue
+once with sequential page requests and once with get_datasets(fetch_all=True)
+for several concurrency limits.
+
+Usage::
+
+    python benchmarks/bench_fetch_all.py [--records N] [--page-size N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import time
+
+import dtool_lookup_api.core.LookupClient
+from dtool_lookup_api.core.LookupClient import UnauthenticatedLookupClient
+
+from bench_iterators import start_server
+
+CONCURRENCIES = [1, 4, 8, 16, 32]
+
+
+async def sequential(url, page_size):
+    """Return seconds and number of records for requesting one page after another."""
+    async with UnauthenticatedLookupClient(url, verify_ssl=False) as lookup_client:
+        start = time.perf_counter()
+        records = []
+        page_number = 1
+        while True:
+            pagination = {}
+            records.extend(await lookup_client.get_datasets(
+                page_number=page_number, page_size=page_size, pagination=pagination))
+            if page_number >= pagination['total_pages']:
+                break
+            page_number += 1
+        return time.perf_counter() - start, len(records)
+
+
+async def fetch_all(url, page_size, concurrency):
+    """Return seconds and number of records for fetch_all mode."""
+    dtool_lookup_api.core.LookupClient.FETCH_ALL_CONCURRENCY = concurrency
+    async with UnauthenticatedLookupClient(url, verify_ssl=False) as lookup_client:
+        start = time.perf_counter()
+        records = await lookup_client.get_datasets(page_size=page_size, fetch_all=True)
+        return time.perf_counter() - start, len(records)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02)
+    args = parser.parse_args()
+
+    runner, url = await start_server(args.records, args.latency)
+    print(f"{'mode':>20} {'records':>10} {'seconds':>10}")
+    seconds, n = await sequential(url, args.page_size)
+    print(f"{'sequential':>20} {n:>10} {seconds:>10.2f}")
+    for concurrency in CONCURRENCIES:
+        seconds, n = await fetch_all(url, args.page_size, concurrency)
+        print(f"{f'fetch_all ({concurrency})':>20} {n:>10} {seconds:>10.2f}")
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
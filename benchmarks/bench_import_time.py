@@ -0,0 +1,46 @@
+"""Measure wall time of importing dtool_lookup_api in fresh interpreters.
+
+Reports the median over several runs for the bare package import, which
+defers loading the synchronous API, and for the import of the synchronous
+API itself, which loads the network stack. Compare against a baseline
+with ``python -X importtime -c "import dtool_lookup_api"`` for details.
+
+Usage::
+
+    python benchmarks/bench_import_time.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    'pass',
+    'import dtool_lookup_api',
+    'import dtool_lookup_api.synchronous',
+    'from dtool_lookup_api import get_datasets',
+]
+
+
+def timed(statement):
+    start = time.perf_counter()
+    subprocess.check_call([sys.executable, '-c', statement])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'statement':<45} {'median ms':>10}")
+    for statement in STATEMENTS:
+        timed(statement)  # warm up file system caches
+        median = statistics.median(timed(statement) for _ in range(args.runs))
+        print(f"{statement:<45} {median*1e3:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Measure full-listing scan time as a function of iterator prefetch depth.
+
+Starts a local stand-in for dserver that answers every page request after an
+artificial latency, then scans the whole catalogue with iter_datasets while
+spending a fixed processing time on every page.
+
+Usage::
+
+    python benchmarks/bench_iterators.py [--records N] [--page-size N] [--latency SECONDS] [--processing SECONDS]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from aiohttp import web
+
+from dtool_lookup_api.core.LookupClient import UnauthenticatedLookupClient
+
+PREFETCH_DEPTHS = [0, 1, 2, 4]
+
+
+async def start_server(records, latency):
+    catalogue = [{"uri": f"s3://bucket/{i:08d}"} for i in range(records)]
+
+    async def post_uris(request):
+        await asyncio.sleep(latency)
+        page = int(request.query['page'])
+        page_size = int(request.query['page_size'])
+        total_pages = max((records + page_size - 1) // page_size, 1)
+        headers = {"X-Pagination": json.dumps({"total": records, "total_pages": total_pages, "page": page}),
+                   "X-Sort": json.dumps({"sort": {"uri": 1}})}
+        return web.json_response(catalogue[(page - 1)*page_size:page*page_size], headers=headers)
+
+    app = web.Application()
+    app.add_routes([web.post('/uris', post_uris)])
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def scan(url, page_size, processing, prefetch):
+    """Return seconds needed for scanning all records."""
+    async with UnauthenticatedLookupClient(url, verify_ssl=False) as lookup_client:
+        start = time.perf_counter()
+        n = 0
+        async for _ in lookup_client.iter_datasets(page_size=page_size, prefetch=prefetch):
+            n += 1
+            if n % page_size == 0:
+                await asyncio.sleep(processing)
+        return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--processing', type=float, default=0.02)
+    args = parser.parse_args()
+
+    runner, url = await start_server(args.records, args.latency)
+    print(f"{'prefetch':>10} {'seconds':>10}")
+    for prefetch in PREFETCH_DEPTHS:
+        seconds = await scan(url, args.page_size, args.processing, prefetch)
+        print(f"{prefetch:>10} {seconds:>10.2f}")
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""Compare per-call overhead of synchronous bridges to asyncio.
+
+Runs a trivial coroutine many times through
+
+1. ``asgiref.sync.async_to_sync``, the former synchronous bridge, which sets
+   up a fresh event loop per call, and
+2. ``dtool_lookup_api.core.EventLoopThread``, which submits to one persistent
+   event loop running in a daemon thread,
+
+from one and from several caller threads.
+
+Usage::
+
+    python benchmarks/bench_synchronous_bridge.py [--calls N] [--threads T]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import time
+
+from dtool_lookup_api.core.EventLoopThread import EventLoopThread
+
+
+async def noop():
+    await asyncio.sleep(0)
+
+
+def timed(call, calls, threads):
+    """Return mean wall time per call in microseconds."""
+    start = time.perf_counter()
+    if threads == 1:
+        for _ in range(calls):
+            call()
+    else:
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            for f in [executor.submit(call) for _ in range(calls)]:
+                f.result()
+    return (time.perf_counter() - start)/calls*1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    bridges = {}
+
+    try:
+        from asgiref.sync import async_to_sync
+    except ImportError:
+        print("asgiref not installed, skipping async_to_sync.")
+    else:
+        bridges['async_to_sync'] = async_to_sync(noop)
+
+    event_loop_thread = EventLoopThread()
+    bridges['EventLoopThread'] = lambda: event_loop_thread.run(noop())
+
+    print(f"{'bridge':<20} {'threads':>8} {'us/call':>10}")
+    for name, call in bridges.items():
+        call()  # warm up
+        for threads in sorted({1, args.threads}):
+            print(f"{name:<20} {threads:>8} {timed(call, args.calls, threads):>10.1f}")
+
+    event_loop_thread.stop()
+
+
+if __name__ == '__main__':
+    main()
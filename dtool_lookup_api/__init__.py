@@ -26,51 +26,90 @@
 
 from .version import version as __version__
 
-# use synchronous API as default
-from .synchronous import (
+# use synchronous API as default, imported lazily at first attribute access
+# (PEP 562) to keep `import dtool_lookup_api` cheap
+_SYNCHRONOUS_API = [
     # config
-    get_config,
-    get_versions,
+    'get_config',
+    'get_versions',
     # uris
-    get_datasets,
-    get_dataset,
-    register_dataset,
-    delete_dataset,
+    'get_datasets',
+    'get_dataset',
+    'get_dataset_bundle',
+    'register_dataset',
+    'register_datasets',
+    'delete_dataset',
+    'delete_datasets',
     # uuids
-    get_datasets_by_uuid,
+    'get_datasets_by_uuid',
+    'get_datasets_by_uuids',
     # metadata retrieval
-    get_manifest,
-    get_readme,
-    get_annotations,
-    get_tags,
+    'get_manifest',
+    'get_readme',
+    'get_annotations',
+    'get_tags',
+    'get_manifests_by_uris',
+    'get_readmes_by_uris',
+    'get_annotations_by_uris',
+    'get_tags_by_uris',
+    'iter_manifests_by_uris',
+    'iter_readmes_by_uris',
+    'iter_annotations_by_uris',
+    'iter_tags_by_uris',
     # users
-    get_users,
-    get_user,
-    register_user,
-    delete_user,
-    get_summary,
+    'get_users',
+    'get_user',
+    'register_user',
+    'delete_user',
+    'delete_users',
+    'get_summary',
     # base-uris
-    get_base_uris,
-    get_base_uri,
-    register_base_uri,
-    delete_base_uri,
+    'get_base_uris',
+    'get_base_uri',
+    'register_base_uri',
+    'delete_base_uri',
+    'delete_base_uris',
     # server-side plugin-dependent functionality
-    get_datasets_by_mongo_aggregation,
-    get_datasets_by_mongo_query,
-    get_graph_by_uuid,
+    'get_datasets_by_mongo_aggregation',
+    'get_datasets_by_mongo_query',
+    'get_graph_by_uuid',
+    # iteration over all pages
+    'iter_datasets',
+    'iter_datasets_sharded',
+    'iter_datasets_by_uuid',
+    'iter_users',
+    'iter_base_uris',
+    'iter_datasets_by_mongo_aggregation',
+    'iter_datasets_by_mongo_query',
+    'iter_graph_by_uuid',
     # deprecated
-    all,
-    search,
-    config,
-    versions,
-    list_base_uris,
-    list_users,
-    lookup,
-    manifest,
-    readme,
-    summary,
-    user_info,
-    aggregate,
-    query,
-    graph
-)
+    'all',
+    'search',
+    'config',
+    'versions',
+    'list_base_uris',
+    'list_users',
+    'lookup',
+    'manifest',
+    'readme',
+    'summary',
+    'user_info',
+    'aggregate',
+    'query',
+    'graph',
+]
+
+__all__ = ['__version__'] + _SYNCHRONOUS_API
+
+
+def __getattr__(name):
+    if name in _SYNCHRONOUS_API:
+        from . import synchronous
+        value = getattr(synchronous, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SYNCHRONOUS_API))
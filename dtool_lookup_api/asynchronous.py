@@ -36,12 +36,32 @@ class _WrapClient:
         self.__doc__ = self._func.__doc__
 
     async def __call__(self, *args, **kwargs):
+        if kwargs.get('lazy'):
+            # the sequence would request pages through the client closed below
+            raise ValueError(
+                f"{self._name}(lazy=True) is not supported by the asynchronous API, "
+                f"call it on a client of your own that stays open, e.g. within "
+                f"'async with ConfigurationBasedAuthenticatedLookupClient() as lookup_client'.")
         async with ConfigurationBasedAuthenticatedLookupClient() as lookup_client:
             return await self._func(lookup_client, *args, **kwargs)
 
 
+class _WrapClientIterator(_WrapClient):
+    def __call__(self, *args, **kwargs):
+        return self._iterate(*args, **kwargs)
+
+    async def _iterate(self, *args, **kwargs):
+        async with ConfigurationBasedAuthenticatedLookupClient() as lookup_client:
+            async for record in self._func(lookup_client, *args, **kwargs):
+                yield record
+
+
 # Import all methods from ConfigurationBasedLookupClient into the global namespace
 for name, func in inspect.getmembers(ConfigurationBasedAuthenticatedLookupClient, predicate=inspect.isfunction):
     # Import everything that does not start with an underscore
-    if not name.startswith('_'):
+    if name.startswith('_'):
+        continue
+    if inspect.isasyncgenfunction(func):
+        globals()[name] = _WrapClientIterator(name, func)
+    else:
         globals()[name] = _WrapClient(name, func)
@@ -0,0 +1,118 @@
+#
+# Copyright 2020 Lars Pastewka, Johannes Laurin Hoermann
+#
+# ### MIT license
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""dtool_lookup_api.core.EventLoopThread module."""
+
+import asyncio
+import logging
+import os
+import threading
+
+
+class EventLoopThread:
+    """Persistent asyncio event loop running in a daemon thread.
+
+    Coroutines submitted from any number of threads via :meth:`run` execute
+    on the same loop, hence sessions, connections and tokens created by one
+    call remain usable by the next."""
+
+    def __init__(self, name="dtool-lookup-api-event-loop"):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self):
+        """The running event loop, started on first access."""
+        self.start()
+        return self._loop
+
+    def is_running(self):
+        return (self._thread is not None and self._thread.is_alive()
+                and self._pid == os.getpid())
+
+    def start(self):
+        """Start event loop thread if not running yet."""
+        logger = logging.getLogger(__name__)
+        with self._lock:
+            if self.is_running():
+                return
+
+            # also covers a forked child process that inherited the loop
+            # object, but not the thread running it
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                    loop.close()
+
+            thread = threading.Thread(target=run, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            logger.debug("Started event loop thread %s.", self.name)
+
+    def run(self, coro, timeout=None):
+        """Run coroutine on the event loop thread and block until done.
+
+        Safe to call from any thread except the event loop thread itself."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the event loop thread from within itself, "
+                "await the coroutine directly instead.")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # e.g. KeyboardInterrupt or timeout in the calling thread
+            future.cancel()
+            raise
+
+    def stop(self, coro=None):
+        """Optionally run a final coroutine, then stop the event loop thread."""
+        logger = logging.getLogger(__name__)
+        with self._lock:
+            if not self.is_running():
+                if coro is not None:
+                    coro.close()
+                return
+            if coro is not None:
+                asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+            self._thread = None
+            logger.debug("Stopped event loop thread %s.", self.name)
@@ -25,22 +25,146 @@
 """dtool_lookup_api.core.LookupClient module."""
 
 import yaml
+import asyncio
+import base64
+import collections
+import contextvars
+import copy
 import json
 import logging
+import re
+import time
 import urllib.parse
 
 import aiohttp
 import certifi
 import ssl
 
-from .config import Config
+from . import config
+from .PagedSequence import PagedSequence
+from .ResponseCache import ResponseCache
+from .config import (
+    DSERVER_TOKEN_KEY,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_CACHE_SIZE
+)
 
 import warnings
 import functools
+import heapq
+import itertools
 
 ASCENDING = 1
 DESCENDING = -1
 
+# seconds before its expiry a token is not trusted anymore
+TOKEN_EXPIRY_LEEWAY = 60
+# seconds a token without expiry claim is trusted after a successful probe
+TOKEN_PROBE_TTL = 300
+# seconds before its expiry a token is renewed in the background, at most
+# half of the token's lifetime
+TOKEN_REFRESH_MARGIN = 120
+# seconds to wait at least between two background token renewals
+TOKEN_REFRESH_MIN_INTERVAL = 1
+# seconds to wait at most before retrying a failed background token renewal,
+# waiting times double from TOKEN_REFRESH_MIN_INTERVAL with every failure
+TOKEN_REFRESH_MAX_RETRY_INTERVAL = 60
+
+# page size of iterators over all pages of paginated routes, flask-smorest's
+# default maximum page size at dserver
+DEFAULT_ITER_PAGE_SIZE = 100
+# pages requested ahead by iterators while the current page is consumed
+DEFAULT_PREFETCH = 1
+
+# page size accepted by dserver at most if not advertised otherwise in its
+# configuration under any of these keys, flask-smorest's default
+DEFAULT_MAX_PAGE_SIZE = 100
+SERVER_MAX_PAGE_SIZE_KEYS = ['max_page_size', 'MAX_PAGE_SIZE', 'API_MAX_PAGE_SIZE']
+# targets of iterators with adaptive page size, seconds per request and bytes
+# per response
+ADAPTIVE_TARGET_LATENCY = 0.5
+ADAPTIVE_TARGET_PAGE_BYTES = 2**20
+
+# requests in flight at most for bulk methods by default
+BULK_CONCURRENCY = 32
+
+# UUIDs per /uris query of get_datasets_by_uuids by default, keeps request
+# bodies small
+UUIDS_CHUNK_SIZE = 100
+
+# last segment of dataset URIs that ends in the dataset's UUID, i.e. URIs of
+# all storage brokers but the file system one
+DATASET_URI_UUID_PATTERN = re.compile(
+    r'^(?P<base_uri>.+)/(?P<uuid>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$')
+
+# parts of a dataset returned by get_dataset_bundle by default, each named
+# after the method retrieving it
+DATASET_BUNDLE_PARTS = ['dataset', 'readme', 'manifest', 'tags', 'annotations']
+
+# seconds responses are kept by clients with response cache, by first segment
+# of their route
+RESPONSE_CACHE_TTLS = {
+    'config': 300,
+    'readmes': 300,
+    'manifests': 300,
+    'tags': 60,
+    'annotations': 60,
+}
+
+# seconds to wait before the first retry of a failed bulk deletion, doubled
+# for every further retry
+BULK_RETRY_DELAY = 0.5
+
+# unique field terminating the sort order of keyset pagination
+KEYSET_UNIQUE_KEY = 'uri'
+
+# dates as serialized in responses, RFC 1123 ('Wed, 11 Nov 2020 17:20:30 GMT')
+# or ISO 8601 ('2020-11-11T17:20:30')
+DATE_STRING_PATTERN = re.compile(
+    r'^(?:[A-Z][a-z]{2}, \d{2} [A-Z][a-z]{2} \d{4} \d{2}:\d{2}:\d{2} GMT'
+    r'|\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}\S*)$')
+
+# pages requested concurrently by paginated methods with fetch_all=True
+FETCH_ALL_CONCURRENCY = 8
+
+# seconds between attempts to acquire the config file lock
+CONFIG_LOCK_POLL_INTERVAL = 0.05
+
+# keyword arguments of UnauthenticatedLookupClient configuring the connection
+# pool and response cache, named as the corresponding DtoolLookupAPIConfig
+# properties
+CONNECTION_OPTIONS = [
+    'connection_limit',
+    'connection_limit_per_host',
+    'keepalive_timeout',
+    'dns_cache_ttl',
+    'force_close',
+    'unix_socket',
+    'cache_size',
+]
+
+# requests that may safely be replayed after renewing a rejected token
+IDEMPOTENT_HTTP_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# size of responses received by the current task, if set
+_response_sizes = contextvars.ContextVar('_response_sizes', default=None)
+
+# token -> timestamp until which token is trusted without asking the server
+_trusted_tokens = {}
+# tokens rejected by the server despite a valid-looking expiry claim
+_rejected_tokens = set()
+
+def __getattr__(name):
+    # Config used to be imported here, keep it importable without
+    # constructing it at import time
+    if name == 'Config':
+        return config.Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def deprecated(replacement=None):
     """Marks a function or method a deprecated and hints to a possible replacement."""
     def decorator(func):
@@ -86,38 +210,368 @@ def _parse_sort_fields(sort_fields, sort_order):
     return sort
 
 
+def _decode_jwt_claims(token):
+    """Decode JWT payload without verifying its signature. Internal.
+
+    Returns None if token is not a JWT."""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except (AttributeError, IndexError, ValueError):
+        return None
+    if not isinstance(claims, dict):
+        return None
+    return claims
+
+
+def _trust_token(token, until):
+    """Memoize token as valid until timestamp. Internal."""
+    now = time.time()
+    for expired in [t for t, u in _trusted_tokens.items() if u <= now]:
+        del _trusted_tokens[expired]
+    _rejected_tokens.discard(token)
+    _trusted_tokens[token] = until
+
+
+def _distrust_token(token):
+    """Forget memoized validity of token rejected by server. Internal."""
+    _trusted_tokens.pop(token, None)
+    _rejected_tokens.add(token)
+
+
+def _retrieve_exception(task):
+    """Mark exception of finished task retrieved, even if nobody awaits it. Internal."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def _acquire_lock(lock, poll_interval=CONFIG_LOCK_POLL_INTERVAL):
+    """Acquire inter-process lock without blocking the event loop. Internal."""
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(poll_interval)
+
+
+def _configured_connection_options(options):
+    """Fill in connection options not given explicitly from configuration. Internal."""
+    options = dict(options)
+    for key in CONNECTION_OPTIONS:
+        if options.get(key) is None:
+            options[key] = getattr(config.Config, key)
+    return options
+
+
+def _adapt_page_size(page_size, number_of_records, elapsed, nbytes, max_page_size):
+    """Page size for next request from last page's latency and size. Internal.
+
+    Scales the page size towards ADAPTIVE_TARGET_LATENCY and caps it at
+    ADAPTIVE_TARGET_PAGE_BYTES per response, changing it at most by a factor
+    of two per page and only by more than a quarter to avoid oscillation."""
+    target = page_size*ADAPTIVE_TARGET_LATENCY/max(elapsed, 1e-3)
+    if nbytes and number_of_records:
+        target = min(target, ADAPTIVE_TARGET_PAGE_BYTES*number_of_records/nbytes)
+    if abs(target - page_size) <= page_size/4:
+        return min(page_size, max_page_size)
+    return int(min(max(target, page_size/2, 1), 2*page_size, max_page_size))
+
+
+def _sort_spec(sort_fields, sort_order):
+    """Sort fields and orders as lists of equal length. Internal."""
+    if isinstance(sort_fields, str):
+        sort_fields = [sort_fields]
+    if isinstance(sort_order, int):
+        sort_order = [sort_order]
+    sort_fields = list(sort_fields)
+    sort_order = list(sort_order)[:len(sort_fields)]
+    sort_order += [ASCENDING]*(len(sort_fields) - len(sort_order))
+    return sort_fields, sort_order
+
+
+def _keyset_sort(sort_fields, sort_order):
+    """Sort fields and orders of equal length, ending with unique key. Internal."""
+    sort_fields, sort_order = _sort_spec(sort_fields, sort_order)
+    if KEYSET_UNIQUE_KEY not in sort_fields:
+        sort_fields.append(KEYSET_UNIQUE_KEY)
+        sort_order.append(ASCENDING)
+    return sort_fields, sort_order
+
+
+def _after_keyset(query, sort_fields, sort_order, key):
+    """Restrict query to records sorted after key. Internal.
+
+    For sort fields f1, f2, ... and key values v1, v2, ..., records match if
+    f1 > v1, or f1 == v1 and f2 > v2, and so forth, with < for descending order."""
+    conditions = []
+    for i, (field, order) in enumerate(zip(sort_fields, sort_order)):
+        condition = dict(zip(sort_fields[:i], key[:i]))
+        condition[field] = {'$lt' if order == DESCENDING else '$gt': key[i]}
+        conditions.append(condition)
+    after = conditions[0] if len(conditions) == 1 else {'$or': conditions}
+    if query:
+        return {'$and': [query, after]}
+    return after
+
+
+def _keyset_key(record, sort_fields):
+    """Sort field values of record to continue keyset pagination after. Internal.
+
+    The direct mongo route returns dates as strings while MongoDB stores and
+    compares them as dates, hence a date string as key would match nothing."""
+    key = []
+    for field in sort_fields:
+        try:
+            value = record[field]
+        except KeyError as exc:
+            raise LookupServerError(
+                f"Records lack sort field {exc}, required for keyset pagination.") from exc
+        if isinstance(value, str) and DATE_STRING_PATTERN.match(value):
+            raise LookupServerError(
+                f"Sort field '{field}' returned as date string '{value}', which does not compare "
+                f"with dates stored on the server. Use keyset=False to sort by this field.")
+        key.append(value)
+    return key
+
+
+class _SortKey:
+    """Orders records like the server by sort fields and orders. Internal.
+
+    Missing values sort first in ascending order, as in MongoDB."""
+
+    __slots__ = ('values', 'sort_order')
+
+    def __init__(self, record, sort_fields, sort_order):
+        self.values = [record.get(field) for field in sort_fields]
+        self.sort_order = sort_order
+
+    def __eq__(self, other):
+        return self.values == other.values
+
+    def __lt__(self, other):
+        for a, b, order in zip(self.values, other.values, self.sort_order):
+            if a == b:
+                continue
+            if a is None:
+                less = True
+            elif b is None:
+                less = False
+            else:
+                less = a < b
+            return less if order != DESCENDING else not less
+        return False
+
+
+async def _merge_sorted(iterators, sort_fields, sort_order):
+    """Merge async iterators, each sorted by sort fields, into one sorted stream. Internal.
+
+    Heap-based k-way merge, the first record of every iterator is requested
+    concurrently. All iterators are closed when done."""
+    exhausted = object()
+
+    async def head(iterator):
+        try:
+            return await iterator.__anext__()
+        except StopAsyncIteration:
+            return exhausted
+
+    try:
+        tasks = [asyncio.ensure_future(head(iterator)) for iterator in iterators]
+        try:
+            heads = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        heap = [(_SortKey(record, sort_fields, sort_order), index, record)
+                for index, record in enumerate(heads) if record is not exhausted]
+        heapq.heapify(heap)
+        while heap:
+            _, index, record = heap[0]
+            yield record
+            record = await head(iterators[index])
+            if record is exhausted:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (_SortKey(record, sort_fields, sort_order), index, record))
+    finally:
+        for iterator in iterators:
+            await iterator.aclose()
+
+
+async def _as_completed_bounded(func, items, concurrency):
+    """Yield (item, result) of calls func(item) as they complete. Internal.
+
+    Keeps at most concurrency calls in flight and pulls further items
+    from the iterable only as calls complete. If a call raises, its
+    exception is yielded as result. Outstanding calls are cancelled when
+    the caller stops early."""
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be positive, got {concurrency}.")
+    items = iter(items)
+    pending = {}
+    try:
+        for item in itertools.islice(items, concurrency):
+            pending[asyncio.ensure_future(func(item))] = item
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                try:
+                    result = task.result()
+                except Exception as exc:
+                    result = exc
+                # refill first to keep requests in flight while caller processes
+                for next_item in itertools.islice(items, 1):
+                    pending[asyncio.ensure_future(func(next_item))] = next_item
+                yield item, result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_context(cafile, verify_ssl=True):
+    """Return process-wide SSL context per CA file and verification setting. Internal.
+
+    Sharing one context among all sessions avoids loading the CA bundle per
+    client and allows for TLS session resumption across connections."""
+    logger = logging.getLogger(__name__)
+    logger.debug("Create SSL context with certificates at %s, verify=%s", cafile, verify_ssl)
+    ssl_context = ssl.create_default_context(cafile=cafile)
+    if not verify_ssl:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
 class LookupServerError(Exception):
     pass
 
 
+class ClientStatistics:
+    """Observations on the requests of one client.
+
+    Attributes
+    ----------
+    page_sizes : dict of collections.Counter
+        paginated method name -> page size -> number of pages requested
+        by iterators
+    batched_calls : int
+        get_dataset calls answered from batched list queries
+    batch_queries : int
+        list queries sent for batched get_dataset calls
+    coalesced_requests : int
+        GET requests not sent, but answered by an identical request in flight
+    """
+
+    def __init__(self):
+        self.page_sizes = collections.defaultdict(collections.Counter)
+        self.batched_calls = 0
+        self.batch_queries = 0
+        self.coalesced_requests = 0
+
+    def reset(self):
+        self.__init__()
+
+    def as_dict(self):
+        return {
+            'page_sizes': {route: dict(sizes) for route, sizes in self.page_sizes.items()},
+            'batched_calls': self.batched_calls,
+            'batch_queries': self.batch_queries,
+            'coalesced_requests': self.coalesced_requests,
+        }
+
+
 class UnauthenticatedLookupClient:
     """Core Python interface for communication with dserver."""
 
-    def __init__(self, lookup_url, verify_ssl=True):
+    def __init__(self, lookup_url, verify_ssl=True,
+                 connection_limit=DEFAULT_CONNECTION_LIMIT,
+                 connection_limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+                 keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+                 dns_cache_ttl=DEFAULT_DNS_CACHE_TTL,
+                 force_close=False, unix_socket=None, batch_window=None,
+                 coalesce_requests=True, cache_size=DEFAULT_CACHE_SIZE, cache_ttls=None):
+        """
+        Parameters
+        ----------
+        lookup_url : str
+            dserver URL
+        verify_ssl : bool, default True
+            verify server's SSL certificate
+        connection_limit : int, default 100
+            maximum number of simultaneous connections, 0 for no limit
+        connection_limit_per_host : int, default 0
+            maximum number of simultaneous connections per host, 0 for no limit
+        keepalive_timeout : float, default 15
+            seconds an idle connection is kept open for reuse
+        dns_cache_ttl : int, default 10
+            seconds resolved host names are cached, None for caching forever
+        force_close : bool, default False
+            close connections after each request instead of keeping them alive
+        unix_socket : str, optional
+            path of unix domain socket to connect through instead of TCP,
+            e.g. of a reverse proxy on the same host. Routes are still
+            appended to lookup_url, whose host only fills the Host header.
+            All requests of the session go through the socket, including
+            those to a token generator.
+        batch_window : float, optional
+            seconds to collect concurrent get_dataset calls for, which are
+            then answered by one list query filtered by their UUIDs and base
+            URIs. Default None sends one request per call.
+        coalesce_requests : bool, default True
+            concurrent identical GET requests with the same credentials share
+            one request and one decoded response
+        cache_size : int, default 0
+            bytes of responses of metadata and configuration routes kept in
+            an in-memory cache at most, 0 disables the cache
+        cache_ttls : dict, optional
+            first route segment -> seconds responses are cached, e.g.
+            {'manifests': 3600}, overrides defaults per route
+        """
         logger = logging.getLogger(__name__)
 
-        self.ssl_context = None
-        # self.ssl_context = aiohttp.ClientSSLContext()
-        if verify_ssl:
-            certifi_where = certifi.where()
-            logger.debug("Use certifi certficates at %s", certifi_where)
-            self.ssl_context = ssl.create_default_context(cafile=certifi_where)
-        else:
+        certifi_where = certifi.where()
+        logger.debug("Use certifi certficates at %s", certifi_where)
+        if not verify_ssl:
             logger.debug("Do not verify ssl certificates.")
+        self.ssl_context = _get_ssl_context(certifi_where, bool(verify_ssl))
 
         self.session = None
 
         self.lookup_url = lookup_url
         self.verify_ssl = verify_ssl
 
-        logger.debug("%s initialized with lookup_url=%s, ssl=%s",
-                     type(self).__name__, self.lookup_url, self.verify_ssl)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.force_close = force_close
+        self.unix_socket = unix_socket
+        self.batch_window = batch_window
+        self.coalesce_requests = coalesce_requests
+        self.cache_ttls = {**RESPONSE_CACHE_TTLS, **(cache_ttls or {})}
+        self.response_cache = ResponseCache(cache_size) if cache_size else None
+
+        self.statistics = ClientStatistics()
+        self._max_page_size = None
+        # URI -> futures of get_dataset calls waiting for the next batch
+        self._dataset_batch = {}
+        self._dataset_batch_task = None
+        # (method, route, credentials) -> task of GET request in flight
+        self._requests_in_flight = {}
+
+        logger.debug("%s initialized with lookup_url=%s, ssl=%s, unix_socket=%s",
+                     type(self).__name__, self.lookup_url, self.verify_ssl, self.unix_socket)
 
     async def __aenter__(self):
         logger = logging.getLogger(__name__)
-        # self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=self.ssl_context))
         await self.create_session()
-        await self.connect()
+        try:
+            await self.connect()
+        except BaseException:
+            await self.close()
+            raise
         logger.debug("Connection to %s established.", self.lookup_url)
         return self
 
@@ -129,9 +583,23 @@ class UnauthenticatedLookupClient:
         logger.debug("Connection to %s closed.", self.lookup_url)
         return False
 
+    def _create_connector(self):
+        connector_options = dict(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            force_close=self.force_close)
+        # aiohttp refuses keep-alive timeout together with force_close
+        if not self.force_close:
+            connector_options['keepalive_timeout'] = self.keepalive_timeout
+        if self.unix_socket:
+            # neither name resolution nor TLS needed for http:// lookup urls
+            return aiohttp.UnixConnector(path=self.unix_socket, **connector_options)
+        return aiohttp.TCPConnector(ssl=self.ssl_context, ttl_dns_cache=self.dns_cache_ttl,
+                                    **connector_options)
+
     async def create_session(self):
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=self.ssl_context))
+            self.session = aiohttp.ClientSession(connector=self._create_connector())
 
     async def connect(self):
         """Establish connection."""
@@ -140,6 +608,8 @@ class UnauthenticatedLookupClient:
 
     async def close(self):
         """Close session if open."""
+        if self._dataset_batch_task is not None:
+            self._dataset_batch_task.cancel()
         if self.session and not self.session.closed:
             await self.session.close()
 
@@ -151,18 +621,151 @@ class UnauthenticatedLookupClient:
         if isinstance(json, dict) and 'msg' in json:
             raise LookupServerError(json['msg'])
 
-    async def _get(self, route, headers={}):
-        """Return information from a specific route."""
+    async def _handle_unauthorized(self, header):
+        """Hook called whenever the server answers with 401 Unauthorized.
+
+        Parameters
+        ----------
+        header : dict
+            request header that has been rejected
+
+        Returns
+        -------
+        bool
+            True if credentials have been renewed and request may be replayed"""
+        return False
+
+    async def _send(self, method, route, json=None, response_method='json'):
+        """Send single http request and return status, parsed response and response headers."""
         await self.create_session()
-        async with self.session.get(
+        header = self.header
+        async with self.session.request(
+                method,
                 f'{self.lookup_url}{route}',
-                headers=self.header, ssl=self.verify_ssl) as r:
-            json = await r.json()
-            self._check_json(json)
-            headers.update(**r.headers)
-            return json
+                headers=header,
+                json=json,
+                ssl=self.ssl_context) as r:
+            try:  # workaround for other non-json, non-method properties, better solutions welcome
+                response = await getattr(r, response_method)()
+            except TypeError:
+                response = getattr(r, response_method)
+            response_sizes = _response_sizes.get()
+            if response_sizes is not None:
+                response_sizes.append(r.content_length)
+            return r.status, header, response, r.headers
+
+    async def _request(self, method, route, json=None, response_method='json', headers={}, idempotent=None):
+        """Wrapper for all http methods.
 
-    async def _post(self, route, json, method='json', headers={}):
+        Parameters
+        ----------
+        method : str
+            http method, i.e. 'GET', 'POST', 'PUT' or 'DELETE'
+        route : str
+        json : dict, optional
+            request data
+        response_method : str, default 'json'
+            method do interpret response data
+        headers : dict
+            dict filled with response headers
+        idempotent : bool, optional
+            whether request may be replayed after renewing rejected credentials,
+            default True for GET, HEAD, OPTIONS, PUT, DELETE
+
+        Returns
+        -------
+        list or dict or str
+            parsed json response if parsable, otherwise plain text"""
+        status, response, response_headers = await self._request_with_status(
+            method, route, json=json, response_method=response_method, idempotent=idempotent)
+        headers.update(**response_headers)
+        return response
+
+    async def _request_with_status(self, method, route, json=None, response_method='json', idempotent=None):
+        """Return http status, response and response headers. Internal.
+
+        Parameters as for _request."""
+        logger = logging.getLogger(__name__)
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_HTTP_METHODS
+
+        status, header, response, response_headers = await self._send(
+            method, route, json=json, response_method=response_method)
+        if status == 401 and await self._handle_unauthorized(header) and idempotent:
+            logger.debug("Replaying %s %s with renewed credentials.", method, route)
+            status, header, response, response_headers = await self._send(
+                method, route, json=json, response_method=response_method)
+
+        self._check_json(response)
+        return status, response, response_headers
+
+    async def _get(self, route, headers={}, cache=None):
+        """Return information from a specific route.
+
+        Unless coalesce_requests is disabled, concurrent callers asking for
+        the same route with the same credentials share one request, hence
+        receive the very same response object. A caller cancelled while
+        waiting does not cancel the shared request.
+
+        If the client has a response cache, cache=True answers from the
+        cache if possible and cache=False requests anew, both store the
+        response if successful. Cached responses are copied, callers may
+        modify them. By default, responses are not cached."""
+        credentials = tuple(sorted(self.header.items()))
+        use_cache = cache is not None and self.response_cache is not None
+        if use_cache and cache:
+            cached = self.response_cache.get((route, credentials))
+            if cached is not None:
+                response, response_headers = cached
+                headers.update(**response_headers)
+                return copy.deepcopy(response)
+
+        if not self.coalesce_requests:
+            status, response, response_headers = await self._request_with_status('GET', route)
+        else:
+            key = ('GET', route, credentials)
+            task = self._requests_in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._request_with_status('GET', route))
+                self._requests_in_flight[key] = task
+                task.add_done_callback(functools.partial(self._request_done, key))
+            else:
+                self.statistics.coalesced_requests += 1
+            status, response, response_headers = await asyncio.shield(task)
+
+        # never cache errors, e.g. transient 503 Service Unavailable
+        if use_cache and status == 200:
+            self._cache_response(route, credentials, response, response_headers)
+        headers.update(**response_headers)
+        return response
+
+    def _cache_response(self, route, credentials, response, response_headers):
+        """Store copy of response in cache for the route's time to live. Internal."""
+        ttl = self.cache_ttls.get(route.split('/')[1], 0)
+        try:
+            size = int(response_headers['Content-Length'])
+        except (KeyError, TypeError, ValueError):
+            size = len(json.dumps(response).encode())
+        self.response_cache.put((route, credentials), (copy.deepcopy(response), response_headers),
+                                size, ttl)
+
+    def _invalidate_cached(self, route):
+        """Drop cached responses on the entity modified at route. Internal.
+
+        Modifying /uris/<uri> drops e.g. /manifests/<uri> and /tags/<uri>."""
+        if self.response_cache is not None:
+            key = route.rsplit('/', 1)[-1]
+            self.response_cache.discard(lambda cache_key: cache_key[0].rsplit('/', 1)[-1] == key)
+
+    def _request_done(self, key, task):
+        """Forget finished request in flight. Internal."""
+        if self._requests_in_flight.get(key) is task:
+            del self._requests_in_flight[key]
+        # mark exception retrieved even if all callers have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _post(self, route, json, method='json', headers={}, idempotent=False):
         """Wrapper for http post methpod.
 
         Parameters
@@ -174,24 +777,15 @@ class UnauthenticatedLookupClient:
             method do interpret response data
         headers : dict
             dict filled with response headers
+        idempotent : bool, default False
+            True for read-only queries that may safely be replayed
 
         Returns
         -------
         list or dict or str
             parsed json response if parsable, otherwise plain text"""
-        await self.create_session()
-        async with self.session.post(
-                f'{self.lookup_url}{route}',
-                headers=self.header,
-                json=json,
-                ssl=self.verify_ssl) as r:
-            try:  # workaround for other non-json, non-method properties, better solutions welcome
-                json = await getattr(r, method)()
-            except TypeError:
-                json = getattr(r, method)
-            self._check_json(json)
-            headers.update(**r.headers)
-            return json
+        return await self._request('POST', route, json=json, response_method=method, headers=headers,
+                                   idempotent=idempotent)
 
     async def _put(self, route, json, method='status', headers={}):
         """Wrapper for http put method.
@@ -210,19 +804,12 @@ class UnauthenticatedLookupClient:
         -------
         list or dict or str
             parsed json response if parsable, otherwise plain text"""
-        await self.create_session()
-        async with self.session.put(
-                f'{self.lookup_url}{route}',
-                headers=self.header,
-                json=json,
-                ssl=self.verify_ssl) as r:
-            try:  # workaround for other non-json, non-method properties, better solutions welcome
-                json = await getattr(r, method)()
-            except TypeError:
-                json = getattr(r, method)
-            self._check_json(json)
-            headers.update(**r.headers)
-            return json
+        self._invalidate_cached(route)
+        try:
+            return await self._request('PUT', route, json=json, response_method=method, headers=headers)
+        finally:
+            # a cached GET completing meanwhile may have stored the old state
+            self._invalidate_cached(route)
 
     async def _delete(self, route, method='status', headers={}):
         """Wrapper for http put method.
@@ -239,29 +826,27 @@ class UnauthenticatedLookupClient:
         -------
         list or dict or str
             parsed json response if parsable, otherwise plain text"""
-        await self.create_session()
-        async with self.session.delete(
-                f'{self.lookup_url}{route}',
-                headers=self.header,
-                ssl=self.verify_ssl) as r:
-            try:  # workaround for other non-json, non-method properties, better solutions welcome
-                json = await getattr(r, method)()
-            except TypeError:
-                json = getattr(r, method)
-            self._check_json(json)
-            headers.update(**r.headers)
-            return json
+        self._invalidate_cached(route)
+        try:
+            return await self._request('DELETE', route, response_method=method, headers=headers)
+        finally:
+            # a cached GET completing meanwhile may have stored the old state
+            self._invalidate_cached(route)
 
     # configuration routes
 
-    async def get_config(self):
-        """Request the server configuration."""
-        response = await self._get('/config/info')
+    async def get_config(self, cache=True):
+        """Request the server configuration.
+
+        cache=False requests anew and refreshes the client's response cache, if any."""
+        response = await self._get('/config/info', cache=cache)
         return response["config"]
 
-    async def get_versions(self):
-        """Request versions from the server"""
-        response = await self._get('/config/versions')
+    async def get_versions(self, cache=True):
+        """Request versions from the server
+
+        cache=False requests anew and refreshes the client's response cache, if any."""
+        response = await self._get('/config/versions', cache=cache)
         return response["versions"]
 
     # uris routes
@@ -270,7 +855,8 @@ class UnauthenticatedLookupClient:
                            base_uris=None, uuids=None, tags=None,
                            page_number=1, page_size=10,
                            sort_fields=["uri"], sort_order=[ASCENDING],
-                           pagination={}, sorting={}):
+                           pagination={}, sorting={}, fetch_all=False,
+                           lazy=False):
         """
         Get dataset entries on lookup server, filtered if desired.
 
@@ -300,12 +886,36 @@ class UnauthenticatedLookupClient:
         sorting : dict
             dictionary filled with data from the X-Sort response header, e.g.
             '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
+        lazy : bool, optional
+            Return a PagedSequence over all results instead of one page,
+            with len() from the total reported for the first page. Indexing
+            and slicing request only the pages covering the requested range
+            and cache them. page_number is ignored. Default is False.
 
         Returns
         -------
         json : list of dict
             search results
         """
+        if lazy:
+            return await self._lazy_pages(
+                self.get_datasets, free_text=free_text, creator_usernames=creator_usernames,
+                base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_datasets, free_text=free_text, creator_usernames=creator_usernames,
+                base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         headers = {}
         post_body = {}
         if free_text is not None:
@@ -323,7 +933,7 @@ class UnauthenticatedLookupClient:
 
         dataset_list = await self._post(
             f'/uris?page={page_number}&page_size={page_size}&sort={sort}',
-            post_body, headers=headers)
+            post_body, headers=headers, idempotent=True)
 
         if 'X-Pagination' in headers:
             p = json.loads(headers['X-Pagination'])
@@ -355,10 +965,88 @@ class UnauthenticatedLookupClient:
         dict
             Basic metadata info for dataset at URI.
         """
+        if self.batch_window is None:
+            return await self._get_dataset(uri)
+
+        future = asyncio.get_running_loop().create_future()
+        self._dataset_batch.setdefault(uri, []).append(future)
+        if self._dataset_batch_task is None:
+            self._dataset_batch_task = asyncio.ensure_future(self._resolve_dataset_batch())
+        return await future
+
+    async def _get_dataset(self, uri):
+        """Request one dataset by URI. Internal."""
         encoded_uri = urllib.parse.quote_plus(uri)
         response = await self._get(f'/uris/{encoded_uri}')
         return response
 
+    async def _resolve_dataset_batch(self):
+        """Answer get_dataset calls collected within the batch window. Internal.
+
+        URIs ending in a UUID are looked up by one list query per chunk,
+        filtered by their UUIDs and base URIs. All other URIs, URIs not
+        found that way and all URIs of a failed query are requested one by
+        one, so that callers see the same responses and errors as without
+        batching."""
+        batch = self._dataset_batch
+        try:
+            await asyncio.sleep(self.batch_window)
+            self._dataset_batch = {}
+            self._dataset_batch_task = None
+            await self._answer_dataset_batch(batch)
+        finally:
+            if self._dataset_batch is batch:
+                self._dataset_batch = {}
+                self._dataset_batch_task = None
+            # e.g. if cancelled on close, callers must not wait forever
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+
+    async def _answer_dataset_batch(self, batch):
+        """Set results of futures in batch, URI -> list of futures. Internal."""
+        logger = logging.getLogger(__name__)
+        uris = [uri for uri in batch if DATASET_URI_UUID_PATTERN.match(uri)]
+        chunks = [uris[i:i + UUIDS_CHUNK_SIZE] for i in range(0, len(uris), UUIDS_CHUNK_SIZE)]
+        if len(batch) < 2:
+            chunks = []
+
+        async def query(chunk):
+            matches = [DATASET_URI_UUID_PATTERN.match(uri) for uri in chunk]
+            return await self._fetch_all_pages(
+                self.get_datasets,
+                uuids=sorted(set(m['uuid'] for m in matches)),
+                base_uris=sorted(set(m['base_uri'] for m in matches)),
+                page_size=DEFAULT_MAX_PAGE_SIZE)
+
+        records = {}
+        results = await asyncio.gather(*[query(chunk) for chunk in chunks], return_exceptions=True)
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.debug("Batch query for %d datasets failed: %s", len(chunk), result)
+                continue
+            records.update((record['uri'], record) for record in result
+                           if record.get('uri') in batch)
+        self.statistics.batch_queries += len(chunks)
+        self.statistics.batched_calls += sum(len(batch[uri]) for uri in records)
+        logger.debug("Answered %d of %d datasets with %d batch queries.",
+                     len(records), len(batch), len(chunks))
+
+        async def resolve(uri):
+            try:
+                result = records[uri] if uri in records else await self._get_dataset(uri)
+            except Exception as exc:
+                for future in batch[uri]:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for future in batch[uri]:
+                    if not future.done():
+                        future.set_result(result)
+
+        await asyncio.gather(*[resolve(uri) for uri in batch])
+
     # delete dataset
 
     async def delete_dataset(self, uri):
@@ -374,8 +1062,20 @@ class UnauthenticatedLookupClient:
                                created_at, annotations, tags, number_of_items,
                                size_in_bytes):
         """Register or update a dataset using URI."""
+        response = await self._register_dataset(
+            uri=uri, base_uri=base_uri, readme=readme, manifest=manifest, uuid=uuid,
+            name=name, type=type, creator_username=creator_username, frozen_at=frozen_at,
+            created_at=created_at, annotations=annotations, tags=tags,
+            number_of_items=number_of_items, size_in_bytes=size_in_bytes)
+        return response in set([200, 201])
+
+    async def _register_dataset(self, uri, base_uri, readme, manifest, uuid,
+                                name, type, creator_username, frozen_at,
+                                created_at, annotations, tags, number_of_items,
+                                size_in_bytes):
+        """Register or update a dataset using URI, return http status. Internal."""
         encoded_uri = urllib.parse.quote_plus(uri)
-        response = await self._put(
+        return await self._put(
             f'/uris/{encoded_uri}',
             dict(uuid=uuid,
                  uri=uri,
@@ -391,13 +1091,61 @@ class UnauthenticatedLookupClient:
                  number_of_items=number_of_items,
                  size_in_bytes=size_in_bytes)
         )
-        return response in set([200, 201])
+
+    async def register_datasets(self, datasets, concurrency=None):
+        """
+        Register or update many datasets concurrently.
+
+        Parameters
+        ----------
+        datasets : iterable of dict
+            keyword arguments of register_dataset per dataset, consumed
+            lazily, hence a generator keeps only datasets in flight in memory
+        concurrency : int, optional
+            maximum number of requests in flight, default is 32
+
+        Returns
+        -------
+        dict
+            'results': list of (uri, http status code or exception raised)
+            in input order, 'registered' and 'failed': number of datasets
+            registered or updated and failed, 'seconds': time elapsed,
+            'datasets_per_second': throughput
+        """
+        logger = logging.getLogger(__name__)
+        if concurrency is None:
+            concurrency = BULK_CONCURRENCY
+
+        async def register(item):
+            _, dataset = item
+            return await self._register_dataset(**dataset)
+
+        results = {}
+        registered = 0
+        start = time.perf_counter()
+        async for (index, dataset), status in _as_completed_bounded(
+                register, enumerate(datasets), concurrency):
+            results[index] = (dataset.get('uri'), status)
+            if status in (200, 201):
+                registered += 1
+            else:
+                logger.debug("Registering %s failed: %s", dataset.get('uri'), status)
+        seconds = time.perf_counter() - start
+
+        logger.debug("Registered %d of %d datasets in %.3f s.", registered, len(results), seconds)
+        return {
+            'results': [results[index] for index in sorted(results)],
+            'registered': registered,
+            'failed': len(results) - registered,
+            'seconds': seconds,
+            'datasets_per_second': len(results)/seconds if seconds > 0 else 0.,
+        }
 
     # uuids routes
 
     async def get_datasets_by_uuid(self, uuid, page_number=1, page_size=10,
                                    sort_fields=["uri"], sort_order=[ASCENDING],
-                                   pagination={}, sorting={}):
+                                   pagination={}, sorting={}, fetch_all=False):
         """
         Search for entries by a specific UUID.
 
@@ -419,12 +1167,22 @@ class UnauthenticatedLookupClient:
         sorting : dict
             Dictionary filled with data from the X-Sort response header, e.g.
             '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
 
         Returns
         -------
         list of dict
             Query results for the specified UUID.
         """
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_datasets_by_uuid, uuid, sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         headers = {}
 
         sort = _parse_sort_fields(sort_fields, sort_order)
@@ -448,36 +1206,279 @@ class UnauthenticatedLookupClient:
 
         return lookup_list
 
+    async def get_datasets_by_uuids(self, uuids, chunk_size=None, concurrency=None,
+                                    sort_fields=["uri"], sort_order=[ASCENDING]):
+        """
+        Search for entries by many UUIDs at once.
+
+        UUIDs are split into chunks, each resolved by one filtered /uris
+        query, all pages of it, with chunk queries running concurrently.
+
+        Parameters
+        ----------
+        uuids : iterable of str
+            The unique identifiers (UUIDs) of the datasets to be searched.
+        chunk_size : int, optional
+            The number of UUIDs per query, default is 100.
+        concurrency : int, optional
+            The maximum number of chunk queries in flight, default is 32.
+        sort_fields: str or list of str, optional
+            default is "uri"
+        sort_order: int or list of int of ASCENDING (1) or DESCENDING (-1)
+            default is ASCENDING (1)
+
+        Returns
+        -------
+        dict
+            UUID -> list of dict of entries with this UUID, in input order,
+            empty list for UUIDs not found.
+        """
+        logger = logging.getLogger(__name__)
+        if chunk_size is None:
+            chunk_size = UUIDS_CHUNK_SIZE
+        if concurrency is None:
+            concurrency = BULK_CONCURRENCY
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+
+        records = {uuid: [] for uuid in uuids}
+        unique_uuids = list(records)
+        chunks = [unique_uuids[i:i + chunk_size] for i in range(0, len(unique_uuids), chunk_size)]
+        logger.debug("Resolve %d UUIDs in %d queries.", len(unique_uuids), len(chunks))
+
+        async def resolve(chunk):
+            return await self._fetch_all_pages(
+                self.get_datasets, uuids=chunk, sort_fields=sort_fields, sort_order=sort_order,
+                page_size=DEFAULT_MAX_PAGE_SIZE)
+
+        async for chunk, result in _as_completed_bounded(resolve, chunks, concurrency):
+            if isinstance(result, Exception):
+                raise result
+            for record in result:
+                if record.get('uuid') in records:
+                    records[record['uuid']].append(record)
+
+        return records
+
     # metadata retrieval routes
 
-    async def get_readme(self, uri):
-        """Request the README.yml of a dataset by URI."""
+    async def get_readme(self, uri, cache=True):
+        """Request the README.yml of a dataset by URI.
+
+        cache=False requests anew and refreshes the client's response cache, if any."""
         encoded_uri = urllib.parse.quote_plus(uri)
-        response = await self._get(f'/readmes/{encoded_uri}')
+        response = await self._get(f'/readmes/{encoded_uri}', cache=cache)
         return response["readme"]
 
-    async def get_manifest(self, uri):
-        """Request the manifest of a dataset by URI."""
+    async def get_manifest(self, uri, cache=True):
+        """Request the manifest of a dataset by URI.
+
+        cache=False requests anew and refreshes the client's response cache, if any."""
         encoded_uri = urllib.parse.quote_plus(uri)
-        return await self._get(f'/manifests/{encoded_uri}')
+        return await self._get(f'/manifests/{encoded_uri}', cache=cache)
+
+    async def get_tags(self, uri, cache=True):
+        """Request the tags of a dataset by URI.
 
-    async def get_tags(self, uri):
-        """Request the tags of a dataset by URI."""
+        cache=False requests anew and refreshes the client's response cache, if any."""
         encoded_uri = urllib.parse.quote_plus(uri)
-        response = await self._get(f'/tags/{encoded_uri}')
+        response = await self._get(f'/tags/{encoded_uri}', cache=cache)
         return response["tags"]
 
-    async def get_annotations(self, uri):
-        """Request the annotations of a dataset by URI."""
+    async def get_annotations(self, uri, cache=True):
+        """Request the annotations of a dataset by URI.
+
+        cache=False requests anew and refreshes the client's response cache, if any."""
         encoded_uri = urllib.parse.quote_plus(uri)
-        response = await self._get(f'/annotations/{encoded_uri}')
+        response = await self._get(f'/annotations/{encoded_uri}', cache=cache)
         return response["annotations"]
 
+    async def get_dataset_bundle(self, uri, parts=None, errors=None):
+        """
+        Request dataset information and metadata of one dataset concurrently.
+
+        Parameters
+        ----------
+        uri : str
+            The unique resource identifier (URI) of the dataset.
+        parts : list of str, optional
+            any of 'dataset', 'readme', 'manifest', 'tags' and 'annotations',
+            default is all of them
+        errors : dict, optional
+            dictionary filled with part -> exception for failed requests.
+            If not given, the first failed request raises its exception.
+
+        Returns
+        -------
+        dict
+            part -> result of get_dataset, get_readme, get_manifest, get_tags
+            or get_annotations, failed parts omitted
+        """
+        if parts is None:
+            parts = DATASET_BUNDLE_PARTS
+        unknown_parts = set(parts) - set(DATASET_BUNDLE_PARTS)
+        if unknown_parts:
+            raise ValueError(f"Unknown dataset bundle parts {sorted(unknown_parts)}, "
+                             f"choose from {DATASET_BUNDLE_PARTS}.")
+        parts = list(dict.fromkeys(parts))
+
+        results = await asyncio.gather(*[getattr(self, f'get_{part}')(uri) for part in parts],
+                                       return_exceptions=errors is not None)
+        bundle = {}
+        for part, result in zip(parts, results):
+            if isinstance(result, Exception):
+                errors[part] = result
+            else:
+                bundle[part] = result
+        return bundle
+
+    # bulk metadata retrieval
+
+    async def _get_by_uris(self, get_one, uris, concurrency=None, errors=None):
+        """Call get_one for many URIs concurrently, return results by URI in input order. Internal."""
+        logger = logging.getLogger(__name__)
+        if concurrency is None:
+            concurrency = BULK_CONCURRENCY
+        uris = list(uris)
+        results = {}
+        async for uri, result in _as_completed_bounded(get_one, uris, concurrency):
+            if isinstance(result, Exception):
+                logger.debug("%s failed for %s: %s", get_one.__name__, uri, result)
+                if errors is not None:
+                    errors[uri] = result
+            else:
+                results[uri] = result
+        return {uri: results[uri] for uri in uris if uri in results}
+
+    async def get_readmes_by_uris(self, uris, concurrency=None, errors=None):
+        """
+        Request the README.yml of many datasets by URI concurrently.
+
+        Parameters
+        ----------
+        uris : iterable of str
+            dataset URIs
+        concurrency : int, optional
+            maximum number of requests in flight, default is 32
+        errors : dict, optional
+            dictionary filled with URI -> exception for failed requests
+
+        Returns
+        -------
+        dict
+            URI -> README in input order, failed URIs omitted
+        """
+        return await self._get_by_uris(self.get_readme, uris, concurrency=concurrency, errors=errors)
+
+    async def get_manifests_by_uris(self, uris, concurrency=None, errors=None):
+        """
+        Request the manifests of many datasets by URI concurrently.
+
+        Parameters as for get_readmes_by_uris.
+
+        Returns
+        -------
+        dict
+            URI -> manifest in input order, failed URIs omitted
+        """
+        return await self._get_by_uris(self.get_manifest, uris, concurrency=concurrency, errors=errors)
+
+    async def get_tags_by_uris(self, uris, concurrency=None, errors=None):
+        """
+        Request the tags of many datasets by URI concurrently.
+
+        Parameters as for get_readmes_by_uris.
+
+        Returns
+        -------
+        dict
+            URI -> tags in input order, failed URIs omitted
+        """
+        return await self._get_by_uris(self.get_tags, uris, concurrency=concurrency, errors=errors)
+
+    async def get_annotations_by_uris(self, uris, concurrency=None, errors=None):
+        """
+        Request the annotations of many datasets by URI concurrently.
+
+        Parameters as for get_readmes_by_uris.
+
+        Returns
+        -------
+        dict
+            URI -> annotations in input order, failed URIs omitted
+        """
+        return await self._get_by_uris(self.get_annotations, uris, concurrency=concurrency, errors=errors)
+
+    async def iter_readmes_by_uris(self, uris, concurrency=None):
+        """
+        Request the README.yml of many datasets by URI concurrently, yield as completed.
+
+        Parameters
+        ----------
+        uris : iterable of str
+            dataset URIs, consumed lazily
+        concurrency : int, optional
+            maximum number of requests in flight, default is 32
+
+        Yields
+        ------
+        tuple
+            URI and README, or the exception raised if failed
+        """
+        async for uri, result in _as_completed_bounded(
+                self.get_readme, uris, concurrency or BULK_CONCURRENCY):
+            yield uri, result
+
+    async def iter_manifests_by_uris(self, uris, concurrency=None):
+        """
+        Request the manifests of many datasets by URI concurrently, yield as completed.
+
+        Parameters as for iter_readmes_by_uris.
+
+        Yields
+        ------
+        tuple
+            URI and manifest, or the exception raised if failed
+        """
+        async for uri, result in _as_completed_bounded(
+                self.get_manifest, uris, concurrency or BULK_CONCURRENCY):
+            yield uri, result
+
+    async def iter_tags_by_uris(self, uris, concurrency=None):
+        """
+        Request the tags of many datasets by URI concurrently, yield as completed.
+
+        Parameters as for iter_readmes_by_uris.
+
+        Yields
+        ------
+        tuple
+            URI and tags, or the exception raised if failed
+        """
+        async for uri, result in _as_completed_bounded(
+                self.get_tags, uris, concurrency or BULK_CONCURRENCY):
+            yield uri, result
+
+    async def iter_annotations_by_uris(self, uris, concurrency=None):
+        """
+        Request the annotations of many datasets by URI concurrently, yield as completed.
+
+        Parameters as for iter_readmes_by_uris.
+
+        Yields
+        ------
+        tuple
+            URI and annotations, or the exception raised if failed
+        """
+        async for uri, result in _as_completed_bounded(
+                self.get_annotations, uris, concurrency or BULK_CONCURRENCY):
+            yield uri, result
+
     # user management routes
 
     async def get_users(self, page_number=1, page_size=10,
                         sort_fields=["username"], sort_order=[ASCENDING],
-                        pagination={}, sorting={}):
+                        pagination={}, sorting={}, fetch_all=False):
         """
         Request a list of users. (Needs admin privileges.)
 
@@ -497,6 +1498,11 @@ class UnauthenticatedLookupClient:
         sorting : dict
             Dictionary filled with data from the X-Sort response header, e.g.
             '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
 
         Returns
         -------
@@ -504,6 +1510,11 @@ class UnauthenticatedLookupClient:
            User information including username, email, roles, etc.
         """
 
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_users, sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         headers = {}
 
         sort = _parse_sort_fields(sort_fields, sort_order)
@@ -577,7 +1588,7 @@ class UnauthenticatedLookupClient:
 
     async def get_base_uris(self, page_number=1, page_size=10,
                             sort_fields=["base_uri"], sort_order=[ASCENDING],
-                            pagination={}, sorting={}):
+                            pagination={}, sorting={}, fetch_all=False):
         """
         List all registered base URIs. (Needs admin privileges.)
 
@@ -597,12 +1608,22 @@ class UnauthenticatedLookupClient:
         sorting : dict
             Dictionary filled with data from the X-Sort response header, e.g.
                 '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
 
         Returns
         -------
         list of dict
            Registered base URIs information including name, URI, and description.
         """
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_base_uris, sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         headers = {}
 
         sort = _parse_sort_fields(sort_fields, sort_order)
@@ -649,12 +1670,99 @@ class UnauthenticatedLookupClient:
         response = await self._delete(f'/base-uris/{encoded_base_uri}')
         return response == 200
 
+    # bulk deletion
+
+    async def _delete_many(self, route, keys, concurrency=None, retries=0):
+        """Delete many entities at route/<key> concurrently. Internal.
+
+        Connection errors and server errors (5xx) are retried up to retries
+        times with exponential backoff.
+
+        Returns
+        -------
+        dict
+            key -> True if deleted, False if refused, or the exception raised,
+            in input order"""
+        logger = logging.getLogger(__name__)
+        if concurrency is None:
+            concurrency = BULK_CONCURRENCY
+        keys = list(keys)
+
+        async def delete(key):
+            encoded_key = urllib.parse.quote_plus(key)
+            for attempt in range(retries + 1):
+                try:
+                    status = await self._delete(f'{route}/{encoded_key}')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    if attempt == retries:
+                        raise
+                    logger.debug("Deleting %s failed: %s, retry.", key, exc)
+                else:
+                    if status < 500 or attempt == retries:
+                        return status == 200
+                    logger.debug("Deleting %s failed with status %d, retry.", key, status)
+                await asyncio.sleep(BULK_RETRY_DELAY*2**attempt)
+
+        outcomes = {}
+        async for key, outcome in _as_completed_bounded(delete, keys, concurrency):
+            outcomes[key] = outcome
+        return {key: outcomes[key] for key in keys}
+
+    async def delete_datasets(self, uris, concurrency=None, retries=0):
+        """
+        Delete many datasets using URIs concurrently. (Needs admin privileges.)
+
+        Parameters
+        ----------
+        uris : iterable of str
+            dataset URIs
+        concurrency : int, optional
+            maximum number of requests in flight, default is 32
+        retries : int, optional
+            number of retries after connection or server errors, default is 0
+
+        Returns
+        -------
+        dict
+            URI -> True if deleted, False if refused by the server, or the
+            exception raised, in input order
+        """
+        return await self._delete_many('/uris', uris, concurrency=concurrency, retries=retries)
+
+    async def delete_users(self, usernames, concurrency=None, retries=0):
+        """
+        Delete many users concurrently. (Needs admin privileges.)
+
+        Parameters as for delete_datasets.
+
+        Returns
+        -------
+        dict
+            username -> True if deleted, False if refused by the server, or
+            the exception raised, in input order
+        """
+        return await self._delete_many('/users', usernames, concurrency=concurrency, retries=retries)
+
+    async def delete_base_uris(self, base_uris, concurrency=None, retries=0):
+        """
+        Delete many base URIs concurrently. (Needs admin privileges.)
+
+        Parameters as for delete_datasets.
+
+        Returns
+        -------
+        dict
+            base URI -> True if deleted, False if refused by the server, or
+            the exception raised, in input order
+        """
+        return await self._delete_many('/base-uris', base_uris, concurrency=concurrency, retries=retries)
+
     # server-side plugin-dependent routes
 
     async def get_datasets_by_mongo_aggregation(self, aggregation,
                         page_number=1, page_size=10,
                         sort_fields=["uri"], sort_order=[ASCENDING],
-                        pagination={}, sorting={}):
+                        pagination={}, sorting={}, fetch_all=False, lazy=False):
         """
         Execute a direct MongoDB aggregation.
 
@@ -676,6 +1784,16 @@ class UnauthenticatedLookupClient:
         sorting : dict
             Dictionary filled with data from the X-Sort response header, e.g.
             '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
+        lazy : bool, optional
+            Return a PagedSequence over all results instead of one page,
+            with len() from the total reported for the first page. Indexing
+            and slicing request only the pages covering the requested range
+            and cache them. page_number is ignored. Default is False.
 
         Returns
         -------
@@ -683,6 +1801,16 @@ class UnauthenticatedLookupClient:
             Aggregation results.
         """
 
+        if lazy:
+            return await self._lazy_pages(
+                self.get_datasets_by_mongo_aggregation, aggregation, sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_datasets_by_mongo_aggregation, aggregation, sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         if isinstance(aggregation, str):
             aggregation = json.loads(aggregation)
 
@@ -692,7 +1820,7 @@ class UnauthenticatedLookupClient:
 
         aggregation_result = await self._post(
             f'/mongo/aggregate?page={page_number}&page_size={page_size}&sort={sort}',
-            dict(aggregation=aggregation), headers=headers)
+            dict(aggregation=aggregation), headers=headers, idempotent=True)
 
         if 'X-Pagination' in headers:
             p = json.loads(headers['X-Pagination'])
@@ -714,7 +1842,7 @@ class UnauthenticatedLookupClient:
                     base_uris=None, uuids=None, tags=None,
                     page_number=1, page_size=10,
                     sort_fields=["uri"], sort_order=[ASCENDING],
-                    pagination={}, sorting={}):
+                    pagination={}, sorting={}, fetch_all=False, lazy=False):
         """
         Direct mongo query, requires server-side direct mongo plugin.
 
@@ -744,6 +1872,16 @@ class UnauthenticatedLookupClient:
         sorting : dict
             Dictionary filled with data from the X-Sort response header, e.g.
             '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
+        lazy : bool, optional
+            Return a PagedSequence over all results instead of one page,
+            with len() from the total reported for the first page. Indexing
+            and slicing request only the pages covering the requested range
+            and cache them. page_number is ignored. Default is False.
 
         Returns
         -------
@@ -751,6 +1889,20 @@ class UnauthenticatedLookupClient:
             query results
         """
 
+        if lazy:
+            return await self._lazy_pages(
+                self.get_datasets_by_mongo_query, query, creator_usernames=creator_usernames,
+                base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_datasets_by_mongo_query, query, creator_usernames=creator_usernames,
+                base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         if isinstance(query, str):
             query = json.loads(query)
 
@@ -769,7 +1921,8 @@ class UnauthenticatedLookupClient:
             post_body.update({'tags': tags})
 
         query_result = await self._post(
-            f'/mongo/query?page={page_number}&page_size={page_size}&sort={sort}', post_body, headers=headers)
+            f'/mongo/query?page={page_number}&page_size={page_size}&sort={sort}', post_body, headers=headers,
+            idempotent=True)
 
         if 'X-Pagination' in headers:
             p = json.loads(headers['X-Pagination'])
@@ -790,7 +1943,7 @@ class UnauthenticatedLookupClient:
     async def get_graph_by_uuid(self, uuid, dependency_keys=None,
                                 page_number=1, page_size=10,
                                 sort_fields=["uri"], sort_order=[ASCENDING],
-                                pagination={}, sorting={}):
+                                pagination={}, sorting={}, fetch_all=False):
         """
         Request dependency graph for a specific UUID.
 
@@ -815,6 +1968,11 @@ class UnauthenticatedLookupClient:
         sorting : dict
             Dictionary filled with data from the X-Sort response header, e.g.
             '{"sort": {"uuid": 1}}' for ascending sorting by uuid
+        fetch_all : bool, optional
+            Fetch all pages, the remaining ones concurrently after the first,
+            and return their records concatenated in server sort order.
+            page_number is ignored and pagination describes the first page.
+            Default is False.
 
         Returns
         -------
@@ -822,6 +1980,12 @@ class UnauthenticatedLookupClient:
             Dependency graph results.
         """
 
+        if fetch_all:
+            return await self._fetch_all_pages(
+                self.get_graph_by_uuid, uuid, dependency_keys=dependency_keys,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, pagination=pagination, sorting=sorting)
+
         headers = {}
 
         sort = _parse_sort_fields(sort_fields, sort_order)
@@ -833,7 +1997,7 @@ class UnauthenticatedLookupClient:
         else:  # TODO: validity check on dependency key list
             dependency_graph = await self._post(
                 f'/graph/uuids/{uuid}?page={page_number}&page_size={page_size}&sort={sort}',
-                {"dependency_keys": dependency_keys}, headers=headers)
+                {"dependency_keys": dependency_keys}, headers=headers, idempotent=True)
 
         if 'X-Pagination' in headers:
             p = json.loads(headers['X-Pagination'])
@@ -851,6 +2015,522 @@ class UnauthenticatedLookupClient:
 
         return dependency_graph
 
+    # iteration over all pages of paginated routes
+
+    async def _lazy_pages(self, get_page, *args, page_size=10, pagination={}, **kwargs):
+        """Return PagedSequence over all results of a paginated route. Internal.
+
+        Requests the first page to learn the total number of records.
+
+        Parameters
+        ----------
+        get_page : coroutine function
+            bound method accepting page_number, page_size and pagination
+        page_size : int
+            number of records per page
+        pagination : dict
+            dictionary filled with pagination information of the first page
+
+        Further arguments are passed on to get_page."""
+        first_pagination = {}
+        records = await get_page(*args, page_number=1, page_size=page_size,
+                                 pagination=first_pagination, **kwargs)
+        pagination.update(**first_pagination)
+        if 'total' not in first_pagination:
+            raise LookupServerError("Server returned no total number of results, required for lazy results.")
+
+        async def fetch_page(page_number):
+            return await get_page(*args, page_number=page_number, page_size=page_size,
+                                  pagination={}, **kwargs)
+
+        return PagedSequence(fetch_page, page_size, first_pagination['total'], first_page=records,
+                             concurrency=FETCH_ALL_CONCURRENCY)
+
+    async def _fetch_all_pages(self, get_page, *args, page_size=10, pagination={},
+                               concurrency=None, **kwargs):
+        """Return records of all pages of a paginated route. Internal.
+
+        Reads the total number of pages from the first response and requests
+        the remaining pages concurrently, at most concurrency at a time.
+        Fails with the first error, cancelling all outstanding requests.
+
+        Parameters
+        ----------
+        get_page : coroutine function
+            bound method accepting page_number, page_size and pagination
+        page_size : int
+            number of records per request
+        pagination : dict
+            dictionary filled with pagination information of the first page
+        concurrency : int, optional
+            maximum number of concurrent requests, default FETCH_ALL_CONCURRENCY
+
+        Further arguments are passed on to get_page."""
+        logger = logging.getLogger(__name__)
+        if concurrency is None:
+            concurrency = FETCH_ALL_CONCURRENCY
+
+        first_pagination = {}
+        records = list(await get_page(*args, page_number=1, page_size=page_size,
+                                      pagination=first_pagination, **kwargs))
+        pagination.update(**first_pagination)
+
+        if 'total_pages' not in first_pagination:
+            logger.debug("No total number of pages, fetch remaining pages of %s sequentially.",
+                         get_page.__name__)
+            page_number = 1
+            page = records
+            while len(page) >= page_size > 0:
+                page_number += 1
+                page = await get_page(*args, page_number=page_number, page_size=page_size,
+                                      pagination={}, **kwargs)
+                records.extend(page)
+            return records
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page_number):
+            async with semaphore:
+                return await get_page(*args, page_number=page_number, page_size=page_size,
+                                      pagination={}, **kwargs)
+
+        total_pages = first_pagination['total_pages']
+        logger.debug("Fetch remaining %d pages of %s, %d at a time.",
+                     total_pages - 1, get_page.__name__, concurrency)
+        tasks = [asyncio.ensure_future(fetch(page_number))
+                 for page_number in range(2, total_pages + 1)]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # no requests outlive the call, exceptions of all tasks retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        for page in pages:
+            records.extend(page)
+        return records
+
+    async def _get_max_page_size(self):
+        """Largest page size accepted by the server. Internal.
+
+        Read from the server configuration once per client, flask-smorest's
+        default DEFAULT_MAX_PAGE_SIZE if not advertised."""
+        logger = logging.getLogger(__name__)
+        if self._max_page_size is None:
+            max_page_size = None
+            try:
+                server_config = await self.get_config()
+            except (LookupServerError, aiohttp.ClientError, KeyError, TypeError) as exc:
+                logger.debug("Could not read maximum page size from server configuration: %s", exc)
+            else:
+                for key in SERVER_MAX_PAGE_SIZE_KEYS:
+                    if isinstance(server_config, dict) and key in server_config:
+                        max_page_size = int(server_config[key])
+                        break
+            self._max_page_size = max_page_size if max_page_size else DEFAULT_MAX_PAGE_SIZE
+            logger.debug("Maximum page size %d.", self._max_page_size)
+        return self._max_page_size
+
+    async def _fetch_page(self, get_page, *args, **kwargs):
+        """Return records, seconds elapsed and response bytes of one page. Internal.
+
+        Must run in a task of its own to observe only its own response size."""
+        response_sizes = []
+        _response_sizes.set(response_sizes)
+        start = time.perf_counter()
+        records = await get_page(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        nbytes = response_sizes[-1] if response_sizes else None
+        return records, elapsed, nbytes
+
+    async def _iter_pages(self, get_page, *args, page_size=DEFAULT_ITER_PAGE_SIZE,
+                          prefetch=DEFAULT_PREFETCH, adaptive=False, **kwargs):
+        """Yield records from all pages of a paginated route. Internal.
+
+        While the records of one page are consumed, up to prefetch following
+        pages are requested concurrently, bounding memory to prefetch + 1 pages.
+
+        In adaptive mode, the page size is adjusted after every page towards
+        ADAPTIVE_TARGET_LATENCY seconds per request and at most
+        ADAPTIVE_TARGET_PAGE_BYTES per response, within the server's maximum
+        page size. As pages are addressed by number, the first page of a new
+        size may overlap with records already yielded, which are skipped.
+
+        Parameters
+        ----------
+        get_page : coroutine function
+            bound method accepting page_number, page_size and pagination
+        page_size : int
+            number of records per request, initial value in adaptive mode
+        prefetch : int
+            number of pages requested ahead, 0 for strictly sequential requests
+        adaptive : bool
+            adjust page size to observed latency and response size
+
+        Further arguments are passed on to get_page."""
+        logger = logging.getLogger(__name__)
+        if prefetch < 0:
+            raise ValueError(f"prefetch must not be negative, got {prefetch}.")
+
+        route = get_page.__name__
+        max_page_size = None
+        if adaptive:
+            max_page_size = await self._get_max_page_size()
+            page_size = max(min(page_size, max_page_size), 1)
+
+        async def fetch(page_number, size, skip):
+            pagination = {}
+            records, elapsed, nbytes = await self._fetch_page(
+                get_page, *args, page_number=page_number, page_size=size,
+                pagination=pagination, **kwargs)
+            return records, pagination, size, skip, elapsed, nbytes
+
+        pending = collections.deque()
+        next_offset = 0
+        total = None  # unknown until first response
+        exhausted = False
+
+        def more():
+            return not exhausted and (total is None or next_offset < total)
+
+        def request_next_page():
+            nonlocal next_offset
+            page_number = next_offset // page_size + 1
+            skip = next_offset - (page_number - 1)*page_size
+            pending.append(asyncio.ensure_future(fetch(page_number, page_size, skip)))
+            self.statistics.page_sizes[route][page_size] += 1
+            next_offset += page_size - skip
+
+        try:
+            while True:
+                if not pending and more():
+                    request_next_page()
+                if not pending:
+                    break
+
+                records, pagination, size, skip, elapsed, nbytes = await pending.popleft()
+                if total is None and 'total' in pagination:
+                    total = pagination['total']
+                elif total is None and 'total_pages' in pagination:
+                    total = pagination['total_pages']*size
+                # short page marks the end if the server does not paginate
+                if len(records) < size:
+                    exhausted = True
+                    while pending:
+                        pending.pop().cancel()
+                elif adaptive:
+                    adapted_page_size = _adapt_page_size(size, len(records), elapsed, nbytes, max_page_size)
+                    if adapted_page_size != page_size:
+                        logger.debug("Adapt page size of %s from %d to %d after %d records in %.3f s (%s bytes).",
+                                     route, page_size, adapted_page_size, len(records), elapsed, nbytes)
+                        page_size = adapted_page_size
+
+                while len(pending) < prefetch and more():
+                    logger.debug("Prefetch records from offset %d of %s.", next_offset, route)
+                    request_next_page()
+
+                for record in records[skip:]:
+                    yield record
+        finally:
+            # caller stopped iterating early or a request failed
+            for task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()  # retrieve to not log it as unhandled
+                else:
+                    task.cancel()
+
+    async def _iter_keyset(self, query, sort_fields=["uri"], sort_order=[ASCENDING],
+                           page_size=DEFAULT_ITER_PAGE_SIZE, adaptive=False, **kwargs):
+        """Yield records matching a direct mongo query by keyset pagination. Internal.
+
+        Instead of skipping over an offset, every request asks for the first
+        page of records sorted after the last record received, so the cost per
+        page does not grow with the depth of the scan and records registered
+        meanwhile do not shift pages. The unique key KEYSET_UNIQUE_KEY is
+        appended to the sort fields if missing. Sort field values are taken
+        from returned records, hence must compare as stored on the server.
+        Dates are returned as strings and hence refused as sort fields with
+        more than one page.
+
+        Parameters
+        ----------
+        query : dict
+            The MongoDB query to be executed.
+        sort_fields: str or list of str
+        sort_order: int or list of int of ASCENDING (1) or DESCENDING (-1)
+        page_size : int
+            number of records per request, initial value in adaptive mode
+        adaptive : bool
+            adjust page size to observed latency and response size
+
+        Further arguments are passed on to get_datasets_by_mongo_query."""
+        logger = logging.getLogger(__name__)
+        sort_fields, sort_order = _keyset_sort(sort_fields, sort_order)
+
+        route = 'get_datasets_by_mongo_query'
+        max_page_size = None
+        if adaptive:
+            max_page_size = await self._get_max_page_size()
+            page_size = max(min(page_size, max_page_size), 1)
+
+        last_key = None
+        while True:
+            if last_key is None:
+                page_query = query
+            else:
+                page_query = _after_keyset(query, sort_fields, sort_order, last_key)
+
+            self.statistics.page_sizes[route][page_size] += 1
+            records, elapsed, nbytes = await asyncio.ensure_future(self._fetch_page(
+                self.get_datasets_by_mongo_query, page_query, page_number=1, page_size=page_size,
+                sort_fields=sort_fields, sort_order=sort_order, pagination={}, **kwargs))
+
+            more = len(records) >= page_size
+            if more:
+                # before yielding, to not end a scan halfway without notice
+                last_key = _keyset_key(records[-1], sort_fields)
+
+            for record in records:
+                yield record
+
+            if not more:
+                break
+
+            if adaptive:
+                adapted_page_size = _adapt_page_size(page_size, len(records), elapsed, nbytes, max_page_size)
+                if adapted_page_size != page_size:
+                    logger.debug("Adapt page size of keyset scan from %d to %d.", page_size, adapted_page_size)
+                    page_size = adapted_page_size
+
+    async def iter_datasets(self, free_text=None, creator_usernames=None,
+                            base_uris=None, uuids=None, tags=None,
+                            sort_fields=["uri"], sort_order=[ASCENDING],
+                            page_size=DEFAULT_ITER_PAGE_SIZE, prefetch=DEFAULT_PREFETCH,
+                            sorting={}, adaptive=False, keyset=False):
+        """
+        Iterate over dataset entries on lookup server across all pages.
+
+        Filter and sorting parameters as for get_datasets.
+
+        Parameters
+        ----------
+        page_size : int, optional
+            The number of results per request, default is 100.
+        prefetch : int, optional
+            The number of pages requested ahead while the current page
+            is consumed, default is 1.
+        adaptive : bool, optional
+            Adjust the page size after every page to observed latency and
+            response size, starting from page_size, default is False.
+            Chosen page sizes are recorded in the client's statistics.
+        keyset : bool, optional
+            Request every page as the first page of records sorted after the
+            last record received, via the direct mongo query route, instead of
+            by page number. Keeps the cost per page constant for deep scans and
+            pages stable while datasets are registered. "uri" is appended to
+            the sort fields as unique key if missing. free_text and prefetch
+            are not supported. Default is False.
+
+        Yields
+        ------
+        dict
+            search results
+        """
+        if keyset:
+            if free_text is not None:
+                raise ValueError("Free text search is not supported with keyset pagination.")
+            records = self._iter_keyset(
+                {}, creator_usernames=creator_usernames, base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, sorting=sorting, adaptive=adaptive)
+        else:
+            records = self._iter_pages(
+                self.get_datasets, free_text=free_text, creator_usernames=creator_usernames,
+                base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive)
+
+        async for record in records:
+            yield record
+
+    async def iter_datasets_sharded(self, free_text=None, creator_usernames=None,
+                                    base_uris=None, uuids=None, tags=None,
+                                    sort_fields=["uri"], sort_order=[ASCENDING],
+                                    page_size=DEFAULT_ITER_PAGE_SIZE, prefetch=DEFAULT_PREFETCH,
+                                    adaptive=False):
+        """
+        Iterate over dataset entries with one concurrent listing per base URI.
+
+        Datasets on every base URI are listed by a paginated stream of their
+        own, all streams run concurrently and are merged into one stream
+        sorted by sort_fields and sort_order. Spreads a large listing across
+        server workers. Further parameters as for iter_datasets.
+
+        Parameters
+        ----------
+        base_uris: list of str, optional
+            Base URIs to list datasets on, one stream each. Default are all
+            base URIs as listed by get_base_uris (needs admin privileges).
+
+        Yields
+        ------
+        dict
+            search results
+        """
+        logger = logging.getLogger(__name__)
+        if base_uris is None:
+            base_uris = [base_uri['base_uri'] async for base_uri in self.iter_base_uris()]
+        logger.debug("List datasets on %d base URIs concurrently.", len(base_uris))
+
+        sort_fields, sort_order = _sort_spec(sort_fields, sort_order)
+        shards = [
+            self._iter_pages(
+                self.get_datasets, free_text=free_text, creator_usernames=creator_usernames,
+                base_uris=[base_uri], uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, adaptive=adaptive)
+            for base_uri in base_uris]
+
+        async for record in _merge_sorted(shards, sort_fields, sort_order):
+            yield record
+
+    async def iter_datasets_by_uuid(self, uuid,
+                                    sort_fields=["uri"], sort_order=[ASCENDING],
+                                    page_size=DEFAULT_ITER_PAGE_SIZE, prefetch=DEFAULT_PREFETCH,
+                                    sorting={}, adaptive=False):
+        """
+        Iterate over entries matching a specific UUID across all pages.
+
+        Parameters as for get_datasets_by_uuid and iter_datasets.
+
+        Yields
+        ------
+        dict
+            Query results for the specified UUID.
+        """
+        async for record in self._iter_pages(
+                self.get_datasets_by_uuid, uuid,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive):
+            yield record
+
+    async def iter_users(self, sort_fields=["username"], sort_order=[ASCENDING],
+                         page_size=DEFAULT_ITER_PAGE_SIZE, prefetch=DEFAULT_PREFETCH,
+                         sorting={}, adaptive=False):
+        """
+        Iterate over users across all pages. (Needs admin privileges.)
+
+        Parameters as for get_users and iter_datasets.
+
+        Yields
+        ------
+        dict
+           User information.
+        """
+        async for record in self._iter_pages(
+                self.get_users,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive):
+            yield record
+
+    async def iter_base_uris(self, sort_fields=["base_uri"], sort_order=[ASCENDING],
+                             page_size=DEFAULT_ITER_PAGE_SIZE, prefetch=DEFAULT_PREFETCH,
+                             sorting={}, adaptive=False):
+        """
+        Iterate over registered base URIs across all pages. (Needs admin privileges.)
+
+        Parameters as for get_base_uris and iter_datasets.
+
+        Yields
+        ------
+        dict
+           Registered base URI information.
+        """
+        async for record in self._iter_pages(
+                self.get_base_uris,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive):
+            yield record
+
+    async def iter_datasets_by_mongo_aggregation(self, aggregation,
+                                                 sort_fields=["uri"], sort_order=[ASCENDING],
+                                                 page_size=DEFAULT_ITER_PAGE_SIZE,
+                                                 prefetch=DEFAULT_PREFETCH, sorting={}, adaptive=False):
+        """
+        Iterate over results of a direct MongoDB aggregation across all pages.
+
+        Parameters as for get_datasets_by_mongo_aggregation and iter_datasets.
+
+        Yields
+        ------
+        dict
+            Aggregation results.
+        """
+        if isinstance(aggregation, str):
+            aggregation = json.loads(aggregation)
+
+        async for record in self._iter_pages(
+                self.get_datasets_by_mongo_aggregation, aggregation,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive):
+            yield record
+
+    async def iter_datasets_by_mongo_query(self, query, creator_usernames=None,
+                                           base_uris=None, uuids=None, tags=None,
+                                           sort_fields=["uri"], sort_order=[ASCENDING],
+                                           page_size=DEFAULT_ITER_PAGE_SIZE,
+                                           prefetch=DEFAULT_PREFETCH, sorting={}, adaptive=False,
+                                           keyset=False):
+        """
+        Iterate over results of a direct mongo query across all pages.
+
+        Parameters as for get_datasets_by_mongo_query and iter_datasets.
+
+        Yields
+        ------
+        dict
+            query results
+        """
+        if isinstance(query, str):
+            query = json.loads(query)
+
+        if keyset:
+            records = self._iter_keyset(
+                query, creator_usernames=creator_usernames, base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, sorting=sorting, adaptive=adaptive)
+        else:
+            records = self._iter_pages(
+                self.get_datasets_by_mongo_query, query, creator_usernames=creator_usernames,
+                base_uris=base_uris, uuids=uuids, tags=tags,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive)
+
+        async for record in records:
+            yield record
+
+    async def iter_graph_by_uuid(self, uuid, dependency_keys=None,
+                                 sort_fields=["uri"], sort_order=[ASCENDING],
+                                 page_size=DEFAULT_ITER_PAGE_SIZE, prefetch=DEFAULT_PREFETCH,
+                                 sorting={}, adaptive=False):
+        """
+        Iterate over dependency graph for a specific UUID across all pages.
+
+        Parameters as for get_graph_by_uuid and iter_datasets.
+
+        Yields
+        ------
+        dict
+            Dependency graph results.
+        """
+        async for record in self._iter_pages(
+                self.get_graph_by_uuid, uuid, dependency_keys=dependency_keys,
+                sort_fields=sort_fields, sort_order=sort_order,
+                page_size=page_size, prefetch=prefetch, sorting=sorting, adaptive=adaptive):
+            yield record
+
     # deprecated
 
     @deprecated(replacement="get_config")
@@ -895,7 +2575,7 @@ class UnauthenticatedLookupClient:
         headers = {}
         dataset_list = await self._post(
             f'/uris?page={page_number}&page_size={page_size}',
-            {'free_text': keyword}, headers=headers)
+            {'free_text': keyword}, headers=headers, idempotent=True)
 
         if 'X-Pagination' in headers:
             p = json.loads(headers['X-Pagination'])
@@ -992,10 +2672,11 @@ class UnauthenticatedLookupClient:
 class TokenBasedLookupClient(UnauthenticatedLookupClient):
     """Uses token to authenticate against lookup server."""
 
-    def __init__(self, lookup_url, token=None, verify_ssl=True):
+    def __init__(self, lookup_url, token=None, verify_ssl=True, **kwargs):
+        """Further keyword arguments configure the connection pool, see UnauthenticatedLookupClient."""
         logger = logging.getLogger(__name__)
 
-        super().__init__(lookup_url=lookup_url, verify_ssl=verify_ssl)
+        super().__init__(lookup_url=lookup_url, verify_ssl=verify_ssl, **kwargs)
         self.token = token
 
     async def connect(self):
@@ -1008,48 +2689,108 @@ class TokenBasedLookupClient(UnauthenticatedLookupClient):
 
         logger.debug("Connect to %s, ssl=%s", self.lookup_url, self.verify_ssl)
 
-    async def close(self):
-        """Close session if open."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-
     @property
     def header(self):
         return {'Authorization': f'Bearer {self.token}'}
 
+    async def _handle_unauthorized(self, header):
+        """Do not trust rejected token anymore."""
+        logger = logging.getLogger(__name__)
+        logger.debug("Server rejected token.")
+        if header == self.header and self.token:
+            _distrust_token(self.token)
+        return False
+
+    async def has_valid_token(self):
+        """Determine whether token still valid.
+
+        The token's expiry claim is decoded locally and trusted until
+        TOKEN_EXPIRY_LEEWAY seconds before expiry. Only if there is no such
+        claim or the server has rejected the token before, validity is probed
+        via the /config/info route. Results are memoized per token."""
+        return await self._is_valid_token(self.token)
+
+    async def _is_valid_token(self, token):
+        """Determine whether any token still valid, see has_valid_token."""
+        logger = logging.getLogger(__name__)
+        if token is None or token == "":
+            logger.debug("Token empty.")
+            return False
+
+        now = time.time()
+        if _trusted_tokens.get(token, now) > now:
+            return True
+
+        claims = _decode_jwt_claims(token)
+        if token not in _rejected_tokens and claims is not None and 'exp' in claims:
+            logger.debug("Testing token validity via expiry claim.")
+            trusted_until = float(claims['exp']) - TOKEN_EXPIRY_LEEWAY
+            if trusted_until <= now:
+                logger.debug("Token expired or about to expire.")
+                return False
+            _trust_token(token, trusted_until)
+            return True
+
+        logger.debug("Testing token validity via /config/info route.")
+        await self.create_session()
+        async with self.session.get(
+                f'{self.lookup_url}/config/info',
+                headers={'Authorization': f'Bearer {token}'},
+                ssl=self.ssl_context) as r:
+            status_code = r.status
+            text = await r.text()
+        logger.debug("Server answered with %s: %s.", status_code, yaml.safe_load(text))
+        if status_code != 200:
+            return False
+
+        if claims is not None and 'exp' in claims:
+            trusted_until = float(claims['exp']) - TOKEN_EXPIRY_LEEWAY
+        else:
+            trusted_until = now + TOKEN_PROBE_TTL
+        _trust_token(token, trusted_until)
+        return True
+
 
 class CredentialsBasedLookupClient(TokenBasedLookupClient):
     """Request new token for every session based on user credentials."""
 
     def __init__(self, lookup_url, auth_url, username, password,
-                 verify_ssl=True):
+                 verify_ssl=True, auto_refresh_token=False, **kwargs):
+        """If auto_refresh_token set True, renew token in the background shortly before it expires.
+
+        Further keyword arguments configure the connection pool, see UnauthenticatedLookupClient."""
         logger = logging.getLogger(__name__)
         self.auth_url = auth_url
         self.username = username
         self.password = password
+        self.auto_refresh_token = auto_refresh_token
+
+        self._authentication = None
+        self._token_refresh_task = None
 
-        super().__init__(lookup_url=lookup_url, verify_ssl=verify_ssl)
+        super().__init__(lookup_url=lookup_url, verify_ssl=verify_ssl, **kwargs)
         logger.debug("%s initialized with lookup_url=%s, auth_url=%s, username=%s, ssl=%s",
                      type(self).__name__, self.lookup_url, self.auth_url, self.username, self.verify_ssl)
 
     async def authenticate(self):
-        """Authenticate against token generator and return received token."""
+        """Authenticate against token generator and return received token.
+
+        Raises RuntimeError if authentication fails, but leaves the session
+        open for concurrent requests and later attempts."""
         await self.create_session()
         async with self.session.post(
                 self.auth_url,
                 json={
                     'username': self.username,
                     'password': self.password
-                }, ssl=self.verify_ssl) as r:
+                }, ssl=self.ssl_context) as r:
             if r.status == 200:
                 json = await r.json()
                 if 'token' not in json:
-                    await self.close()
                     raise RuntimeError('Authentication failed')
                 else:
                     return json['token']
             else:
-                await self.close()
                 raise RuntimeError(f'Error {r.status} retrieving data from '
                                    f'authentication server.')
 
@@ -1059,9 +2800,86 @@ class CredentialsBasedLookupClient(TokenBasedLookupClient):
         logger.debug("Connect to lookup_url=%s, auth_url=%s, username=%s, ssl=%s",
                      self.lookup_url, self.auth_url, self.username, self.verify_ssl)
 
-        self.token = await self.authenticate()
+        await self._reauthenticate()
 
         await super().connect()
+        self._start_token_refresh()
+
+    async def close(self):
+        """Stop background token renewal and close session if open."""
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+        await super().close()
+
+    async def _handle_unauthorized(self, header):
+        """Renew rejected token, once for all concurrent callers."""
+        await super()._handle_unauthorized(header)
+        if header == self.header:
+            await self._reauthenticate()
+        # otherwise, token has been renewed meanwhile
+        return True
+
+    async def _acquire_token(self):
+        """Return new token."""
+        return await self.authenticate()
+
+    async def _reauthenticate(self):
+        """Request new token. Concurrent callers share one in-flight authentication."""
+        logger = logging.getLogger(__name__)
+        if self._authentication is None or self._authentication.done():
+            logger.debug("Requesting new token from %s.", self.auth_url)
+
+            async def acquire():
+                self.token = await self._acquire_token()
+
+            self._authentication = asyncio.ensure_future(acquire())
+            # failure is reported to callers, even if all have been cancelled
+            self._authentication.add_done_callback(_retrieve_exception)
+        else:
+            logger.debug("Joining in-flight token request.")
+        await asyncio.shield(self._authentication)
+
+    def _start_token_refresh(self):
+        if self.auto_refresh_token and (self._token_refresh_task is None or self._token_refresh_task.done()):
+            self._token_refresh_task = asyncio.ensure_future(self._refresh_token_in_background())
+
+    async def _refresh_token_in_background(self):
+        """Renew token shortly before it expires for as long as the client lives.
+
+        Failed renewals are retried with exponential backoff."""
+        logger = logging.getLogger(__name__)
+        failures = 0
+        while True:
+            claims = _decode_jwt_claims(self.token)
+            if claims is None or 'exp' not in claims:
+                logger.debug("Token without expiry claim, no background renewal.")
+                return
+
+            expires_at = float(claims['exp'])
+            margin = TOKEN_REFRESH_MARGIN
+            if 'iat' in claims:
+                margin = min(margin, (expires_at - float(claims['iat']))/2)
+
+            delay = expires_at - margin - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue  # token might have been renewed meanwhile
+
+            logger.debug("Renewing token in background.")
+            try:
+                await self._reauthenticate()
+            except Exception as exc:
+                failures += 1
+                retry_interval = min(TOKEN_REFRESH_MIN_INTERVAL*2**(failures - 1),
+                                     TOKEN_REFRESH_MAX_RETRY_INTERVAL)
+                logger.warning("Background token renewal failed: %s, retry in %s s.",
+                               exc, retry_interval)
+                await asyncio.sleep(retry_interval)
+            else:
+                failures = 0
+                await asyncio.sleep(TOKEN_REFRESH_MIN_INTERVAL)
+
 
 class ConfigurationBasedAuthenticatedLookupClient(CredentialsBasedLookupClient):
     """Use configured token if available and valid or request new token with credentials if provided."""
@@ -1074,17 +2892,20 @@ class ConfigurationBasedAuthenticatedLookupClient(CredentialsBasedLookupClient):
                  username=None,
                  password=None,
                  verify_ssl=None,
-                 cache_token=True):
+                 cache_token=True,
+                 auto_refresh_token=False,
+                 **kwargs):
+        """Further keyword arguments configure the connection pool, see UnauthenticatedLookupClient.
+        Connection pool options not specified are read from the configuration."""
         logger = logging.getLogger(__name__)
         # In order to avoid unwanted side effects, it is necessry to assign defaults as below
 
         if lookup_url is None:
-            lookup_url = Config.lookup_url
+            lookup_url = config.Config.lookup_url
         if auth_url is None:
-            auth_url = Config.auth_url
+            auth_url = config.Config.auth_url
         if verify_ssl is None:
-            verify_ssl = Config.verify_ssl
-
+            verify_ssl = config.Config.verify_ssl
 
         logger.debug("Initializing %s with lookup_url=%s, auth_url=%s, username=%s, ssl=%s, cache_token=%s",
                      type(self).__name__, lookup_url, auth_url, username, verify_ssl, cache_token)
@@ -1096,9 +2917,11 @@ class ConfigurationBasedAuthenticatedLookupClient(CredentialsBasedLookupClient):
             auth_url=auth_url,
             username=username,
             password=password,
-            verify_ssl=verify_ssl)
+            verify_ssl=verify_ssl,
+            auto_refresh_token=auto_refresh_token,
+            **_configured_connection_options(kwargs))
 
-        self.token = Config.token
+        self.token = config.Config.token
         logger.debug("%s initialized with lookup_url=%s, auth_url=%s, username=%s, ssl=%s, cache_token=%s",
                      type(self).__name__, self.lookup_url, self.auth_url,
                      self.username, self.verify_ssl, self.cache_token)
@@ -1107,42 +2930,49 @@ class ConfigurationBasedAuthenticatedLookupClient(CredentialsBasedLookupClient):
         """Establish connection."""
         logger = logging.getLogger(__name__)
         if self.token is None or self.token == "":
-            self.token = Config.token
+            self.token = config.Config.token
 
         if await self.has_valid_token():
             logger.debug("Reusing provided token.")
             await TokenBasedLookupClient.connect(self)
+            self._start_token_refresh()
         else:
-            # only look for username and password if really necessry
-            if self.username is None:
-                self.username = Config.username
-            if self.password is None:
-                self.password = Config.password
             logger.debug("Requesting new token.")
             await CredentialsBasedLookupClient.connect(self)
 
-        if self.cache_token:
-            logger.debug("Caching token.")
-            Config.token = self.token
+    async def _acquire_token(self):
+        """Return new token and cache it in configuration if desired.
 
-    # TODO: Replace with something more elegant.
-    async def has_valid_token(self):
-        """Determine whether token still valid."""
+        With token caching, authentication is single-flight across processes
+        sharing the same config file: the first process holding the config
+        file lock authenticates and stores its token, the others reuse it."""
         logger = logging.getLogger(__name__)
-        if self.token is None or self.token == "":
-            logger.debug("Token empty.")
-            return False
-        else:
-            logger.debug("Testing token validity via /config/info route.")
-            await self.create_session()
-            async with self.session.get(
-                    f'{self.lookup_url}/config/info',
-                    headers=self.header,
-                    ssl=self.verify_ssl) as r:
-                status_code = r.status
-                text = await r.text()
-            logger.debug("Server answered with %s: %s.", status_code, yaml.safe_load(text))
-            return status_code == 200
+        if not self.cache_token:
+            return await self._authenticate_with_configured_credentials()
+
+        rejected_token = self.token
+        lock = config.Config.lock()
+        await _acquire_lock(lock)
+        try:
+            cached_token = config.Config.token
+            if cached_token != rejected_token and await self._is_valid_token(cached_token):
+                logger.debug("Reusing token cached by another client.")
+                return cached_token
+
+            token = await self._authenticate_with_configured_credentials()
+            logger.debug("Caching token.")
+            config.Config.write_value(DSERVER_TOKEN_KEY, token, lock=False)
+            return token
+        finally:
+            lock.release()
+
+    async def _authenticate_with_configured_credentials(self):
+        # only look for username and password if really necessry
+        if self.username is None:
+            self.username = config.Config.username
+        if self.password is None:
+            self.password = config.Config.password
+        return await self.authenticate()
 
 
 class ConfigurationBasedLookupClient():
@@ -1155,7 +2985,9 @@ class ConfigurationBasedLookupClient():
                 password=None,
                 verify_ssl=None,
                 disable_authentication=None,
-                cache_token=True):
+                cache_token=True,
+                auto_refresh_token=False,
+                **kwargs):
         """
         Decide which LookupClient subclass to instantiate.
 
@@ -1165,23 +2997,26 @@ class ConfigurationBasedLookupClient():
 
         # Resolve configuration if not given explicitly
         if lookup_url is None:
-            lookup_url = Config.lookup_url
+            lookup_url = config.Config.lookup_url
         if auth_url is None:
-            auth_url = Config.auth_url
+            auth_url = config.Config.auth_url
         if verify_ssl is None:
-            verify_ssl = Config.verify_ssl
+            verify_ssl = config.Config.verify_ssl
         if disable_authentication is None:
-            disable_authentication = Config.disable_authentication
+            disable_authentication = config.Config.disable_authentication
 
         if disable_authentication is True:
-            return UnauthenticatedLookupClient(lookup_url=lookup_url, verify_ssl=verify_ssl)
+            return UnauthenticatedLookupClient(lookup_url=lookup_url, verify_ssl=verify_ssl,
+                                               **_configured_connection_options(kwargs))
         else:
             return ConfigurationBasedAuthenticatedLookupClient(lookup_url=lookup_url,
                                                                auth_url=auth_url,
                                                                username=username,
                                                                password=password,
                                                                verify_ssl=verify_ssl,
-                                                               cache_token=cache_token)
+                                                               cache_token=cache_token,
+                                                               auto_refresh_token=auto_refresh_token,
+                                                               **kwargs)
 
     def __init__(self, *args, **kwargs):
         # __init__ won’t actually be called for the subclasses (they have their own __init__)
@@ -0,0 +1,195 @@
+#
+# Copyright 2020 Lars Pastewka, Johannes Laurin Hoermann
+#
+# ### MIT license
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""dtool_lookup_api.core.PagedSequence module."""
+
+import asyncio
+import collections
+import collections.abc
+import logging
+import threading
+
+# pages kept in memory per sequence by default
+DEFAULT_MAX_CACHED_PAGES = 16
+# pages requested concurrently at most per access by default
+DEFAULT_CONCURRENCY = 8
+
+
+class PagedSequence(collections.abc.Sequence):
+    """Read-only random-access view on all results of a paginated route.
+
+    The length is the total reported by the server for the first page.
+    Indexing and slicing request only the pages covering the requested
+    range, concurrently, and keep the most recently used pages in a bounded
+    cache. Slices are returned as lists.
+
+    Pages not cached yet can only be requested synchronously if a runner
+    executing coroutines to completion has been attached, as done by the
+    synchronous API. Within asynchronous code, ``await sequence.fetch(key)``
+    instead."""
+
+    def __init__(self, fetch_page, page_size, total, first_page=None,
+                 max_cached_pages=DEFAULT_MAX_CACHED_PAGES, runner=None,
+                 concurrency=DEFAULT_CONCURRENCY):
+        """
+        Parameters
+        ----------
+        fetch_page : coroutine function
+            returns list of records for page number
+        page_size : int
+            number of records per page
+        total : int
+            total number of records
+        first_page : list, optional
+            records of page 1, if already available
+        max_cached_pages : int, default 16
+            number of pages kept in memory
+        runner : callable, optional
+            runs coroutine to completion and returns its result
+        concurrency : int, default 8
+            number of pages requested concurrently at most per access
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be positive, got {page_size}.")
+        self._fetch_page = fetch_page
+        self.page_size = page_size
+        self.total = total
+        self.max_cached_pages = max(max_cached_pages, 1)
+        self.runner = runner
+        self.concurrency = max(concurrency, 1)
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self._pages = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if first_page is not None:
+            self._remember(1, first_page)
+
+    def __len__(self):
+        return self.total
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(total={self.total}, page_size={self.page_size}, "
+                f"cached_pages={len(self._pages)})")
+
+    def __getitem__(self, key):
+        indices = self._indices(key)
+        pages = self._cached({self._page_number(i) for i in indices})
+        if pages is None:
+            if self.runner is None:
+                raise RuntimeError(
+                    f"Pages for {key!r} not cached, use 'await sequence.fetch(key)' "
+                    f"within asynchronous code.")
+            return self.runner(self.fetch(key))
+        return self._select(key, indices, pages)
+
+    async def fetch(self, key):
+        """Return record at index or list of records in slice, requesting missing pages."""
+        logger = logging.getLogger(__name__)
+        indices = self._indices(key)
+        page_numbers = sorted({self._page_number(i) for i in indices})
+
+        pages = {}
+        missing = []
+        with self._lock:
+            for page_number in page_numbers:
+                if page_number in self._pages:
+                    self._pages.move_to_end(page_number)
+                    pages[page_number] = self._pages[page_number]
+                    self.cache_hits += 1
+                else:
+                    missing.append(page_number)
+                    self.cache_misses += 1
+
+        if missing:
+            logger.debug("Request pages %s for %r, %d at a time.", missing, key, self.concurrency)
+            # created per access, as sequences may be accessed from several event loops
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def fetch_page(page_number):
+                async with semaphore:
+                    return await self._fetch_page(page_number)
+
+            tasks = [asyncio.ensure_future(fetch_page(p)) for p in missing]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            for page_number, records in zip(missing, results):
+                self._remember(page_number, records)
+                pages[page_number] = records
+
+        return self._select(key, indices, pages)
+
+    def clear_cache(self):
+        with self._lock:
+            self._pages.clear()
+
+    def _indices(self, key):
+        if isinstance(key, slice):
+            return range(*key.indices(self.total))
+        index = key.__index__()
+        if index < 0:
+            index += self.total
+        if not 0 <= index < self.total:
+            raise IndexError(f"{type(self).__name__} index {key} out of range.")
+        return range(index, index + 1)
+
+    def _page_number(self, index):
+        return index // self.page_size + 1
+
+    def _cached(self, page_numbers):
+        """Return cached pages by number if all are cached, otherwise None."""
+        with self._lock:
+            if not all(p in self._pages for p in page_numbers):
+                return None
+            for page_number in page_numbers:
+                self._pages.move_to_end(page_number)
+            self.cache_hits += len(page_numbers)
+            return {p: self._pages[p] for p in page_numbers}
+
+    def _remember(self, page_number, records):
+        with self._lock:
+            self._pages[page_number] = records
+            self._pages.move_to_end(page_number)
+            while len(self._pages) > self.max_cached_pages:
+                self._pages.popitem(last=False)
+
+    def _select(self, key, indices, pages):
+        records = []
+        for index in indices:
+            page = pages[self._page_number(index)]
+            offset = index % self.page_size
+            if offset >= len(page):
+                # server holds fewer records than reported initially
+                raise IndexError(f"{type(self).__name__} index {index} beyond records on server.")
+            records.append(page[offset])
+        if isinstance(key, slice):
+            return records
+        return records[0]
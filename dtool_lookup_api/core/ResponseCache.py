@@ -0,0 +1,113 @@
+#
+# Copyright 2020 Lars Pastewka, Johannes Laurin Hoermann
+#
+# ### MIT license
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""dtool_lookup_api.core.ResponseCache module."""
+
+import collections
+import time
+
+
+class ResponseCache:
+    """Decoded responses kept up to a time to live, bounded in size.
+
+    Entries are evicted least recently used first as soon as the total size
+    of all entries exceeds max_bytes. Expired entries are dropped when
+    accessed. Only to be used from one event loop."""
+
+    def __init__(self, max_bytes, clock=time.monotonic):
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            total size of all entries at most, entries larger than that are
+            not cached at all
+        clock : callable, default time.monotonic
+            returns current time in seconds
+        """
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key -> (value, size, expiry time)
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self._lookup(key) is not None
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] <= self.clock():
+            self._remove(key)
+            entry = None
+        return entry
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.nbytes -= size
+
+    def get(self, key, default=None):
+        """Return unexpired value for key and mark it recently used."""
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, size, ttl):
+        """Store value of size in bytes for ttl seconds."""
+        if key in self._entries:
+            self._remove(key)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        self._entries[key] = (value, size, self.clock() + ttl)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def discard(self, predicate):
+        """Remove all entries whose key satisfies predicate."""
+        for key in [key for key in self._entries if predicate(key)]:
+            self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def as_dict(self):
+        return {
+            'entries': len(self._entries),
+            'nbytes': self.nbytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -24,12 +24,23 @@
 
 """dtool_lookup_api.core.config module."""
 
+import collections
+import json
 import logging
+import os
+import tempfile
+import threading
+import types
 
 from getpass import getpass
 
 import dtoolcore.utils
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
 CONFIG_PATH = dtoolcore.utils.DEFAULT_CONFIG_PATH
 
 DSERVER_URL_KEY = "DSERVER_URL"
@@ -39,12 +50,145 @@ DSERVER_USERNAME_KEY = "DSERVER_USERNAME"
 DSERVER_PASSWORD_KEY = "DSERVER_PASSWORD"
 DSERVER_VERIFY_SSL_KEY = "DSERVER_VERIFY_SSL"
 DSERVER_DISABLE_AUTHENTICATION_KEY = "DSERVER_DISABLE_AUTHENTICATION"
+DSERVER_CONNECTION_LIMIT_KEY = "DSERVER_CONNECTION_LIMIT"
+DSERVER_CONNECTION_LIMIT_PER_HOST_KEY = "DSERVER_CONNECTION_LIMIT_PER_HOST"
+DSERVER_KEEPALIVE_TIMEOUT_KEY = "DSERVER_KEEPALIVE_TIMEOUT"
+DSERVER_DNS_CACHE_TTL_KEY = "DSERVER_DNS_CACHE_TTL"
+DSERVER_FORCE_CLOSE_KEY = "DSERVER_FORCE_CLOSE"
+DSERVER_UNIX_SOCKET_KEY = "DSERVER_UNIX_SOCKET"
+DSERVER_CACHE_SIZE_KEY = "DSERVER_CACHE_SIZE"
+
+# connection pool defaults, same as aiohttp's
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0  # unlimited
+DEFAULT_KEEPALIVE_TIMEOUT = 15
+DEFAULT_DNS_CACHE_TTL = 10
+
+# response cache disabled by default
+DEFAULT_CACHE_SIZE = 0
+
+# environment variables that may override config file values
+CONFIG_KEYS = [
+    DSERVER_URL_KEY,
+    DSERVER_TOKEN_GENERATOR_URL_KEY,
+    DSERVER_USERNAME_KEY,
+    DSERVER_PASSWORD_KEY,
+    DSERVER_VERIFY_SSL_KEY,
+    DSERVER_DISABLE_AUTHENTICATION_KEY,
+    DSERVER_CONNECTION_LIMIT_KEY,
+    DSERVER_CONNECTION_LIMIT_PER_HOST_KEY,
+    DSERVER_KEEPALIVE_TIMEOUT_KEY,
+    DSERVER_DNS_CACHE_TTL_KEY,
+    DSERVER_FORCE_CLOSE_KEY,
+    DSERVER_UNIX_SOCKET_KEY,
+    DSERVER_CACHE_SIZE_KEY,
+]
 
 AFFIRMATIVE_EXPRESSIONS = ['true', '1', 'y', 'yes', 'on']
 NEGATIVE_EXPRESSIONS = ['false', '0', 'n', 'no', 'off']
 
 logger = logging.getLogger(__name__)
 
+
+class ConfigFileLock():
+    """Advisory inter-process lock guarding the dtool config file.
+
+    Not reentrant. Without fcntl, i.e. on Windows, locking is a no-op."""
+
+    def __init__(self, config_path=None):
+        if config_path is None:
+            config_path = CONFIG_PATH
+        self.path = config_path + '.lock'
+        self._fd = None
+
+    def acquire(self, blocking=True):
+        """Acquire lock, return False if not blocking and lock held elsewhere."""
+        if fcntl is None:
+            return True
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+
+def _read_config_file(config_path):
+    """Return content of JSON config file, empty if file does not exist."""
+    try:
+        with open(config_path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_config_file(config_path, config):
+    """Replace JSON config file atomically, readable by owner only."""
+    dirname = os.path.dirname(config_path)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix='.dtool.json.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(config, f, sort_keys=True, indent=2)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _as_number(value, number_type, default, key):
+    """Convert configured value to number, fall back to default if not possible."""
+    if value is None or value == "":
+        return default
+    try:
+        return number_type(value)
+    except (TypeError, ValueError):
+        logger.warning("Cannot interpret %s=%s as number, use default %s.", key, value, default)
+        return default
+
+
+# Immutable view on config file content (file_values) and file content
+# overridden by environment variables (values). The signature identifies the
+# state of config file and environment the snapshot has been taken from.
+_ConfigSnapshot = collections.namedtuple('_ConfigSnapshot', ['signature', 'file_values', 'values'])
+
+
+def _config_signature(config_path):
+    """Config file path and stats together with relevant environment variables."""
+    try:
+        stat = os.stat(config_path)
+        file_signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_signature = None
+    return (config_path, file_signature, tuple(os.environ.get(key) for key in CONFIG_KEYS))
+
+
+def _take_config_snapshot(signature, file_values):
+    values = dict(file_values)
+    for key, value in zip(CONFIG_KEYS, signature[2]):
+        if value is not None:
+            values[key] = value
+    return _ConfigSnapshot(signature, types.MappingProxyType(dict(file_values)), types.MappingProxyType(values))
+
+
 class DtoolLookupAPIConfig():
     """Connect to dserver session."""
 
@@ -52,6 +196,8 @@ class DtoolLookupAPIConfig():
         """If interactive set True, allow prompting for username and password.
            If cache set True, store entered username and password entered during
            runtime."""
+        self._snapshot = None
+
         if logger.level >= logging.DEBUG:  # only query properties if output desired
             for attr in ('lookup_url', 'auth_url', 'username', 'verify_ssl'):
                 logger.debug("dtool config %s: %s", attr, getattr(self, attr, None))
@@ -72,39 +218,79 @@ class DtoolLookupAPIConfig():
 
         self.interactive = interactive
 
+    def lock(self):
+        """Return new advisory inter-process lock on the config file."""
+        return ConfigFileLock(CONFIG_PATH)
+
+    def write_value(self, key, value, lock=True):
+        """Write value to config file if it differs from the value stored there.
+
+        If lock set True, hold the config file lock while writing. Set False
+        only if lock already held."""
+        if lock:
+            with self.lock():
+                return self.write_value(key, value, lock=False)
+
+        config = _read_config_file(CONFIG_PATH)
+        if key in config and config[key] == value:
+            logger.debug("%s unchanged, not written.", key)
+            return
+        config[key] = value
+        _write_config_file(CONFIG_PATH, config)
+        self._snapshot = _take_config_snapshot(_config_signature(CONFIG_PATH), config)
+
+    @property
+    def snapshot(self):
+        """Current immutable snapshot of config file and environment.
+
+        The config file is only read again if its inode, modification time or
+        size, or any of the relevant environment variables have changed."""
+        signature = _config_signature(CONFIG_PATH)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.signature != signature:
+            logger.debug("Reading config file %s.", CONFIG_PATH)
+            snapshot = _take_config_snapshot(signature, _read_config_file(CONFIG_PATH))
+            self._snapshot = snapshot
+        return snapshot
+
+    def get_value(self, key, default=None):
+        """Get configuration value from environment or config file, in this order."""
+        if key not in CONFIG_KEYS and key in os.environ:
+            return os.environ[key]
+        return self.snapshot.values.get(key, default)
+
     @property
     def lookup_url(self):
-        lookup_url = dtoolcore.utils.get_config_value(DSERVER_URL_KEY)
+        lookup_url = self.get_value(DSERVER_URL_KEY)
         if lookup_url is None:
             logger.warning('Please provide %s', DSERVER_URL_KEY)
         return lookup_url
 
     @lookup_url.setter
     def lookup_url(self, value):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_URL_KEY, value)
+        self.write_value(DSERVER_URL_KEY, value)
 
     # optional
     @property
     def token(self):
-        return dtoolcore.utils.get_config_value_from_file(
-            DSERVER_TOKEN_KEY, default="")
+        return self.snapshot.file_values.get(DSERVER_TOKEN_KEY, "")
 
     @token.setter
     def token(self, token):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_TOKEN_KEY, token)
+        self.write_value(DSERVER_TOKEN_KEY, token)
 
     @property
     def auth_url(self):
-        return dtoolcore.utils.get_config_value(DSERVER_TOKEN_GENERATOR_URL_KEY, default="")
+        return self.get_value(DSERVER_TOKEN_GENERATOR_URL_KEY, default="")
 
     @auth_url.setter
     def auth_url(self, value):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_TOKEN_GENERATOR_URL_KEY, value)
+        self.write_value(DSERVER_TOKEN_GENERATOR_URL_KEY, value)
 
     @property
     def username(self):
         if self._username_cache is None:
-            username = dtoolcore.utils.get_config_value(DSERVER_USERNAME_KEY)
+            username = self.get_value(DSERVER_USERNAME_KEY)
             if username is None and self.interactive:
                 username = input("Authentication URL {:s} username:".format(self.auth_url))
             if self.cache:
@@ -115,12 +301,12 @@ class DtoolLookupAPIConfig():
 
     @username.setter
     def username(self, value):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_USERNAME_KEY, value)
+        self.write_value(DSERVER_USERNAME_KEY, value)
 
     @property
     def password(self):
         if self._password_cache is None:
-            password = dtoolcore.utils.get_config_value(DSERVER_PASSWORD_KEY)
+            password = self.get_value(DSERVER_PASSWORD_KEY)
             if password is None and self.interactive:
                 password = getpass("Authentication URL {:s} password:".format(self.auth_url))
             if self.cache:
@@ -131,11 +317,11 @@ class DtoolLookupAPIConfig():
 
     @password.setter
     def password(self, value):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_PASSWORD_KEY, value)
+        self.write_value(DSERVER_PASSWORD_KEY, value)
 
     @property
     def verify_ssl(self):
-        verify_ssl = dtoolcore.utils.get_config_value(DSERVER_VERIFY_SSL_KEY)
+        verify_ssl = self.get_value(DSERVER_VERIFY_SSL_KEY)
         if isinstance(verify_ssl, str) and verify_ssl.lower() in NEGATIVE_EXPRESSIONS:
             verify_ssl = False
         elif not isinstance(verify_ssl, bool):
@@ -144,12 +330,12 @@ class DtoolLookupAPIConfig():
 
     @verify_ssl.setter
     def verify_ssl(self, value):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_VERIFY_SSL_KEY,
-                                                   AFFIRMATIVE_EXPRESSIONS[0] if value else NEGATIVE_EXPRESSIONS[0])
+        self.write_value(DSERVER_VERIFY_SSL_KEY,
+                         AFFIRMATIVE_EXPRESSIONS[0] if value else NEGATIVE_EXPRESSIONS[0])
 
     @property
     def disable_authentication(self):
-        disable_authentication = dtoolcore.utils.get_config_value(DSERVER_DISABLE_AUTHENTICATION_KEY)
+        disable_authentication = self.get_value(DSERVER_DISABLE_AUTHENTICATION_KEY)
         if isinstance(disable_authentication, str) and disable_authentication.lower() in NEGATIVE_EXPRESSIONS:
             disable_authentication = False
         elif not isinstance(disable_authentication, bool):
@@ -158,8 +344,95 @@ class DtoolLookupAPIConfig():
 
     @disable_authentication.setter
     def disable_authentication(self, value):
-        dtoolcore.utils.write_config_value_to_file(DSERVER_DISABLE_AUTHENTICATION_KEY,
-                                                   AFFIRMATIVE_EXPRESSIONS[0] if value else NEGATIVE_EXPRESSIONS[0])
+        self.write_value(DSERVER_DISABLE_AUTHENTICATION_KEY,
+                         AFFIRMATIVE_EXPRESSIONS[0] if value else NEGATIVE_EXPRESSIONS[0])
+
+    @property
+    def connection_limit(self):
+        """Maximum number of simultaneous connections, 0 for no limit."""
+        return _as_number(self.get_value(DSERVER_CONNECTION_LIMIT_KEY), int,
+                          DEFAULT_CONNECTION_LIMIT, DSERVER_CONNECTION_LIMIT_KEY)
+
+    @connection_limit.setter
+    def connection_limit(self, value):
+        self.write_value(DSERVER_CONNECTION_LIMIT_KEY, value)
+
+    @property
+    def connection_limit_per_host(self):
+        """Maximum number of simultaneous connections to one host, 0 for no limit."""
+        return _as_number(self.get_value(DSERVER_CONNECTION_LIMIT_PER_HOST_KEY), int,
+                          DEFAULT_CONNECTION_LIMIT_PER_HOST, DSERVER_CONNECTION_LIMIT_PER_HOST_KEY)
+
+    @connection_limit_per_host.setter
+    def connection_limit_per_host(self, value):
+        self.write_value(DSERVER_CONNECTION_LIMIT_PER_HOST_KEY, value)
+
+    @property
+    def keepalive_timeout(self):
+        """Seconds an idle connection is kept open for reuse."""
+        return _as_number(self.get_value(DSERVER_KEEPALIVE_TIMEOUT_KEY), float,
+                          DEFAULT_KEEPALIVE_TIMEOUT, DSERVER_KEEPALIVE_TIMEOUT_KEY)
+
+    @keepalive_timeout.setter
+    def keepalive_timeout(self, value):
+        self.write_value(DSERVER_KEEPALIVE_TIMEOUT_KEY, value)
+
+    @property
+    def dns_cache_ttl(self):
+        """Seconds resolved host names are cached."""
+        return _as_number(self.get_value(DSERVER_DNS_CACHE_TTL_KEY), int,
+                          DEFAULT_DNS_CACHE_TTL, DSERVER_DNS_CACHE_TTL_KEY)
+
+    @dns_cache_ttl.setter
+    def dns_cache_ttl(self, value):
+        self.write_value(DSERVER_DNS_CACHE_TTL_KEY, value)
+
+    @property
+    def force_close(self):
+        """Close connections after each request instead of keeping them alive."""
+        force_close = self.get_value(DSERVER_FORCE_CLOSE_KEY)
+        if isinstance(force_close, str) and force_close.lower() in AFFIRMATIVE_EXPRESSIONS:
+            force_close = True
+        elif not isinstance(force_close, bool):
+            force_close = False
+        return force_close
+
+    @force_close.setter
+    def force_close(self, value):
+        self.write_value(DSERVER_FORCE_CLOSE_KEY,
+                         AFFIRMATIVE_EXPRESSIONS[0] if value else NEGATIVE_EXPRESSIONS[0])
+
+    @property
+    def unix_socket(self):
+        """Path of unix domain socket to connect to dserver through, if any."""
+        return self.get_value(DSERVER_UNIX_SOCKET_KEY) or None
+
+    @unix_socket.setter
+    def unix_socket(self, value):
+        self.write_value(DSERVER_UNIX_SOCKET_KEY, value or "")
+
+    @property
+    def cache_size(self):
+        """Bytes of responses cached in memory at most, 0 for no cache."""
+        return _as_number(self.get_value(DSERVER_CACHE_SIZE_KEY), int,
+                          DEFAULT_CACHE_SIZE, DSERVER_CACHE_SIZE_KEY)
+
+    @cache_size.setter
+    def cache_size(self, value):
+        self.write_value(DSERVER_CACHE_SIZE_KEY, value)
+
+
+# The module-level Config instance is only constructed at first access,
+# as construction inspects the configuration and may log warnings.
+_config = None
+_config_lock = threading.Lock()
 
 
-Config = DtoolLookupAPIConfig()
+def __getattr__(name):
+    global _config
+    if name == 'Config':
+        with _config_lock:
+            if _config is None:
+                _config = DtoolLookupAPIConfig()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
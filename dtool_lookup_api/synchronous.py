@@ -22,13 +22,124 @@
 # SOFTWARE.
 #
 
-"""Module that has synchronous API access functions in its global scope."""
+"""Module that has synchronous API access functions in its global scope.
 
+All functions share one long-lived client per configuration (lookup URL,
+token generator URL, credentials, SSL verification and unix socket). Clients are created
+lazily at first use, keep their connection pool open between calls and are
+closed at interpreter exit.
+
+Iterators over all pages of paginated routes, e.g. ``iter_datasets``, are
+plain generators. They pass records from the event loop thread to the
+calling thread one page at a time, while following pages are prefetched.
+Iterators over bulk requests, e.g. ``iter_manifests_by_uris``, pass every
+result as soon as it arrives.
+"""
+
+import asyncio
+import atexit
 import inspect
-from asgiref.sync import async_to_sync
+import logging
+import os
 
+from .core.config import (
+    DSERVER_URL_KEY,
+    DSERVER_TOKEN_GENERATOR_URL_KEY,
+    DSERVER_USERNAME_KEY,
+    DSERVER_PASSWORD_KEY,
+    DSERVER_VERIFY_SSL_KEY,
+    DSERVER_UNIX_SOCKET_KEY
+)
+from .core.EventLoopThread import EventLoopThread
+from .core.PagedSequence import PagedSequence
 from .core.LookupClient import ConfigurationBasedAuthenticatedLookupClient
 
+CLIENT_CONFIG_KEYS = [
+    DSERVER_URL_KEY,
+    DSERVER_TOKEN_GENERATOR_URL_KEY,
+    DSERVER_USERNAME_KEY,
+    DSERVER_PASSWORD_KEY,
+    DSERVER_VERIFY_SSL_KEY,
+    DSERVER_UNIX_SOCKET_KEY
+]
+
+logger = logging.getLogger(__name__)
+
+# all synchronous calls, from whatever thread, execute on this loop
+_event_loop_thread = EventLoopThread()
+
+# only ever accessed from within the event loop thread
+_clients = {}
+_clients_lock = None
+
+
+def _run(coro):
+    """Run coroutine to completion on the module's persistent event loop thread."""
+    return _event_loop_thread.run(coro)
+
+
+def _client_key():
+    """Configuration values that identify a persistent client."""
+    from .core.config import Config
+    return tuple(Config.get_value(key) for key in CLIENT_CONFIG_KEYS)
+
+
+def _is_usable(lookup_client):
+    return lookup_client is not None and lookup_client.session is not None and not lookup_client.session.closed
+
+
+async def _get_client():
+    """Return connected persistent client for the current configuration."""
+    global _clients_lock
+    key = _client_key()
+    lookup_client = _clients.get(key)
+    if _is_usable(lookup_client) and await lookup_client.has_valid_token():
+        return lookup_client
+
+    if _clients_lock is None:
+        _clients_lock = asyncio.Lock()
+
+    # only one caller (re)connects, the others wait and reuse its client
+    async with _clients_lock:
+        lookup_client = _clients.get(key)
+        if not _is_usable(lookup_client):
+            logger.debug("Create persistent client.")
+            lookup_client = ConfigurationBasedAuthenticatedLookupClient(auto_refresh_token=True)
+            try:
+                await lookup_client.__aenter__()
+            except BaseException:
+                await lookup_client.close()
+                raise
+            _clients[key] = lookup_client
+        elif not await lookup_client.has_valid_token():
+            logger.debug("Token of persistent client invalid, reconnect.")
+            await lookup_client.connect()
+
+    return lookup_client
+
+
+async def _close_clients():
+    while _clients:
+        _, lookup_client = _clients.popitem()
+        await lookup_client.close()
+
+
+@atexit.register
+def _shutdown():
+    """Close all persistent clients and stop the event loop thread."""
+    _event_loop_thread.stop(_close_clients())
+
+
+def _reset_after_fork():
+    """Forget clients bound to the parent process' event loop."""
+    global _clients_lock
+    _clients.clear()
+    _clients_lock = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 class _WrapClient:
     def __init__(self, name, func):
@@ -36,14 +147,65 @@ class _WrapClient:
         self._func = func
         self.__doc__ = self._func.__doc__
 
-    @async_to_sync
-    async def __call__(self, *args, **kwargs):
-        async with ConfigurationBasedAuthenticatedLookupClient() as lookup_client:
-            return await self._func(lookup_client, *args, **kwargs)
+    def __call__(self, *args, **kwargs):
+        result = _run(self._call(*args, **kwargs))
+        if isinstance(result, PagedSequence):
+            # request further pages on the persistent event loop thread
+            result.runner = _run
+        return result
+
+    async def _call(self, *args, **kwargs):
+        lookup_client = await _get_client()
+        return await self._func(lookup_client, *args, **kwargs)
+
+
+async def _next_batch(async_iterator, size):
+    """Collect up to size records from async iterator, fewer only at its end."""
+    batch = []
+    async for record in async_iterator:
+        batch.append(record)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+class _WrapClientIterator(_WrapClient):
+    def __init__(self, name, func):
+        super().__init__(name, func)
+        # iterators over pages hand over one page per round trip to the event
+        # loop thread, others, e.g. over bulk requests, every single result
+        page_size = inspect.signature(func).parameters.get('page_size')
+        self._batch_size = page_size.default if page_size is not None else 1
+
+    def __call__(self, *args, **kwargs):
+        return self._iterate(*args, **kwargs)
+
+    def _iterate(self, *args, **kwargs):
+        batch_size = kwargs.get('page_size', self._batch_size)
+        async_iterator = self._iterate_async(*args, **kwargs)
+        try:
+            while True:
+                batch = _run(_next_batch(async_iterator, batch_size))
+                yield from batch
+                if len(batch) < batch_size:
+                    break
+        finally:
+            # stops prefetching if the caller abandons the generator early
+            if _event_loop_thread.is_running():
+                _run(async_iterator.aclose())
+
+    async def _iterate_async(self, *args, **kwargs):
+        lookup_client = await _get_client()
+        async for record in self._func(lookup_client, *args, **kwargs):
+            yield record
 
 
 # Import all methods from ConfigurationBasedLookupClient into the global namespace
 for name, func in inspect.getmembers(ConfigurationBasedAuthenticatedLookupClient, predicate=inspect.isfunction):
     # Import everything that does not start with an underscore
-    if not name.startswith('_'):
+    if name.startswith('_'):
+        continue
+    if inspect.isasyncgenfunction(func):
+        globals()[name] = _WrapClientIterator(name, func)
+    else:
         globals()[name] = _WrapClient(name, func)
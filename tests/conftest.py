@@ -2,9 +2,14 @@
 
 # TODO: Tests for different authentication mechanisms
 
+import asyncio
+
 import pytest
 
+import dtoolcore.utils
+
 from environ import TemporaryOSEnviron
+from stand_in_server import StandInServer, make_dataset, USERNAME, PASSWORD
 
 
 def pytest_addoption(parser):
@@ -53,8 +58,8 @@ def dtool_config(monkeypatch, dserver_config_cli_argument):
         yield dtool_config
 
         from dtool_lookup_api.synchronous import (
-            delete_base_uri,
-            delete_dataset
+            delete_base_uris,
+            delete_datasets
         )
 
         datasets = [
@@ -63,8 +68,7 @@ def dtool_config(monkeypatch, dserver_config_cli_argument):
             "s3://testsorting1/1a1f9fad-8589-413e-9602-5bbd66bfe679"
         ]
 
-        for dataset in datasets:
-            delete_dataset(dataset)
+        delete_datasets(datasets)
 
         base_uris = [
             "s3://test-1",
@@ -73,5 +77,58 @@ def dtool_config(monkeypatch, dserver_config_cli_argument):
             "s3://testsorting1"
         ]
 
-        for base_uri in base_uris:
-            delete_base_uri(base_uri)
+        delete_base_uris(base_uris)
+
+
+STAND_IN_DATASETS = [
+    make_dataset(base_uri, f"{i:08d}-0000-4000-8000-{j:012d}")
+    for i, (base_uri, n) in enumerate([
+        ("s3://stand-in-bucket-1", 12),
+        ("s3://stand-in-bucket-2", 5),
+        ("smb://stand-in-share", 8)])
+    for j in range(n)
+]
+
+
+@pytest.fixture
+def stand_in_server():
+    """Provide local in-process stand-in for dserver."""
+    with StandInServer(datasets=STAND_IN_DATASETS) as server:
+        yield server
+
+
+def run_with_client(server, func, **kwargs):
+    """Run coroutine function func(lookup_client) with a client connected to server.
+
+    Further keyword arguments are passed on to the client."""
+    from dtool_lookup_api.core.LookupClient import TokenBasedLookupClient
+
+    async def run():
+        async with TokenBasedLookupClient(server.url, token=server.issue_token(), **kwargs) as lookup_client:
+            return await func(lookup_client)
+
+    return asyncio.run(run())
+
+
+def call_client_method(server, method, *args, **kwargs):
+    """Return result of client method called with args on a client connected to server."""
+    return run_with_client(server, lambda lookup_client: getattr(lookup_client, method)(*args, **kwargs))
+
+
+@pytest.fixture
+def stand_in_dtool_config(stand_in_server, tmp_path, monkeypatch):
+    """Provide dtool config pointing to local stand-in server and temporary config file."""
+    import dtool_lookup_api.core.config
+    monkeypatch.setattr(dtoolcore.utils, "DEFAULT_CONFIG_PATH", str(tmp_path / "dtool.json"))
+    monkeypatch.setattr(dtool_lookup_api.core.config, "CONFIG_PATH", str(tmp_path / "dtool.json"))
+
+    dtool_config = {
+        "DSERVER_URL": stand_in_server.url,
+        "DSERVER_TOKEN_GENERATOR_URL": stand_in_server.token_url,
+        "DSERVER_USERNAME": USERNAME,
+        "DSERVER_PASSWORD": PASSWORD,
+        "DSERVER_VERIFY_SSL": False,
+    }
+
+    with TemporaryOSEnviron(env=dtool_config):
+        yield dtool_config
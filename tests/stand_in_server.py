@@ -0,0 +1,423 @@
+# coding: utf-8
+#
+# stand_in_server.py
+#
+# Copyright (C) 2020 IMTEK Simulation
+# Author: Johannes Hoermann, johannes.hoermann@imtek.uni-freiburg.de
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Minimal in-process stand-in for dserver and its token generator."""
+
+import asyncio
+import base64
+import collections
+import json
+import threading
+import time
+import urllib.parse
+
+from aiohttp import web
+
+USERNAME = "test-user"
+PASSWORD = "test-password"
+
+TOKEN_LIFETIME = 3600
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def make_token(username=USERNAME, lifetime=TOKEN_LIFETIME, exp=True):
+    """Create an unsigned JWT-shaped token, optionally with exp claim."""
+    header = {"alg": "none", "typ": "JWT"}
+    payload = {"sub": username, "iat": int(time.time()), "jti": time.perf_counter_ns()}
+    if exp:
+        payload["exp"] = int(time.time() + lifetime)
+    return '.'.join([
+        _b64encode(json.dumps(header).encode()),
+        _b64encode(json.dumps(payload).encode()),
+        _b64encode(b'signature')])
+
+
+def make_dataset(base_uri, uuid, name=None, **kwargs):
+    """Create dataset record as returned by dserver."""
+    dataset = {
+        "base_uri": base_uri,
+        "uri": f"{base_uri}/{uuid}",
+        "uuid": uuid,
+        "name": name if name is not None else f"dataset-{uuid}",
+        "creator_username": USERNAME,
+        "created_at": 1604860720.736,
+        "frozen_at": 1604864525.691,
+        "type": "dataset",
+        "tags": [],
+        "number_of_items": 1,
+        "size_in_bytes": 17,
+    }
+    dataset.update(kwargs)
+    return dataset
+
+
+def _sort_key(sort):
+    """Translate dserver sort string into list of (field, reverse)."""
+    fields = []
+    for field in sort.split(','):
+        if field == '':
+            continue
+        if field.startswith('-'):
+            fields.append((field[1:], True))
+        else:
+            fields.append((field, False))
+    return fields
+
+
+def _sorted(records, sort):
+    records = list(records)
+    # stable sort, apply least significant field first
+    for field, reverse in reversed(_sort_key(sort)):
+        records.sort(key=lambda r: r.get(field), reverse=reverse)
+    return records
+
+
+class StandInServer:
+    """Serve a small, mutable in-memory dserver catalogue from a background thread.
+
+    Attributes
+    ----------
+    datasets : dict
+        uri -> dataset record
+    requests : collections.Counter
+        (method, first path component) -> number of requests served
+    latency : float
+        artificial latency in seconds added to every lookup request
+    max_in_flight : int
+        maximum number of lookup requests served concurrently
+    failing_pages : set of int
+        page numbers answered with an error by paginated routes
+    max_page_size : int or None
+        largest page size accepted and advertised in the configuration
+    transient_failures : collections.Counter
+        (method, first path component) -> number of next such requests
+        answered with 503 Service Unavailable
+    """
+
+    def __init__(self, datasets=(), token_lifetime=TOKEN_LIFETIME, exp_claim=True):
+        self.datasets = {d["uri"]: d for d in datasets}
+        self.users = {USERNAME: {"username": USERNAME, "is_admin": True}}
+        self.base_uris = {}
+        for dataset in self.datasets.values():
+            self.base_uris.setdefault(dataset["base_uri"], {
+                "base_uri": dataset["base_uri"],
+                "users_with_search_permissions": [USERNAME],
+                "users_with_register_permissions": [USERNAME]})
+        self.token_lifetime = token_lifetime
+        self.exp_claim = exp_claim
+        self.latency = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_pages = set()
+        self.max_page_size = None
+        self.transient_failures = collections.Counter()
+        self.valid_tokens = set()
+        self.requests = collections.Counter()
+        self.url = None
+        self.token_url = None
+
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+    # server lifecycle
+
+    def start(self, path=None):
+        """Serve on a random local TCP port or on unix socket at path."""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._start(path))
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    async def _start(self, path):
+        self._runner = web.AppRunner(self._make_app())
+        await self._runner.setup()
+        if path is None:
+            site = web.TCPSite(self._runner, '127.0.0.1', 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            self.url = f"http://127.0.0.1:{port}"
+        else:
+            site = web.UnixSite(self._runner, path)
+            await site.start()
+            self.url = "http://localhost"
+        self.token_url = f"{self.url}/token"
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def issue_token(self):
+        token = make_token(lifetime=self.token_lifetime, exp=self.exp_claim)
+        self.valid_tokens.add(token)
+        return token
+
+    # request handling
+
+    def _make_app(self):
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes([
+            web.post('/token', self._token),
+            web.get('/config/info', self._config_info),
+            web.get('/config/versions', self._config_versions),
+            web.post('/uris', self._post_uris),
+            web.get('/uris/{uri:.+}', self._get_uri),
+            web.put('/uris/{uri:.+}', self._put_uri),
+            web.delete('/uris/{uri:.+}', self._delete_uri),
+            web.get('/uuids/{uuid}', self._get_uuids),
+            web.get('/readmes/{uri:.+}', self._get_readme),
+            web.get('/manifests/{uri:.+}', self._get_manifest),
+            web.get('/tags/{uri:.+}', self._get_tags),
+            web.get('/annotations/{uri:.+}', self._get_annotations),
+            web.get('/me', self._get_me),
+            web.get('/users', self._get_users),
+            web.get('/users/{username}', self._get_user),
+            web.put('/users/{username}', self._put_user),
+            web.delete('/users/{username}', self._delete_user),
+            web.get('/base-uris', self._get_base_uris),
+            web.get('/base-uris/{base_uri:.+}', self._get_base_uri),
+            web.put('/base-uris/{base_uri:.+}', self._put_base_uri),
+            web.delete('/base-uris/{base_uri:.+}', self._delete_base_uri),
+            web.post('/mongo/query', self._post_mongo_query),
+        ])
+        return app
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        key = (request.method, request.path.split('/')[1])
+        self.requests[key] += 1
+        if request.path == '/token':
+            if self.transient_failures[key] > 0:
+                self.transient_failures[key] -= 1
+                return self._service_unavailable()
+            return await handler(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            authorization = request.headers.get('Authorization', '')
+            token = authorization[len('Bearer '):]
+            if token not in self.valid_tokens:
+                return web.json_response({"msg": "Invalid token"}, status=401)
+            if self.transient_failures[key] > 0:
+                self.transient_failures[key] -= 1
+                return self._service_unavailable()
+            return await handler(request)
+        finally:
+            self.in_flight -= 1
+
+    def _service_unavailable(self):
+        # error body as returned by flask-smorest, without 'msg'
+        return web.json_response({"code": 503, "status": "Service Unavailable"}, status=503)
+
+    def _paginate(self, request, records):
+        page = int(request.query.get('page', 1))
+        page_size = int(request.query.get('page_size', 10))
+        if self.max_page_size is not None and page_size > self.max_page_size:
+            return web.json_response({"msg": f"Page size {page_size} too large"}, status=422)
+        if page in self.failing_pages:
+            return web.json_response({"msg": f"Page {page} failed"}, status=500)
+        sort = request.query.get('sort', '')
+        records = _sorted(records, sort)
+        total = len(records)
+        total_pages = max((total + page_size - 1) // page_size, 1)
+        pagination = {"total": total, "total_pages": total_pages,
+                      "first_page": 1, "last_page": total_pages, "page": page}
+        if page < total_pages:
+            pagination["next_page"] = page + 1
+        if page > 1:
+            pagination["previous_page"] = page - 1
+        headers = {"X-Pagination": json.dumps(pagination),
+                   "X-Sort": json.dumps({"sort": {f: -1 if r else 1 for f, r in _sort_key(sort)}})}
+        start = (page - 1)*page_size
+        return web.json_response(records[start:start+page_size], headers=headers)
+
+    def _dataset(self, request):
+        uri = urllib.parse.unquote_plus(request.match_info['uri'])
+        if uri not in self.datasets:
+            raise web.HTTPNotFound()
+        return self.datasets[uri]
+
+    async def _token(self, request):
+        body = await request.json()
+        if body.get('username') != USERNAME or body.get('password') != PASSWORD:
+            return web.json_response({}, status=401)
+        return web.json_response({"token": self.issue_token()})
+
+    async def _config_info(self, request):
+        config = {"version": "stand-in"}
+        if self.max_page_size is not None:
+            config["max_page_size"] = self.max_page_size
+        return web.json_response({"config": config})
+
+    async def _config_versions(self, request):
+        return web.json_response({"versions": {"dserver": "stand-in"}})
+
+    async def _post_uris(self, request):
+        body = await request.json()
+        records = self.datasets.values()
+        if body.get('base_uris') is not None:
+            records = [r for r in records if r['base_uri'] in body['base_uris']]
+        if body.get('uuids') is not None:
+            records = [r for r in records if r['uuid'] in body['uuids']]
+        if body.get('creator_usernames') is not None:
+            records = [r for r in records if r['creator_username'] in body['creator_usernames']]
+        if body.get('free_text') is not None:
+            records = [r for r in records if body['free_text'] in r['name']]
+        return self._paginate(request, records)
+
+    async def _get_uri(self, request):
+        return web.json_response(self._dataset(request))
+
+    async def _put_uri(self, request):
+        body = await request.json()
+        status = 200 if body['uri'] in self.datasets else 201
+        self.datasets[body['uri']] = {k: v for k, v in body.items() if k not in ('readme', 'manifest')}
+        self.datasets[body['uri']]['_readme'] = body['readme']
+        self.datasets[body['uri']]['_manifest'] = body['manifest']
+        return web.json_response({}, status=status)
+
+    async def _delete_uri(self, request):
+        self.datasets.pop(self._dataset(request)['uri'])
+        return web.json_response({})
+
+    async def _get_uuids(self, request):
+        uuid = request.match_info['uuid']
+        return self._paginate(request, [r for r in self.datasets.values() if r['uuid'] == uuid])
+
+    async def _get_readme(self, request):
+        dataset = self._dataset(request)
+        return web.json_response({"readme": dataset.get('_readme', f"name: {dataset['name']}\n")})
+
+    async def _get_manifest(self, request):
+        dataset = self._dataset(request)
+        return web.json_response(dataset.get('_manifest', {
+            "dtoolcore_version": "3.17.0",
+            "hash_function": "md5sum_hexdigest",
+            "items": {}}))
+
+    async def _get_tags(self, request):
+        return web.json_response({"tags": self._dataset(request).get('tags', [])})
+
+    async def _get_annotations(self, request):
+        return web.json_response({"annotations": self._dataset(request).get('annotations', {})})
+
+    async def _get_me(self, request):
+        return web.json_response(self.users[USERNAME])
+
+    async def _get_users(self, request):
+        return self._paginate(request, self.users.values())
+
+    async def _get_user(self, request):
+        username = request.match_info['username']
+        if username not in self.users:
+            raise web.HTTPNotFound()
+        return web.json_response(self.users[username])
+
+    async def _put_user(self, request):
+        body = await request.json()
+        status = 200 if body['username'] in self.users else 201
+        self.users[body['username']] = body
+        return web.json_response({}, status=status)
+
+    async def _delete_user(self, request):
+        if self.users.pop(request.match_info['username'], None) is None:
+            raise web.HTTPNotFound()
+        return web.json_response({})
+
+    async def _get_base_uris(self, request):
+        return self._paginate(request, [{"base_uri": b} for b in self.base_uris])
+
+    async def _get_base_uri(self, request):
+        base_uri = urllib.parse.unquote_plus(request.match_info['base_uri'])
+        if base_uri not in self.base_uris:
+            raise web.HTTPNotFound()
+        return web.json_response(self.base_uris[base_uri])
+
+    async def _put_base_uri(self, request):
+        base_uri = urllib.parse.unquote_plus(request.match_info['base_uri'])
+        body = await request.json()
+        status = 200 if base_uri in self.base_uris else 201
+        self.base_uris[base_uri] = {"base_uri": base_uri, **body}
+        return web.json_response({}, status=status)
+
+    async def _delete_base_uri(self, request):
+        base_uri = urllib.parse.unquote_plus(request.match_info['base_uri'])
+        if self.base_uris.pop(base_uri, None) is None:
+            raise web.HTTPNotFound()
+        return web.json_response({})
+
+    async def _post_mongo_query(self, request):
+        body = await request.json()
+        records = [r for r in self.datasets.values() if _matches(r, body.get('query', {}))]
+        if body.get('base_uris') is not None:
+            records = [r for r in records if r['base_uri'] in body['base_uris']]
+        if body.get('uuids') is not None:
+            records = [r for r in records if r['uuid'] in body['uuids']]
+        if body.get('creator_usernames') is not None:
+            records = [r for r in records if r['creator_username'] in body['creator_usernames']]
+        return self._paginate(request, records)
+
+
+def _matches(record, query):
+    """Evaluate a small subset of the mongo query language."""
+    for key, condition in query.items():
+        if key == '$or':
+            if not any(_matches(record, q) for q in condition):
+                return False
+        elif key == '$and':
+            if not all(_matches(record, q) for q in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = record.get(key)
+            for operator, operand in condition.items():
+                if operator == '$gt' and not value > operand:
+                    return False
+                elif operator == '$lt' and not value < operand:
+                    return False
+                elif operator == '$in' and value not in operand:
+                    return False
+        elif record.get(key) != condition:
+            return False
+    return True
@@ -0,0 +1,52 @@
+"""Test adaptive page sizing of iterators."""
+
+from conftest import run_with_client
+
+
+def _iterate(server, method, *args, **kwargs):
+    async def iterate(lookup_client):
+        records = [record async for record in getattr(lookup_client, method)(*args, **kwargs)]
+        return records, lookup_client.statistics.as_dict()
+
+    return run_with_client(server, iterate)
+
+
+def test_adapt_page_size():
+    """Page size follows target latency and response size, at most doubling or halving."""
+    from dtool_lookup_api.core.LookupClient import (
+        _adapt_page_size, ADAPTIVE_TARGET_LATENCY, ADAPTIVE_TARGET_PAGE_BYTES)
+
+    # fast responses grow page size up to server maximum
+    assert _adapt_page_size(10, 10, ADAPTIVE_TARGET_LATENCY/10, None, 100) == 20
+    assert _adapt_page_size(80, 80, ADAPTIVE_TARGET_LATENCY/10, None, 100) == 100
+    # slow responses shrink page size
+    assert _adapt_page_size(100, 100, ADAPTIVE_TARGET_LATENCY*10, None, 100) == 50
+    # close to target, page size is kept
+    assert _adapt_page_size(100, 100, ADAPTIVE_TARGET_LATENCY*1.1, None, 100) == 100
+    # large records shrink page size despite fast responses
+    assert _adapt_page_size(100, 100, ADAPTIVE_TARGET_LATENCY/10, 4*ADAPTIVE_TARGET_PAGE_BYTES, 1000) == 50
+
+
+def test_adaptive_iteration_grows_within_server_maximum(stand_in_server):
+    """Fast responses grow the page size up to the advertised maximum, yielding every record once."""
+    stand_in_server.max_page_size = 8
+
+    records, statistics = _iterate(stand_in_server, "iter_datasets", page_size=2, prefetch=0, adaptive=True)
+
+    assert [r["uri"] for r in records] == sorted(stand_in_server.datasets)
+    page_sizes = statistics["page_sizes"]["get_datasets"]
+    assert max(page_sizes) == 8
+    assert page_sizes[2] == 1
+
+
+def test_adaptive_iteration_shrinks_for_large_records(stand_in_server, monkeypatch):
+    """Large responses shrink the page size, yielding every record once."""
+    import dtool_lookup_api.core.LookupClient
+    monkeypatch.setattr(dtool_lookup_api.core.LookupClient, "ADAPTIVE_TARGET_PAGE_BYTES", 1000)
+
+    records, statistics = _iterate(stand_in_server, "iter_datasets_by_mongo_query", {},
+                                   page_size=10, prefetch=1, adaptive=True)
+
+    assert [r["uri"] for r in records] == sorted(stand_in_server.datasets)
+    page_sizes = statistics["page_sizes"]["get_datasets_by_mongo_query"]
+    assert min(page_sizes) < 10
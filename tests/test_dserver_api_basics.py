@@ -4,3 +4,37 @@
 def test_version_is_string():
     import dtool_lookup_api
     assert isinstance(dtool_lookup_api.__version__, str)
+
+
+def _modules_after(statement):
+    """Return modules loaded after executing statement in a fresh interpreter."""
+    import json
+    import subprocess
+    import sys
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        f'import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))'])
+    return set(json.loads(output))
+
+
+def test_package_import_is_lazy():
+    """Importing the package does not pull in the network stack."""
+    modules = _modules_after('import dtool_lookup_api')
+    for heavy in ('dtool_lookup_api.synchronous', 'aiohttp', 'yaml', 'dtoolcore'):
+        assert heavy not in modules
+
+
+def test_synchronous_api_resolved_at_first_access():
+    """Public functions are still available from the package namespace."""
+    import dtool_lookup_api
+    import dtool_lookup_api.synchronous
+    assert dtool_lookup_api.get_datasets is dtool_lookup_api.synchronous.get_datasets
+    assert 'get_datasets' in dir(dtool_lookup_api)
+
+
+def test_config_constructed_at_first_access():
+    """Importing the API does not read the configuration yet."""
+    modules = _modules_after(
+        'import dtool_lookup_api.synchronous, dtool_lookup_api.core.config as c; '
+        'assert c._config is None; c.Config; assert c._config is not None')
+    assert 'dtool_lookup_api.core.config' in modules
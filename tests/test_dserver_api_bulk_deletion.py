@@ -0,0 +1,43 @@
+"""Test concurrent deletion of many datasets, users and base URIs."""
+
+from conftest import call_client_method
+
+
+def test_delete_datasets(stand_in_server):
+    """Outcome per URI in input order, bounded concurrency."""
+    stand_in_server.latency = 0.01
+    uris = [uri for uri in sorted(stand_in_server.datasets) if uri.startswith("s3://stand-in-bucket-1")]
+    missing_uri = "s3://stand-in-bucket-1/does-not-exist"
+
+    outcomes = call_client_method(stand_in_server, "delete_datasets", [missing_uri] + uris, concurrency=4)
+
+    assert list(outcomes) == [missing_uri] + uris
+    assert outcomes[missing_uri] is False
+    assert all(outcomes[uri] is True for uri in uris)
+    assert not any(uri.startswith("s3://stand-in-bucket-1") for uri in stand_in_server.datasets)
+    assert 1 < stand_in_server.max_in_flight <= 4
+
+
+def test_delete_datasets_retries_server_errors(stand_in_server, monkeypatch):
+    """Server errors are retried if requested."""
+    import dtool_lookup_api.core.LookupClient
+    monkeypatch.setattr(dtool_lookup_api.core.LookupClient, "BULK_RETRY_DELAY", 0.001)
+    uris = sorted(stand_in_server.datasets)[:3]
+
+    stand_in_server.transient_failures[("DELETE", "uris")] = 2
+    outcomes = call_client_method(stand_in_server, "delete_datasets", uris, concurrency=1)
+    assert list(outcomes.values()) == [False, False, True]
+
+    stand_in_server.transient_failures[("DELETE", "uris")] = 2
+    outcomes = call_client_method(stand_in_server, "delete_datasets", uris[:1], retries=2)
+    assert outcomes == {uris[0]: True}
+
+
+def test_delete_users_and_base_uris(stand_in_server):
+    stand_in_server.users["other-user"] = {"username": "other-user", "is_admin": False}
+
+    assert call_client_method(stand_in_server, "delete_users", ["other-user", "nobody"]) == {
+        "other-user": True, "nobody": False}
+    assert call_client_method(stand_in_server, "delete_base_uris", ["smb://stand-in-share"]) == {
+        "smb://stand-in-share": True}
+    assert "smb://stand-in-share" not in stand_in_server.base_uris
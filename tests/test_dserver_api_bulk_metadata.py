@@ -0,0 +1,58 @@
+"""Test concurrent metadata retrieval for many URIs."""
+
+import pytest
+
+from conftest import call_client_method, run_with_client
+
+
+def test_get_manifests_by_uris_in_input_order(stand_in_server):
+    """Results come in input order, failures are collected separately."""
+    stand_in_server.latency = 0.01
+    uris = sorted(stand_in_server.datasets, reverse=True)
+    missing_uri = "s3://stand-in-bucket-1/does-not-exist"
+    errors = {}
+
+    manifests = call_client_method(stand_in_server, "get_manifests_by_uris",
+                                   uris[:10] + [missing_uri] + uris[10:], concurrency=4, errors=errors)
+
+    assert list(manifests) == uris
+    assert all("items" in manifest for manifest in manifests.values())
+    assert list(errors) == [missing_uri]
+    assert 1 < stand_in_server.max_in_flight <= 4
+
+
+def test_get_tags_and_annotations_by_uris(stand_in_server):
+    uris = sorted(stand_in_server.datasets)[:3]
+    assert call_client_method(stand_in_server, "get_tags_by_uris", uris) == {uri: [] for uri in uris}
+    assert call_client_method(stand_in_server, "get_annotations_by_uris", uris) == {uri: {} for uri in uris}
+    readmes = call_client_method(stand_in_server, "get_readmes_by_uris", iter(uris))
+    assert list(readmes) == uris
+
+
+def test_iter_readmes_by_uris_consumes_input_lazily(stand_in_server):
+    """Input is pulled only as requests complete, results stream as completed."""
+    uris = sorted(stand_in_server.datasets)
+    pulled = []
+
+    def lazy_uris():
+        for uri in uris:
+            pulled.append(uri)
+            yield uri
+
+    async def first_result(lookup_client):
+        async for uri, readme in lookup_client.iter_readmes_by_uris(lazy_uris(), concurrency=3):
+            return uri, readme
+
+    uri, readme = run_with_client(stand_in_server, first_result)
+    assert uri in uris
+    assert readme.startswith("name:")
+    assert len(pulled) == 4
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_synchronous_bulk_metadata(stand_in_server):
+    from dtool_lookup_api import get_manifests_by_uris, iter_tags_by_uris
+
+    uris = sorted(stand_in_server.datasets)
+    assert list(get_manifests_by_uris(uris)) == uris
+    assert sorted(uri for uri, _ in iter_tags_by_uris(uris)) == uris
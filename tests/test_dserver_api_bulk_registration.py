@@ -0,0 +1,65 @@
+"""Test concurrent registration of many datasets."""
+
+import pytest
+
+from stand_in_server import make_dataset
+from conftest import call_client_method
+
+
+def _payload(base_uri, i):
+    dataset = make_dataset(base_uri, f"{i:08d}-1111-4000-8000-000000000000")
+    dataset.update(readme=f"name: {dataset['name']}\n", manifest={"items": {}}, annotations={})
+    return dataset
+
+
+def _register(server, datasets, **kwargs):
+    return call_client_method(server, "register_datasets", datasets, **kwargs)
+
+
+def test_register_datasets_bounded_and_lazy(stand_in_server):
+    """Input is pulled lazily with a bounded number of requests in flight."""
+    stand_in_server.latency = 0.01
+    base_uri = "s3://stand-in-bucket-new"
+    pulled = []
+
+    def payloads():
+        for i in range(40):
+            # never more datasets in memory than requests in flight
+            assert len(pulled) - stand_in_server.requests[("PUT", "uris")] <= 4
+            pulled.append(i)
+            yield _payload(base_uri, i)
+
+    report = _register(stand_in_server, payloads(), concurrency=4)
+
+    assert report["registered"] == 40
+    assert report["failed"] == 0
+    assert report["datasets_per_second"] > 0
+    assert [uri for uri, _ in report["results"]] == [_payload(base_uri, i)["uri"] for i in range(40)]
+    assert all(status == 201 for _, status in report["results"])
+    assert 1 < stand_in_server.max_in_flight <= 4
+    assert len([uri for uri in stand_in_server.datasets if uri.startswith(base_uri)]) == 40
+
+
+def test_register_datasets_reports_failures(stand_in_server):
+    """Failures are reported per item without aborting the batch."""
+    existing = _payload("s3://stand-in-bucket-1", 0)
+    stand_in_server.datasets[existing["uri"]] = existing
+    incomplete = _payload("s3://stand-in-bucket-1", 1)
+    del incomplete["manifest"]
+
+    report = _register(stand_in_server, [existing, incomplete, _payload("s3://stand-in-bucket-1", 2)])
+
+    assert report["registered"] == 2
+    assert report["failed"] == 1
+    (_, updated), (_, failed), (_, created) = report["results"]
+    assert updated == 200
+    assert isinstance(failed, TypeError)
+    assert created == 201
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_synchronous_register_datasets(stand_in_server):
+    from dtool_lookup_api import register_datasets
+
+    report = register_datasets(_payload("s3://stand-in-bucket-2", i) for i in range(5))
+    assert report["registered"] == 5
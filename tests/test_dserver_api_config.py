@@ -0,0 +1,73 @@
+"""Test cached configuration snapshot."""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    import dtool_lookup_api.core.config
+    config_path = str(tmp_path / "dtool.json")
+    monkeypatch.setattr(dtool_lookup_api.core.config, "CONFIG_PATH", config_path)
+    for key in dtool_lookup_api.core.config.CONFIG_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    return config_path
+
+
+def test_config_file_read_only_on_change(config_path, monkeypatch):
+    """Config file is parsed again only after it has been modified."""
+    import dtool_lookup_api.core.config
+    from dtool_lookup_api.core.config import Config
+
+    reads = []
+    read_config_file = dtool_lookup_api.core.config._read_config_file
+    monkeypatch.setattr(dtool_lookup_api.core.config, "_read_config_file",
+                        lambda path: reads.append(path) or read_config_file(path))
+
+    with open(config_path, 'w') as f:
+        json.dump({"DSERVER_URL": "http://first"}, f)
+
+    assert [Config.lookup_url for _ in range(5)] == ["http://first"]*5
+    assert len(reads) == 1
+
+    with open(config_path, 'w') as f:
+        json.dump({"DSERVER_URL": "http://second-url"}, f)
+
+    assert Config.lookup_url == "http://second-url"
+    assert len(reads) == 2
+
+
+def test_environment_overrides_config_file(config_path, monkeypatch):
+    """Changed environment variables take effect immediately."""
+    from dtool_lookup_api.core.config import Config
+
+    Config.lookup_url = "http://from-file"
+    assert Config.lookup_url == "http://from-file"
+
+    monkeypatch.setenv("DSERVER_URL", "http://from-env")
+    assert Config.lookup_url == "http://from-env"
+
+    monkeypatch.delenv("DSERVER_URL")
+    assert Config.lookup_url == "http://from-file"
+
+
+def test_setter_updates_snapshot(config_path):
+    """Values written are visible without reading the file again."""
+    from dtool_lookup_api.core.config import Config
+
+    Config.token = "some-token"
+    snapshot = Config.snapshot
+    assert snapshot.file_values["DSERVER_TOKEN"] == "some-token"
+    assert Config.snapshot is snapshot
+
+    with pytest.raises(TypeError):
+        snapshot.values["DSERVER_TOKEN"] = "other-token"
+
+
+def test_config_importable_from_lookup_client(config_path):
+    """Config remains importable from the LookupClient module."""
+    import dtool_lookup_api.core.config
+    from dtool_lookup_api.core.LookupClient import Config
+
+    assert Config is dtool_lookup_api.core.config.Config
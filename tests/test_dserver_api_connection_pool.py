@@ -0,0 +1,40 @@
+"""Test connection pool configuration."""
+
+import asyncio
+
+import pytest
+
+
+def test_connection_pool_options_applied(stand_in_server):
+    """Explicit connection pool options end up in the session's connector."""
+    from dtool_lookup_api.core.LookupClient import TokenBasedLookupClient
+
+    async def connector_of(**kwargs):
+        async with TokenBasedLookupClient(stand_in_server.url, token="token", **kwargs) as lookup_client:
+            return lookup_client.session.connector
+
+    connector = asyncio.run(connector_of(connection_limit=7, connection_limit_per_host=3, dns_cache_ttl=60))
+    assert connector.limit == 7
+    assert connector.limit_per_host == 3
+    assert not connector.force_close
+
+    connector = asyncio.run(connector_of(force_close=True))
+    assert connector.force_close
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_connection_pool_options_configured(monkeypatch):
+    """Connection pool options not given explicitly are read from the configuration."""
+    from dtool_lookup_api.core.LookupClient import ConfigurationBasedAuthenticatedLookupClient
+
+    monkeypatch.setenv("DSERVER_CONNECTION_LIMIT", "32")
+    monkeypatch.setenv("DSERVER_CONNECTION_LIMIT_PER_HOST", "16")
+    monkeypatch.setenv("DSERVER_KEEPALIVE_TIMEOUT", "60.5")
+    monkeypatch.setenv("DSERVER_FORCE_CLOSE", "false")
+
+    lookup_client = ConfigurationBasedAuthenticatedLookupClient(connection_limit_per_host=4)
+    assert lookup_client.connection_limit == 32
+    assert lookup_client.connection_limit_per_host == 4
+    assert lookup_client.keepalive_timeout == 60.5
+    assert lookup_client.dns_cache_ttl == 10
+    assert lookup_client.force_close is False
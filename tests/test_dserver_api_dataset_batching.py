@@ -0,0 +1,56 @@
+"""Test micro-batching of concurrent get_dataset calls."""
+
+import asyncio
+
+from stand_in_server import make_dataset
+from conftest import run_with_client
+
+
+def _get_datasets_concurrently(server, uris, batch_window=0.01):
+    async def get_all(lookup_client):
+        results = await asyncio.gather(*[lookup_client.get_dataset(uri) for uri in uris],
+                                       return_exceptions=True)
+        return results, lookup_client.statistics.as_dict()
+
+    return run_with_client(server, get_all, batch_window=batch_window)
+
+
+def test_concurrent_get_dataset_batched(stand_in_server):
+    """Concurrent calls share one list query, each caller receives its own record."""
+    uris = list(stand_in_server.datasets)
+
+    results, statistics = _get_datasets_concurrently(stand_in_server, uris + uris[:2])
+
+    assert [r["uri"] for r in results] == uris + uris[:2]
+    assert stand_in_server.requests[("POST", "uris")] == 1
+    assert stand_in_server.requests[("GET", "uris")] == 0
+    assert statistics["batch_queries"] == 1
+    assert statistics["batched_calls"] == len(uris) + 2
+
+
+def test_batched_get_dataset_falls_back_to_single_requests(stand_in_server):
+    """URIs without UUID and URIs not found are requested one by one."""
+    dataset = make_dataset("file:///stand-in/base", "ffffffff-0000-4000-8000-000000000000",
+                           uri="file:///stand-in/base/named-dataset")
+    stand_in_server.datasets[dataset["uri"]] = dataset
+    unknown_uri = "s3://stand-in-bucket/ffffffff-0000-4000-8000-000000000001"
+    uris = list(stand_in_server.datasets)[:2] + [dataset["uri"]]
+
+    results, statistics = _get_datasets_concurrently(stand_in_server, uris + [unknown_uri])
+
+    assert [r["uri"] for r in results[:3]] == uris
+    # same error as without batching
+    assert isinstance(results[3], Exception)
+    assert stand_in_server.requests[("POST", "uris")] == 1
+    assert stand_in_server.requests[("GET", "uris")] == 2
+    assert statistics["batched_calls"] == 2
+
+
+def test_get_dataset_not_batched_by_default(stand_in_server):
+    uris = list(stand_in_server.datasets)
+
+    results, statistics = _get_datasets_concurrently(stand_in_server, uris, batch_window=None)
+
+    assert [r["uri"] for r in results] == uris
+    assert stand_in_server.requests[("POST", "uris")] == 0
+    assert stand_in_server.requests[("GET", "uris")] == len(uris)
@@ -0,0 +1,55 @@
+"""Test concurrent retrieval of dataset bundles."""
+
+import pytest
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_get_dataset_bundle(stand_in_server):
+    """All parts are requested concurrently on one session."""
+    from dtool_lookup_api.synchronous import (
+        get_dataset_bundle, get_dataset, get_readme, get_manifest, get_tags, get_annotations)
+    stand_in_server.latency = 0.05
+    uri = next(iter(stand_in_server.datasets))
+
+    bundle = get_dataset_bundle(uri)
+
+    assert list(bundle) == ["dataset", "readme", "manifest", "tags", "annotations"]
+    assert stand_in_server.max_in_flight == 5
+    assert stand_in_server.requests[("POST", "token")] == 1
+    assert bundle == {
+        "dataset": get_dataset(uri),
+        "readme": get_readme(uri),
+        "manifest": get_manifest(uri),
+        "tags": get_tags(uri),
+        "annotations": get_annotations(uri),
+    }
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_get_dataset_bundle_parts(stand_in_server):
+    from dtool_lookup_api.synchronous import get_dataset_bundle
+    uri = next(iter(stand_in_server.datasets))
+
+    bundle = get_dataset_bundle(uri, parts=["manifest", "readme"])
+
+    assert list(bundle) == ["manifest", "readme"]
+    assert stand_in_server.requests[("GET", "uris")] == 0
+
+    with pytest.raises(ValueError):
+        get_dataset_bundle(uri, parts=["manifest", "size"])
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_get_dataset_bundle_errors(stand_in_server):
+    """Failed parts are collected if asked for, raised otherwise."""
+    from dtool_lookup_api.synchronous import get_dataset_bundle
+    unknown_uri = "s3://stand-in-bucket/ffffffff-0000-4000-8000-000000000001"
+
+    errors = {}
+    bundle = get_dataset_bundle(unknown_uri, parts=["readme", "tags"], errors=errors)
+
+    assert bundle == {}
+    assert list(errors) == ["readme", "tags"]
+
+    with pytest.raises(Exception):
+        get_dataset_bundle(unknown_uri)
@@ -0,0 +1,60 @@
+"""Test concurrent retrieval of all pages of paginated routes."""
+
+import pytest
+
+from conftest import call_client_method, run_with_client
+
+
+def _fetch_all(server, method, *args, **kwargs):
+    return call_client_method(server, method, *args, fetch_all=True, **kwargs)
+
+
+def test_fetch_all_datasets_in_sort_order(stand_in_server):
+    """All pages are reassembled in server sort order."""
+    stand_in_server.latency = 0.01
+    pagination = {}
+    records = _fetch_all(stand_in_server, "get_datasets", page_size=3,
+                         sort_fields=["uuid"], sort_order=[-1], pagination=pagination)
+
+    assert [r["uuid"] for r in records] == sorted((d["uuid"] for d in stand_in_server.datasets.values()),
+                                                  reverse=True)
+    assert pagination["total_pages"] == 9
+    assert stand_in_server.requests[("POST", "uris")] == 9
+
+
+def test_fetch_all_bounded_concurrency(stand_in_server, monkeypatch):
+    """Remaining pages are requested concurrently, but not more than allowed at a time."""
+    import dtool_lookup_api.core.LookupClient
+    monkeypatch.setattr(dtool_lookup_api.core.LookupClient, "FETCH_ALL_CONCURRENCY", 3)
+    stand_in_server.latency = 0.05
+
+    records = _fetch_all(stand_in_server, "get_datasets_by_mongo_query", {}, page_size=2)
+
+    assert len(records) == len(stand_in_server.datasets)
+    assert stand_in_server.max_in_flight == 3
+
+
+def test_fetch_all_fails_fast(stand_in_server):
+    """An error on any page fails the whole retrieval."""
+    from dtool_lookup_api.core.LookupClient import LookupServerError
+    stand_in_server.failing_pages.add(2)
+
+    with pytest.raises(LookupServerError, match="Page 2 failed"):
+        _fetch_all(stand_in_server, "get_datasets", page_size=2)
+
+
+def test_fetch_all_leaves_no_requests_behind(stand_in_server, monkeypatch):
+    """Outstanding page requests have finished when the error is raised."""
+    import asyncio
+    from dtool_lookup_api.core import LookupClient
+    from dtool_lookup_api.core.LookupClient import LookupServerError
+    monkeypatch.setattr(LookupClient, "FETCH_ALL_CONCURRENCY", 2)
+    stand_in_server.latency = 0.05
+    stand_in_server.failing_pages.add(2)
+
+    async def fetch(lookup_client):
+        with pytest.raises(LookupServerError):
+            await lookup_client.get_datasets(page_size=2, fetch_all=True)
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert run_with_client(stand_in_server, fetch) == []
@@ -0,0 +1,83 @@
+"""Test iteration over all pages of paginated routes."""
+
+import asyncio
+
+import pytest
+
+from conftest import run_with_client
+
+
+def _iterate(server, method, *args, consume=None, **kwargs):
+    async def iterate(lookup_client):
+        records = []
+        async for record in getattr(lookup_client, method)(*args, **kwargs):
+            records.append(record)
+            if consume is not None and await consume(records):
+                break
+        return records
+
+    return run_with_client(server, iterate)
+
+
+def test_iter_datasets_yields_all_pages_in_order(stand_in_server):
+    """All records are yielded once, in server sort order, without extra requests."""
+    records = _iterate(stand_in_server, "iter_datasets", page_size=4, prefetch=2)
+
+    assert [r["uri"] for r in records] == sorted(stand_in_server.datasets)
+    assert stand_in_server.requests[("POST", "uris")] == 7
+
+
+def test_iter_datasets_by_mongo_query(stand_in_server):
+    """Filter arguments are passed on to every page request."""
+    base_uri = "s3://stand-in-bucket-2"
+    records = _iterate(stand_in_server, "iter_datasets_by_mongo_query", {"base_uri": base_uri},
+                       sort_fields=["uuid"], page_size=2)
+
+    assert len(records) == 5
+    assert all(r["base_uri"] == base_uri for r in records)
+    assert [r["uuid"] for r in records] == sorted(r["uuid"] for r in records)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_datasets_prefetches_pages(stand_in_server, prefetch):
+    """While the first page is consumed, the following pages are requested already."""
+    stand_in_server.latency = 0.01
+    requested = []
+
+    async def consume(records):
+        await asyncio.sleep(0.1)
+        requested.append(stand_in_server.requests[("POST", "uris")])
+        return True
+
+    records = _iterate(stand_in_server, "iter_datasets", page_size=5, prefetch=prefetch, consume=consume)
+
+    assert len(records) == 1
+    assert requested == [1 + prefetch]
+
+
+def test_iter_datasets_fails_on_error(stand_in_server):
+    """A failing page request ends the iteration with that error."""
+    from dtool_lookup_api.core.LookupClient import LookupServerError
+
+    async def consume(records):
+        stand_in_server.valid_tokens.clear()
+        return False
+
+    with pytest.raises(LookupServerError):
+        _iterate(stand_in_server, "iter_datasets", page_size=5, prefetch=2, consume=consume)
+
+
+def test_iter_datasets_rejects_negative_prefetch(stand_in_server):
+    with pytest.raises(ValueError):
+        _iterate(stand_in_server, "iter_datasets", prefetch=-1)
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_asynchronous_iterator(stand_in_server):
+    """The asynchronous API exposes iterators as async generators."""
+    from dtool_lookup_api.asynchronous import iter_users
+
+    async def iterate():
+        return [user async for user in iter_users()]
+
+    assert [u["username"] for u in asyncio.run(iterate())] == ["test-user"]
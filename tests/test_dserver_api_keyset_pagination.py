@@ -0,0 +1,80 @@
+"""Test keyset pagination via direct mongo queries."""
+
+import pytest
+
+from stand_in_server import make_dataset
+from conftest import run_with_client
+
+
+def _iterate(server, method, *args, consume=None, **kwargs):
+    async def iterate(lookup_client):
+        records = []
+        async for record in getattr(lookup_client, method)(*args, **kwargs):
+            records.append(record)
+            if consume is not None:
+                consume(records)
+        return records
+
+    return run_with_client(server, iterate)
+
+
+def test_after_keyset():
+    """Range filter selects records sorted after the key, ties broken by following fields."""
+    from dtool_lookup_api.core.LookupClient import _after_keyset, _keyset_sort, DESCENDING
+
+    sort_fields, sort_order = _keyset_sort("frozen_at", DESCENDING)
+    assert sort_fields == ["frozen_at", "uri"]
+    assert sort_order == [DESCENDING, 1]
+
+    assert _after_keyset({"name": "a"}, sort_fields, sort_order, [2.0, "s3://b/1"]) == {
+        "$and": [{"name": "a"}, {"$or": [
+            {"frozen_at": {"$lt": 2.0}},
+            {"frozen_at": 2.0, "uri": {"$gt": "s3://b/1"}}]}]}
+
+
+def test_keyset_iteration_yields_all_in_order(stand_in_server):
+    """Keyset scan requests only first pages and yields all records in sort order."""
+    records = _iterate(stand_in_server, "iter_datasets", keyset=True, page_size=4,
+                       sort_fields=["frozen_at"], sort_order=[-1])
+
+    assert [r["uri"] for r in records] == sorted(stand_in_server.datasets)
+    assert stand_in_server.requests[("POST", "mongo")] == 7
+    assert stand_in_server.requests[("POST", "uris")] == 0
+
+
+def test_keyset_iteration_stable_under_registration(stand_in_server):
+    """Datasets registered before the current position do not shift the scan."""
+    original = sorted(stand_in_server.datasets)
+
+    def register_early_dataset(records):
+        if len(records) == 4:
+            dataset = make_dataset("s3://aaa-new-bucket", "00000000-0000-4000-8000-999999999999")
+            stand_in_server.datasets[dataset["uri"]] = dataset
+
+    records = _iterate(stand_in_server, "iter_datasets_by_mongo_query", {"type": "dataset"},
+                       keyset=True, page_size=4, consume=register_early_dataset)
+
+    assert [r["uri"] for r in records] == original
+
+
+def test_keyset_iteration_rejects_free_text(stand_in_server):
+    with pytest.raises(ValueError):
+        _iterate(stand_in_server, "iter_datasets", free_text="dataset", keyset=True)
+
+
+def test_keyset_iteration_refuses_date_strings(stand_in_server):
+    """Dates returned as strings do not compare with stored dates, hence cannot serve as keys."""
+    from dtool_lookup_api.core.LookupClient import LookupServerError
+
+    for i, dataset in enumerate(sorted(stand_in_server.datasets.values(), key=lambda d: d["uri"])):
+        dataset["frozen_at"] = f"Wed, 11 Nov 2020 17:20:{i:02d} GMT"
+
+    with pytest.raises(LookupServerError, match="frozen_at"):
+        _iterate(stand_in_server, "iter_datasets", keyset=True, page_size=4,
+                 sort_fields=["frozen_at"])
+    assert stand_in_server.requests[("POST", "mongo")] == 1
+
+    # a single page needs no key
+    records = _iterate(stand_in_server, "iter_datasets", keyset=True, page_size=100,
+                       sort_fields=["frozen_at"])
+    assert len(records) == len(stand_in_server.datasets)
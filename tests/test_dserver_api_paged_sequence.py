@@ -0,0 +1,112 @@
+"""Test lazy random-access results backed by a page cache."""
+
+import asyncio
+
+import pytest
+
+from conftest import run_with_client
+
+
+def test_paged_sequence_indexing_and_lru_cache():
+    """Only pages covering requested indices are fetched and at most max_cached_pages kept."""
+    from dtool_lookup_api.core.PagedSequence import PagedSequence
+
+    data = list(range(95))
+    requested = []
+
+    async def fetch_page(page_number):
+        requested.append(page_number)
+        return data[(page_number - 1)*10:page_number*10]
+
+    sequence = PagedSequence(fetch_page, 10, len(data), first_page=data[:10],
+                             max_cached_pages=2, runner=asyncio.run)
+
+    assert len(sequence) == 95
+    assert sequence[3] == 3
+    assert requested == []
+    assert sequence[-1] == 94
+    assert sequence[38:52:3] == data[38:52:3]
+    assert requested == [10, 4, 5, 6]
+    assert sequence[55] == 55
+    assert requested == [10, 4, 5, 6]
+    assert sequence[3] == 3
+    assert requested == [10, 4, 5, 6, 1]
+    assert sequence[100:] == []
+    with pytest.raises(IndexError):
+        sequence[95]
+    assert list(sequence) == data
+
+
+def test_paged_sequence_requires_await_without_runner():
+    """Within asynchronous code, uncached pages must be awaited."""
+    from dtool_lookup_api.core.PagedSequence import PagedSequence
+
+    async def fetch_page(page_number):
+        return [page_number]*10
+
+    async def access():
+        sequence = PagedSequence(fetch_page, 10, 100)
+        with pytest.raises(RuntimeError):
+            sequence[50]
+        assert await sequence.fetch(50) == 6
+        return sequence[50]
+
+    assert asyncio.run(access()) == 6
+
+
+def test_lazy_get_datasets(stand_in_server):
+    """Lazy results request the first page only until other indices are accessed."""
+    async def access(lookup_client):
+        pagination = {}
+        datasets = await lookup_client.get_datasets_by_mongo_query(
+            {}, page_size=4, lazy=True, pagination=pagination)
+        assert pagination["total"] == 25
+        assert stand_in_server.requests[("POST", "mongo")] == 1
+        return len(datasets), await datasets.fetch(slice(10, 14))
+
+    length, records = run_with_client(stand_in_server, access)
+    assert length == 25
+    assert [r["uri"] for r in records] == sorted(stand_in_server.datasets)[10:14]
+    assert stand_in_server.requests[("POST", "mongo")] == 3
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_synchronous_lazy_get_datasets(stand_in_server):
+    """Synchronous lazy results request further pages transparently."""
+    from dtool_lookup_api import get_datasets
+
+    datasets = get_datasets(page_size=5, lazy=True)
+
+    assert len(datasets) == 25
+    assert datasets[-1]["uri"] == sorted(stand_in_server.datasets)[-1]
+    assert [d["uri"] for d in datasets[7:12]] == sorted(stand_in_server.datasets)[7:12]
+    assert stand_in_server.requests[("POST", "uris")] == 4
+
+
+def test_paged_sequence_bounded_concurrency():
+    """A large slice does not request all missing pages at once."""
+    from dtool_lookup_api.core.PagedSequence import PagedSequence
+
+    in_flight = []
+
+    async def fetch_page(page_number):
+        in_flight.append(in_flight[-1] + 1 if in_flight else 1)
+        await asyncio.sleep(0.01)
+        in_flight.append(in_flight[-1] - 1)
+        return [page_number]*10
+
+    async def access():
+        sequence = PagedSequence(fetch_page, 10, 200, concurrency=3)
+        return await sequence.fetch(slice(0, 200))
+
+    assert len(asyncio.run(access())) == 200
+    assert max(in_flight) == 3
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_asynchronous_api_refuses_lazy():
+    """Asynchronous functions close their client, hence cannot return lazy sequences."""
+    from dtool_lookup_api.asynchronous import get_datasets
+
+    with pytest.raises(ValueError, match="lazy"):
+        asyncio.run(get_datasets(lazy=True))
@@ -0,0 +1,49 @@
+"""Test single-flight coalescing of identical GET requests."""
+
+import asyncio
+
+from conftest import run_with_client
+
+
+def _get_concurrently(server, method, uris, **kwargs):
+    async def get_all(lookup_client):
+        results = await asyncio.gather(*[getattr(lookup_client, method)(uri) for uri in uris])
+        return results, lookup_client.statistics.as_dict()
+
+    return run_with_client(server, get_all, **kwargs)
+
+
+def test_identical_requests_coalesced(stand_in_server):
+    """Concurrent identical GETs share one request and one decoded response."""
+    stand_in_server.latency = 0.05
+    uri, other_uri = list(stand_in_server.datasets)[:2]
+
+    results, statistics = _get_concurrently(stand_in_server, "get_manifest", [uri]*10 + [other_uri])
+
+    assert all(result is results[0] for result in results[:10])
+    assert results[10] is not results[0]
+    assert stand_in_server.requests[("GET", "manifests")] == 2
+    assert statistics["coalesced_requests"] == 9
+
+
+def test_sequential_requests_not_coalesced(stand_in_server):
+    uri = next(iter(stand_in_server.datasets))
+
+    async def get_twice(lookup_client):
+        await lookup_client.get_readme(uri)
+        await lookup_client.get_readme(uri)
+        return lookup_client._requests_in_flight
+
+    assert run_with_client(stand_in_server, get_twice) == {}
+    assert stand_in_server.requests[("GET", "readmes")] == 2
+
+
+def test_coalescing_disabled(stand_in_server):
+    stand_in_server.latency = 0.05
+    uri = next(iter(stand_in_server.datasets))
+
+    _, statistics = _get_concurrently(stand_in_server, "get_manifest", [uri]*5,
+                                      coalesce_requests=False)
+
+    assert stand_in_server.requests[("GET", "manifests")] == 5
+    assert statistics["coalesced_requests"] == 0
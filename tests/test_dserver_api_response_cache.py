@@ -0,0 +1,150 @@
+"""Test in-memory response cache for metadata routes."""
+
+import asyncio
+
+import pytest
+
+from conftest import run_with_client
+
+
+def test_response_cache_ttl_and_lru():
+    """Entries expire after their time to live and are evicted by size."""
+    from dtool_lookup_api.core.ResponseCache import ResponseCache
+
+    now = [0]
+    cache = ResponseCache(max_bytes=100, clock=lambda: now[0])
+    cache.put("a", "A", size=40, ttl=10)
+    cache.put("b", "B", size=40, ttl=20)
+    assert cache.get("a") == "A"
+
+    # "b" least recently used
+    cache.put("c", "C", size=40, ttl=20)
+    assert "b" not in cache
+    assert cache.nbytes == 80
+    assert cache.evictions == 1
+
+    now[0] = 15
+    assert cache.get("a") is None
+    assert cache.get("c") == "C"
+
+    cache.put("d", "D", size=101, ttl=20)
+    assert "d" not in cache
+    assert cache.as_dict() == {"entries": 1, "nbytes": 40, "hits": 2, "misses": 1, "evictions": 1}
+
+
+def _run_with_cache(server, func, **kwargs):
+    return run_with_client(server, func, cache_size=2**20, **kwargs)
+
+
+def test_metadata_responses_cached(stand_in_server):
+    """Repeated metadata requests are answered from the cache unless asked otherwise."""
+    uri = next(iter(stand_in_server.datasets))
+
+    async def get_repeatedly(lookup_client):
+        manifests = [await lookup_client.get_manifest(uri) for _ in range(3)]
+        await lookup_client.get_manifest(uri, cache=False)
+        await lookup_client.get_config()
+        await lookup_client.get_config()
+        await lookup_client.get_dataset(uri)
+        await lookup_client.get_dataset(uri)
+        return manifests, lookup_client.response_cache.as_dict()
+
+    manifests, statistics = _run_with_cache(stand_in_server, get_repeatedly)
+
+    assert manifests[0] == manifests[2]
+    assert stand_in_server.requests[("GET", "manifests")] == 2
+    assert stand_in_server.requests[("GET", "config")] == 1
+    assert stand_in_server.requests[("GET", "uris")] == 2
+    assert statistics["hits"] == 3
+    assert statistics["entries"] == 2
+
+
+def test_cache_keyed_by_credentials(stand_in_server):
+    """Clients sharing a cache do not see each other's responses if their tokens differ."""
+    uri = next(iter(stand_in_server.datasets))
+
+    async def get_with_two_tokens(lookup_client):
+        await lookup_client.get_tags(uri)
+        await lookup_client.get_tags(uri)
+        lookup_client.token = stand_in_server.issue_token()
+        await lookup_client.get_tags(uri)
+
+    _run_with_cache(stand_in_server, get_with_two_tokens)
+    assert stand_in_server.requests[("GET", "tags")] == 2
+
+
+def test_cache_invalidated_by_registration(stand_in_server):
+    """Registering a dataset drops cached responses on its metadata."""
+    uri = next(iter(stand_in_server.datasets))
+    dataset = {k: v for k, v in stand_in_server.datasets[uri].items() if not k.startswith('_')}
+
+    async def reregister(lookup_client):
+        readme_before = await lookup_client.get_readme(uri)
+        await lookup_client.register_dataset(
+            readme="name: renamed\n", manifest={"items": {}}, annotations={}, **dataset)
+        return readme_before, await lookup_client.get_readme(uri)
+
+    readme_before, readme_after = _run_with_cache(stand_in_server, reregister, cache_ttls={"readmes": 3600})
+    assert readme_before != readme_after == "name: renamed\n"
+    assert stand_in_server.requests[("GET", "readmes")] == 2
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_cache_size_configured(monkeypatch):
+    from dtool_lookup_api.core.LookupClient import ConfigurationBasedAuthenticatedLookupClient
+
+    assert ConfigurationBasedAuthenticatedLookupClient().response_cache is None
+
+    monkeypatch.setenv("DSERVER_CACHE_SIZE", "1000000")
+    lookup_client = ConfigurationBasedAuthenticatedLookupClient()
+    assert lookup_client.response_cache.max_bytes == 1000000
+
+
+def test_errors_not_cached(stand_in_server):
+    """A transient error response is not served from the cache afterwards."""
+    uri = next(iter(stand_in_server.datasets))
+    stand_in_server.transient_failures[("GET", "manifests")] = 1
+
+    async def get_twice(lookup_client):
+        error = await lookup_client.get_manifest(uri)
+        return error, await lookup_client.get_manifest(uri), len(lookup_client.response_cache)
+
+    error, manifest, entries = _run_with_cache(stand_in_server, get_twice)
+    assert error["code"] == 503
+    assert "items" in manifest
+    assert entries == 1
+    assert stand_in_server.requests[("GET", "manifests")] == 2
+
+
+def test_cached_responses_copied(stand_in_server):
+    """Callers modifying a response do not modify the cached one."""
+    uri = next(iter(stand_in_server.datasets))
+
+    async def modify(lookup_client):
+        first = await lookup_client.get_manifest(uri)
+        expected = dict(first)
+        first["items"] = None
+        second = await lookup_client.get_manifest(uri)
+        second["items"] = None
+        return expected, await lookup_client.get_manifest(uri)
+
+    expected, third = _run_with_cache(stand_in_server, modify)
+    assert third == expected
+    assert stand_in_server.requests[("GET", "manifests")] == 1
+
+
+def test_cache_invalidated_after_concurrent_registration(stand_in_server):
+    """A cached GET completing while the dataset is updated does not keep the old state."""
+    stand_in_server.latency = 0.05
+    uri = next(iter(stand_in_server.datasets))
+    dataset = {k: v for k, v in stand_in_server.datasets[uri].items() if not k.startswith('_')}
+
+    async def reregister(lookup_client):
+        stale_readme = asyncio.ensure_future(lookup_client.get_readme(uri))
+        await asyncio.sleep(0.01)
+        await lookup_client.register_dataset(
+            readme="name: renamed\n", manifest={"items": {}}, annotations={}, **dataset)
+        return await stale_readme, await lookup_client.get_readme(uri)
+
+    stale_readme, readme = _run_with_cache(stand_in_server, reregister)
+    assert stale_readme != readme == "name: renamed\n"
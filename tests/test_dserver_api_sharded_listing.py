@@ -0,0 +1,54 @@
+"""Test concurrent listing per base URI with sorted merge."""
+
+import pytest
+
+from conftest import run_with_client
+
+
+def _iterate(server, method, *args, **kwargs):
+    async def iterate(lookup_client):
+        return [record async for record in getattr(lookup_client, method)(*args, **kwargs)]
+
+    return run_with_client(server, iterate)
+
+
+@pytest.mark.parametrize("sort_fields,sort_order", [
+    (["uri"], [1]),
+    (["uuid"], [-1]),
+    (["frozen_at", "name"], [-1, 1]),
+])
+def test_sharded_listing_globally_sorted(stand_in_server, sort_fields, sort_order):
+    """Merged stream contains every dataset once in global sort order."""
+    from stand_in_server import _sorted
+    sort = ','.join(('-' if o == -1 else '') + f for f, o in zip(sort_fields, sort_order))
+
+    records = _iterate(stand_in_server, "iter_datasets_sharded", page_size=3,
+                       sort_fields=sort_fields, sort_order=sort_order)
+
+    assert [r["uri"] for r in records] == [r["uri"] for r in _sorted(stand_in_server.datasets.values(), sort)]
+    assert stand_in_server.requests[("GET", "base-uris")] == 1
+
+
+def test_sharded_listing_concurrent(stand_in_server):
+    """Streams of all base URIs are requested concurrently."""
+    stand_in_server.latency = 0.05
+
+    records = _iterate(stand_in_server, "iter_datasets_sharded", page_size=100,
+                       base_uris=["s3://stand-in-bucket-1", "smb://stand-in-share"])
+
+    assert len(records) == 20
+    assert stand_in_server.max_in_flight == 2
+    assert stand_in_server.requests[("GET", "base-uris")] == 0
+
+
+def test_sort_key():
+    """Missing values sort first, descending order reverses comparison."""
+    from dtool_lookup_api.core.LookupClient import _SortKey
+
+    def key(record, order):
+        return _SortKey(record, ["a", "b"], order)
+
+    assert key({"a": 1, "b": 2}, [1, 1]) < key({"a": 1, "b": 3}, [1, 1])
+    assert key({"a": 1, "b": 3}, [1, -1]) < key({"a": 1, "b": 2}, [1, -1])
+    assert key({"b": 3}, [1, 1]) < key({"a": 0}, [1, 1])
+    assert not key({"a": 1, "b": 2}, [1, 1]) < key({"a": 1, "b": 2}, [1, 1])
@@ -0,0 +1,18 @@
+"""Test SSL context handling."""
+
+import ssl
+
+
+def test_ssl_context_shared_among_clients():
+    """Clients with same verification setting share one SSL context."""
+    from dtool_lookup_api.core.LookupClient import UnauthenticatedLookupClient, TokenBasedLookupClient
+
+    verifying_client = UnauthenticatedLookupClient("https://one.example.com")
+    other_verifying_client = TokenBasedLookupClient("https://two.example.com", token="token")
+    assert verifying_client.ssl_context is other_verifying_client.ssl_context
+    assert verifying_client.ssl_context.verify_mode == ssl.CERT_REQUIRED
+
+    non_verifying_client = UnauthenticatedLookupClient("https://one.example.com", verify_ssl=False)
+    assert non_verifying_client.ssl_context is not verifying_client.ssl_context
+    assert non_verifying_client.ssl_context.verify_mode == ssl.CERT_NONE
+    assert not non_verifying_client.ssl_context.check_hostname
@@ -0,0 +1,32 @@
+"""Test synchronous generators over all pages of paginated routes."""
+
+import time
+
+import pytest
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_synchronous_iter_datasets(stand_in_server):
+    """Synchronous generator yields all records in server sort order."""
+    from dtool_lookup_api import iter_datasets
+
+    records = list(iter_datasets(page_size=4))
+
+    assert [r["uri"] for r in records] == sorted(stand_in_server.datasets)
+    assert stand_in_server.requests[("POST", "uris")] == 7
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_synchronous_iter_datasets_bounded_buffering(stand_in_server):
+    """Consuming slowly requests only the current and prefetched pages."""
+    from dtool_lookup_api.synchronous import iter_datasets, get_config
+
+    stand_in_server.latency = 0.01
+    records = iter_datasets(page_size=5, prefetch=1)
+    assert next(records) is not None
+    time.sleep(0.2)
+    assert stand_in_server.requests[("POST", "uris")] == 2
+
+    # abandoning the generator early leaves the persistent client usable
+    records.close()
+    assert get_config() is not None
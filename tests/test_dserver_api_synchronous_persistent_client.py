@@ -0,0 +1,59 @@
+"""Test persistent client reuse within synchronous lookup api."""
+
+import pytest
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_persistent_client_reused(stand_in_server):
+    """Many calls authenticate only once and share one session."""
+    from dtool_lookup_api.synchronous import get_dataset, get_manifest, _clients
+
+    uri = next(iter(stand_in_server.datasets))
+    for _ in range(10):
+        assert get_dataset(uri)["uri"] == uri
+        assert get_manifest(uri) is not None
+
+    assert stand_in_server.requests[("POST", "token")] == 1
+    assert stand_in_server.requests[("GET", "uris")] == 10
+    assert len([c for c in _clients.values() if c.lookup_url == stand_in_server.url]) == 1
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_persistent_client_recreated_after_close(stand_in_server):
+    """Closing the session transparently creates a new client at next call."""
+    from dtool_lookup_api.synchronous import get_config, close
+
+    assert get_config() is not None
+    close()
+    assert get_config() is not None
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_persistent_client_shared_across_threads(stand_in_server):
+    """Concurrent calls from many threads share one client and one token."""
+    import concurrent.futures
+    from dtool_lookup_api.synchronous import get_dataset
+
+    uris = list(stand_in_server.datasets)
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        responses = list(executor.map(get_dataset, uris*4))
+
+    assert [r["uri"] for r in responses] == uris*4
+    assert stand_in_server.requests[("POST", "token")] == 1
+
+
+def test_event_loop_thread_refuses_to_block_on_itself():
+    """Blocking on the event loop from within its own thread would deadlock."""
+    import asyncio
+    from dtool_lookup_api.core.EventLoopThread import EventLoopThread
+
+    event_loop_thread = EventLoopThread()
+
+    async def nested():
+        return event_loop_thread.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        event_loop_thread.run(nested())
+
+    event_loop_thread.stop()
+    assert not event_loop_thread.is_running()
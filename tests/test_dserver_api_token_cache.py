@@ -0,0 +1,55 @@
+"""Test token caching in dtool config file shared across processes."""
+
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_config_written_only_on_change():
+    """Writing an unchanged value leaves the config file untouched."""
+    import dtool_lookup_api.core.config
+    from dtool_lookup_api.core.config import Config
+
+    Config.token = "first-token"
+    inode = os.stat(dtool_lookup_api.core.config.CONFIG_PATH).st_ino
+
+    Config.token = "first-token"
+    assert os.stat(dtool_lookup_api.core.config.CONFIG_PATH).st_ino == inode
+
+    Config.token = "second-token"
+    assert os.stat(dtool_lookup_api.core.config.CONFIG_PATH).st_ino != inode
+    assert Config.token == "second-token"
+    assert oct(os.stat(dtool_lookup_api.core.config.CONFIG_PATH).st_mode & 0o777) == oct(0o600)
+
+
+def _connect(queue):
+    from dtool_lookup_api.core.LookupClient import ConfigurationBasedAuthenticatedLookupClient
+
+    async def connect():
+        async with ConfigurationBasedAuthenticatedLookupClient() as lookup_client:
+            await lookup_client.get_config()
+            return lookup_client.token
+
+    queue.put(asyncio.run(connect()))
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires fork")
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_token_acquisition_single_flight_across_processes(stand_in_server):
+    """Processes starting at once authenticate only once and share the token."""
+    from dtool_lookup_api.core.config import Config
+
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    processes = [context.Process(target=_connect, args=(queue,)) for _ in range(8)]
+    for process in processes:
+        process.start()
+    tokens = [queue.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join()
+
+    assert stand_in_server.requests[("POST", "token")] == 1
+    assert set(tokens) == {Config.token}
@@ -0,0 +1,129 @@
+"""Test transparent token renewal."""
+
+import asyncio
+
+import pytest
+
+from stand_in_server import USERNAME, PASSWORD
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_rejected_token_renewed_and_request_replayed(stand_in_server):
+    """A token revoked by the server is renewed transparently."""
+    from dtool_lookup_api.synchronous import get_dataset
+
+    uri = next(iter(stand_in_server.datasets))
+    assert get_dataset(uri)["uri"] == uri
+
+    stand_in_server.valid_tokens.clear()
+    assert get_dataset(uri)["uri"] == uri
+    assert stand_in_server.requests[("POST", "token")] == 2
+
+
+def test_concurrent_callers_share_one_authentication(stand_in_server):
+    """Many requests rejected at once trigger only a single token request."""
+    from dtool_lookup_api.core.LookupClient import CredentialsBasedLookupClient
+
+    uris = list(stand_in_server.datasets)
+
+    async def fetch():
+        async with CredentialsBasedLookupClient(
+                stand_in_server.url, stand_in_server.token_url, USERNAME, PASSWORD,
+                verify_ssl=False) as lookup_client:
+            stand_in_server.valid_tokens.clear()
+            return await asyncio.gather(*[lookup_client.get_dataset(uri) for uri in uris])
+
+    responses = asyncio.run(fetch())
+    assert [r["uri"] for r in responses] == uris
+    assert stand_in_server.requests[("POST", "token")] == 2
+
+
+async def _until(condition, timeout=5):
+    """Wait until condition() is true, polling the event loop."""
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.fixture
+def immediate_token_renewal(stand_in_server, monkeypatch):
+    """Tokens are due for renewal right when issued, renewals retried within milliseconds."""
+    from dtool_lookup_api.core import LookupClient
+    monkeypatch.setattr(LookupClient, "TOKEN_REFRESH_MIN_INTERVAL", 0.01)
+    monkeypatch.setattr(LookupClient, "TOKEN_REFRESH_MAX_RETRY_INTERVAL", 0.02)
+    stand_in_server.token_lifetime = 0
+
+
+@pytest.mark.usefixtures("immediate_token_renewal")
+def test_token_renewed_in_background(stand_in_server):
+    """Tokens are renewed before they expire."""
+    from dtool_lookup_api.core.LookupClient import CredentialsBasedLookupClient
+
+    uri = next(iter(stand_in_server.datasets))
+
+    async def fetch():
+        async with CredentialsBasedLookupClient(
+                stand_in_server.url, stand_in_server.token_url, USERNAME, PASSWORD,
+                verify_ssl=False, auto_refresh_token=True) as lookup_client:
+            first_token = lookup_client.token
+            await _until(lambda: lookup_client.token != first_token)
+            return await lookup_client.get_dataset(uri)
+
+    assert asyncio.run(fetch())["uri"] == uri
+    assert stand_in_server.requests[("POST", "token")] >= 2
+
+
+@pytest.mark.usefixtures("immediate_token_renewal")
+def test_failed_background_renewal_retried(stand_in_server):
+    """A refused renewal neither closes the session nor stops renewing."""
+    import gc
+    from dtool_lookup_api.core.LookupClient import CredentialsBasedLookupClient
+
+    stand_in_server.latency = 0.05
+    uri = next(iter(stand_in_server.datasets))
+    unhandled = []
+
+    async def fetch():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        async with CredentialsBasedLookupClient(
+                stand_in_server.url, stand_in_server.token_url, USERNAME, PASSWORD,
+                verify_ssl=False, auto_refresh_token=True) as lookup_client:
+            first_token = lookup_client.token
+            stand_in_server.transient_failures[("POST", "token")] = 2
+            # in flight while the first renewals fail
+            during_failure = asyncio.ensure_future(lookup_client.get_dataset(uri))
+            await _until(lambda: stand_in_server.transient_failures[("POST", "token")] == 0)
+            await _until(lambda: lookup_client.token != first_token)
+            assert not lookup_client.session.closed
+            assert not lookup_client._token_refresh_task.done()
+            result = await during_failure, await lookup_client.get_dataset(uri)
+        gc.collect()
+        return result
+
+    during_failure, after_renewal = asyncio.run(fetch())
+    assert during_failure["uri"] == after_renewal["uri"] == uri
+    # initial token, two failed and at least one successful renewal
+    assert stand_in_server.requests[("POST", "token")] >= 4
+    assert unhandled == []
+
+
+def test_failed_reauthentication_keeps_session(stand_in_server):
+    """If renewing a rejected token fails, callers see the error, but the client remains usable."""
+    from dtool_lookup_api.core.LookupClient import CredentialsBasedLookupClient
+
+    uri = next(iter(stand_in_server.datasets))
+
+    async def fetch():
+        async with CredentialsBasedLookupClient(
+                stand_in_server.url, stand_in_server.token_url, USERNAME, PASSWORD,
+                verify_ssl=False) as lookup_client:
+            stand_in_server.valid_tokens.clear()
+            stand_in_server.transient_failures[("POST", "token")] = 1
+            results = await asyncio.gather(*[lookup_client.get_dataset(uri) for _ in range(3)],
+                                           return_exceptions=True)
+            assert all(isinstance(result, RuntimeError) for result in results)
+            assert not lookup_client.session.closed
+            return await lookup_client.get_dataset(uri)
+
+    assert asyncio.run(fetch())["uri"] == uri
@@ -0,0 +1,68 @@
+"""Test local token validity checks."""
+
+import pytest
+
+from stand_in_server import StandInServer, make_token
+from conftest import STAND_IN_DATASETS
+
+
+def test_decode_jwt_claims():
+    """Expiry claim is read from token payload, non-JWTs yield None."""
+    from dtool_lookup_api.core.LookupClient import _decode_jwt_claims
+
+    claims = _decode_jwt_claims(make_token(lifetime=100))
+    assert claims["sub"] == "test-user"
+    assert "exp" in claims
+
+    assert "exp" not in _decode_jwt_claims(make_token(exp=False))
+    assert _decode_jwt_claims("not-a-jwt") is None
+    assert _decode_jwt_claims("a.b.c") is None
+    assert _decode_jwt_claims(None) is None
+
+
+@pytest.mark.usefixtures("stand_in_dtool_config")
+def test_token_with_expiry_claim_not_probed(stand_in_server):
+    """Calls do not probe /config/info as long as expiry claim is valid."""
+    from dtool_lookup_api.synchronous import get_dataset
+
+    uri = next(iter(stand_in_server.datasets))
+    for _ in range(5):
+        get_dataset(uri)
+
+    assert stand_in_server.requests[("GET", "config")] == 0
+
+
+def test_token_without_expiry_claim_probed_once():
+    """Tokens without expiry claim are probed once and then memoized."""
+    import asyncio
+    from dtool_lookup_api.core.LookupClient import TokenBasedLookupClient
+
+    with StandInServer(datasets=STAND_IN_DATASETS, exp_claim=False) as server:
+        token = server.issue_token()
+
+        async def check():
+            async with TokenBasedLookupClient(server.url, token=token) as lookup_client:
+                return [await lookup_client.has_valid_token() for _ in range(3)]
+
+        assert asyncio.run(check()) == [True]*3
+        assert server.requests[("GET", "config")] == 1
+
+
+def test_token_rejected_by_server_probed_again(stand_in_server):
+    """After a 401 response, the expiry claim is not trusted anymore."""
+    import asyncio
+    from dtool_lookup_api.core.LookupClient import TokenBasedLookupClient, LookupServerError
+
+    token = stand_in_server.issue_token()
+
+    async def check():
+        async with TokenBasedLookupClient(stand_in_server.url, token=token) as lookup_client:
+            valid_before = await lookup_client.has_valid_token()
+            stand_in_server.valid_tokens.clear()
+            with pytest.raises(LookupServerError):
+                await lookup_client.get_config()
+            valid_after = await lookup_client.has_valid_token()
+            return valid_before, valid_after
+
+    assert asyncio.run(check()) == (True, False)
+    assert stand_in_server.requests[("GET", "config")] == 2
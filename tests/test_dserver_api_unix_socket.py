@@ -0,0 +1,56 @@
+"""Test communication with dserver through a unix domain socket."""
+
+import asyncio
+
+import pytest
+
+from stand_in_server import StandInServer, USERNAME, PASSWORD
+from conftest import STAND_IN_DATASETS
+
+
+@pytest.fixture
+def unix_socket_server(tmp_path):
+    """Provide local stand-in for dserver listening on a unix socket only."""
+    path = str(tmp_path / "dserver.sock")
+    with StandInServer(datasets=STAND_IN_DATASETS).start(path=path) as server:
+        server.path = path
+        yield server
+
+
+def test_unix_socket_client(unix_socket_server):
+    """Requests and authentication go through the unix socket."""
+    import aiohttp
+    from dtool_lookup_api.core.LookupClient import CredentialsBasedLookupClient
+
+    uri = next(iter(unix_socket_server.datasets))
+
+    async def query():
+        async with CredentialsBasedLookupClient(
+                unix_socket_server.url, unix_socket_server.token_url, USERNAME, PASSWORD,
+                unix_socket=unix_socket_server.path) as lookup_client:
+            assert isinstance(lookup_client.session.connector, aiohttp.UnixConnector)
+            return await lookup_client.get_dataset(uri)
+
+    assert asyncio.run(query())["uri"] == uri
+    assert unix_socket_server.requests[("POST", "token")] == 1
+    assert unix_socket_server.requests[("GET", "uris")] == 1
+
+
+def test_unix_socket_configured(unix_socket_server, tmp_path, monkeypatch):
+    """Unix socket path is read from the configuration."""
+    import dtool_lookup_api.core.config
+    from dtool_lookup_api.core.LookupClient import ConfigurationBasedAuthenticatedLookupClient
+
+    monkeypatch.setattr(dtool_lookup_api.core.config, "CONFIG_PATH", str(tmp_path / "dtool.json"))
+    monkeypatch.setenv("DSERVER_URL", unix_socket_server.url)
+    monkeypatch.setenv("DSERVER_UNIX_SOCKET", unix_socket_server.path)
+    monkeypatch.setenv("DSERVER_TOKEN_GENERATOR_URL", unix_socket_server.token_url)
+    monkeypatch.setenv("DSERVER_USERNAME", USERNAME)
+    monkeypatch.setenv("DSERVER_PASSWORD", PASSWORD)
+
+    async def query():
+        async with ConfigurationBasedAuthenticatedLookupClient() as lookup_client:
+            assert lookup_client.unix_socket == unix_socket_server.path
+            return await lookup_client.get_datasets(page_size=5)
+
+    assert len(asyncio.run(query())) == 5
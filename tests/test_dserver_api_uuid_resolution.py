@@ -0,0 +1,38 @@
+"""Test batched resolution of many UUIDs."""
+
+import pytest
+
+from stand_in_server import make_dataset
+from conftest import call_client_method
+
+
+def _resolve(server, uuids, **kwargs):
+    return call_client_method(server, "get_datasets_by_uuids", uuids, **kwargs)
+
+
+def test_get_datasets_by_uuids_chunked(stand_in_server):
+    """UUIDs are resolved in chunked queries, including copies on several base URIs."""
+    stand_in_server.latency = 0.01
+    uuids = sorted({d["uuid"] for d in stand_in_server.datasets.values()}, reverse=True)
+    copy = make_dataset("s3://stand-in-bucket-copy", uuids[0])
+    stand_in_server.datasets[copy["uri"]] = copy
+    unknown_uuid = "ffffffff-0000-4000-8000-000000000000"
+
+    records = _resolve(stand_in_server, uuids + [unknown_uuid, uuids[1]], chunk_size=4, concurrency=3)
+
+    assert list(records) == uuids + [unknown_uuid]
+    assert records[unknown_uuid] == []
+    assert [r["uri"] for r in records[uuids[0]]] == sorted(
+        d["uri"] for d in stand_in_server.datasets.values() if d["uuid"] == uuids[0])
+    assert all(len(records[uuid]) == 1 for uuid in uuids[1:])
+    assert stand_in_server.requests[("POST", "uris")] == 7
+    assert 1 < stand_in_server.max_in_flight <= 3
+
+
+def test_get_datasets_by_uuids_fails_on_error(stand_in_server):
+    """A failing chunk query fails the whole resolution."""
+    from dtool_lookup_api.core.LookupClient import LookupServerError
+    stand_in_server.failing_pages.add(1)
+
+    with pytest.raises(LookupServerError, match="Page 1 failed"):
+        _resolve(stand_in_server, ["ffffffff-0000-4000-8000-000000000000"])